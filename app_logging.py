@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Logging for metaVoice
+Leveled logging with lazy %-style formatting: readable lines on the console and
+JSON lines in a rotating file, each tagged with the take it belongs to
+"""
+
+import contextvars
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Optional
+
+from app_paths import get_data_dir
+
+LOGGER_NAME = "metavoice"
+
+# Correlation ID of the take (one recording → transcription → delivery) being handled.
+# Threads do not inherit it: hand work over with in_current_take().
+current_take = contextvars.ContextVar("metavoice_take", default=None)
+_take_counter = itertools.count(1)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger for one component (e.g. "whisper" → "metavoice.whisper")"""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def start_take() -> str:
+    """
+    Begin a new take in the current context
+
+    Returns:
+        The take's correlation ID (time of day plus a counter, so IDs sort)
+    """
+    take_id = f"{time.strftime('%H%M%S')}-{next(_take_counter)}"
+    current_take.set(take_id)
+    return take_id
+
+
+def in_current_take(func: Callable) -> Callable:
+    """Wrap a callable so it runs in this context's take when called from another thread"""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+
+class TakeFilter(logging.Filter):
+    """Stamp each record with the current take ID"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.take = current_take.get()
+        return True
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """One JSON object per record; structured values go in extra={"fields": {...}}"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "take": getattr(record, "take", None),
+            "thread": record.threadName,
+            "msg": record.getMessage()
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: Optional[str] = None, path: Optional[str] = None,
+                      max_bytes: int = 2 * 1024 * 1024, backup_count: int = 3) -> logging.Logger:
+    """
+    Set up console and rotating JSON-lines file output (safe to call again)
+
+    Args:
+        level: Level name; defaults to $METAVOICE_LOG_LEVEL, then INFO. Records below
+               it are dropped before their message is formatted.
+        path: Log file (defaults to logs/metavoice.jsonl in the app data dir)
+        max_bytes: Size at which the file rotates
+        backup_count: Rotated files kept
+
+    Returns:
+        The top-level metaVoice logger
+    """
+    level = (level or os.environ.get("METAVOICE_LOG_LEVEL") or "INFO").upper()
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(console)
+
+    try:
+        path = path or os.path.join(get_data_dir("logs"), "metavoice.jsonl")
+        file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                           encoding="utf-8", delay=True)
+        file_handler.setFormatter(JSONLinesFormatter())
+        logger.addHandler(file_handler)
+    except OSError as e:
+        print(f"⚠️ Could not open log file: {e}")
+
+    for handler in logger.handlers:
+        handler.addFilter(TakeFilter())
+    return logger
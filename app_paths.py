@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Application Data Paths for metaVoice
+Where metaVoice keeps recordings, history and learned settings
+"""
+
+import os
+import sys
+
+
+def get_data_dir(*parts: str) -> str:
+    """
+    Get (and create) a metaVoice data directory
+
+    Args:
+        parts: Optional sub-directories (e.g. "meetings")
+
+    Returns:
+        Absolute path of the directory
+    """
+    override = os.environ.get("METAVOICE_DATA_DIR")
+    if override:
+        base = override
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support/metaVoice")
+    else:
+        base = os.path.expanduser("~/.metavoice")
+
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Shared Services for metaVoice
+The speech, automation, history, command and delivery services are built once
+per process and handed to every window, so opening the dashboard does not start
+a second helper process or worker pool, and learned data has a single writer
+"""
+
+from typing import Optional
+
+from command_dispatcher import CommandDispatcher
+from command_handlers import register_default_handlers
+from delivery_executor import DeliveryExecutor
+from meeting_recorder import MeetingRecorder
+from transcript_store import TranscriptStore
+
+
+class AppServices:
+    def __init__(self, whisper=None, automation=None,
+                 transcript_store: Optional[TranscriptStore] = None):
+        """
+        Build the services the windows share
+
+        Args:
+            whisper: WhisperWrapper (created by default)
+            automation: TextInputAutomation, which owns the readiness history and
+                        delivery profiles (created by default)
+            transcript_store: Transcription history (created by default)
+        """
+        if whisper is None:
+            from whisper_wrapper import WhisperWrapper
+            whisper = WhisperWrapper()
+        if automation is None:
+            from text_input_automation import TextInputAutomation
+            automation = TextInputAutomation()
+        self.whisper = whisper
+        self.automation = automation
+        self.transcript_store = transcript_store or TranscriptStore()
+
+        # Results go to the queue of the window that dispatched or submitted
+        self.command_dispatcher = CommandDispatcher()
+        self.meeting_recorder = MeetingRecorder(self.whisper)
+        register_default_handlers(self.command_dispatcher, self.meeting_recorder)
+        self.delivery_executor = DeliveryExecutor(self.automation)
+        self._closed = False
+
+    def shutdown(self):
+        """Stop the workers, finish a meeting in progress and close the automation helper (idempotent)"""
+        if self._closed:
+            return
+        self._closed = True
+        self.command_dispatcher.shutdown()
+        self.delivery_executor.shutdown()
+        if self.meeting_recorder.has_session:
+            self.meeting_recorder.stop()
+        self.automation.close()
+        self.transcript_store.close()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Application Shell for metaVoice
+One Tk root hosts the dashboard and the floating recorder as toplevels, so the
+process runs a single Tcl interpreter and a single event loop. Both windows
+use one set of services (see app_services.py). The dashboard is only built
+the first time it is opened.
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional
+
+import customtkinter as ctk
+
+from app_services import AppServices
+from floating_recorder import FloatingRecorder
+from metrics import MetricsServer, registry
+from startup_profile import profiler
+
+# Imported on a worker once the recorder is up, so the first recording does not pay for them
+WARM_UP_MODULES = ("pyaudio",)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class StartupReport:
+    """Cost of bringing up the windows"""
+    mode: str  # "shell" (one root) or "separate" (a root per window)
+    tk_roots: int
+    startup_ms: float
+    rss_mb: float
+    hotkey_ready_ms: Optional[float] = None  # None: global hotkeys could not be registered
+
+    def format_line(self) -> str:
+        hotkeys = f"{self.hotkey_ready_ms:.0f}ms" if self.hotkey_ready_ms is not None else "unavailable"
+        return (f"⏱️ {self.mode}: {self.tk_roots} Tk root(s), hotkeys ready in {hotkeys}, "
+                f"ready in {self.startup_ms:.0f}ms, peak RSS {self.rss_mb:.1f}MB")
+
+
+class LazyDashboard:
+    def __init__(self, factory: Callable[[], "MetaVoiceApp"]):
+        """
+        Stand in for the dashboard until it is first opened
+
+        Only the window and its UI state are deferred; the factory hands it the
+        shell's services, so the first show starts no helper process or workers.
+
+        Args:
+            factory: Builds the dashboard on the shared services (runs on the UI thread at first show)
+        """
+        self.factory = factory
+        self.instance = None
+
+    def get(self) -> "MetaVoiceApp":
+        """The dashboard, built on first use"""
+        if self.instance is None:
+            started = time.monotonic()
+            self.instance = self.factory()
+            print(f"📊 Dashboard created in {(time.monotonic() - started) * 1000:.0f}ms")
+        return self.instance
+
+    def show_window(self):
+        self.get().show_window()
+
+    def hide_window(self):
+        if self.instance is not None:
+            self.instance.hide_window()
+
+    def shutdown(self):
+        if self.instance is not None:
+            self.instance.shutdown()
+
+
+class AppShell:
+    def __init__(self):
+        """Create the shared root and services, then the dashboard and floating recorder on them"""
+        self.started = time.monotonic()
+        self.root = ctk.CTk()
+        self.root.withdraw()  # Hosts the windows; never shown itself
+        profiler.mark("shared Tk root")
+        self.services = AppServices()
+        profiler.mark("shared services")
+
+        # The floating recorder starts hidden and shows during recording; the
+        # dashboard is not built until a hotkey or the settings button opens it
+        self.recorder = FloatingRecorder(master=self.root, services=self.services)
+        self.recorder.hide_window()
+        self.dashboard = LazyDashboard(self._create_dashboard)
+        self.recorder.set_dashboard(self.dashboard)
+
+        self.report: Optional[StartupReport] = None
+        self.metrics_server = MetricsServer(registry)
+        self.root.after_idle(self._ready)
+
+    def _create_dashboard(self) -> "MetaVoiceApp":
+        from auto_input_voice_gui import MetaVoiceApp  # Deferred until the dashboard is opened
+        dashboard = MetaVoiceApp(master=self.root, services=self.services)
+        dashboard.set_floating_recorder(self.recorder)
+        return dashboard
+
+    def hotkey_ready_ms(self) -> Optional[float]:
+        """Time from shell start until the global hotkeys were live"""
+        if self.recorder.hotkey_ready_at is None:
+            return None
+        return (self.recorder.hotkey_ready_at - self.started) * 1000
+
+    def _ready(self):
+        """First idle pass of the event loop: the recorder is up and hotkeys are live"""
+        self.report = StartupReport("shell", 1, (time.monotonic() - self.started) * 1000,
+                                    peak_rss_mb(), self.hotkey_ready_ms())
+        print(self.report.format_line())
+        if profiler.enabled:
+            profiler.mark("first idle pass")
+            profiler.stop_tracking()
+            print(profiler.report())
+        threading.Thread(target=self._warm_up, name="metavoice-warmup", daemon=True).start()
+        self.metrics_server.start()
+
+    def _warm_up(self):
+        """Import what the first recording needs, off the UI thread"""
+        for module in WARM_UP_MODULES:
+            started = time.monotonic()
+            try:
+                __import__(module)
+            except ImportError as e:
+                print(f"⚠️ Could not warm up {module}: {e}")
+                continue
+            print(f"🔥 Warmed up {module} in {(time.monotonic() - started) * 1000:.0f}ms")
+
+    def shutdown(self):
+        """Stop both windows and the shared services, then destroy the shared root"""
+        self.metrics_server.stop()
+        self.recorder.shutdown()
+        self.dashboard.shutdown()
+        self.services.shutdown()
+        self.root.destroy()
+
+    def run(self):
+        """Run the shared event loop"""
+        self.root.mainloop()
+
+
+def measure_startup(mode: str) -> StartupReport:
+    """
+    Build the windows in one mode, process pending events, and tear them down
+
+    Args:
+        mode: "shell" for one shared root and a lazy dashboard, "separate" for the old
+              layout (a root per window, dashboard built up front)
+
+    Returns:
+        Startup time and peak RSS for that mode
+    """
+    started = time.monotonic()
+    if mode == "shell":
+        shell = AppShell()
+        shell.root.update()
+        report = StartupReport(mode, 1, (time.monotonic() - started) * 1000,
+                               peak_rss_mb(), shell.hotkey_ready_ms())
+        shell.shutdown()
+        return report
+
+    from auto_input_voice_gui import MetaVoiceApp
+    dashboard = MetaVoiceApp()
+    dashboard.ensure_widgets()
+    recorder = FloatingRecorder()
+    dashboard.set_floating_recorder(recorder)
+    recorder.set_dashboard(dashboard)
+    dashboard.hide_window()
+    recorder.hide_window()
+    dashboard.root.update()
+    recorder.root.update()
+    hotkey_ready_ms = (recorder.hotkey_ready_at - started) * 1000 if recorder.hotkey_ready_at else None
+    report = StartupReport(mode, 2, (time.monotonic() - started) * 1000, peak_rss_mb(), hotkey_ready_ms)
+    for window in (recorder, dashboard):
+        window.shutdown()
+        window.root.destroy()
+    return report
+
+
+def compare_startup() -> List[StartupReport]:
+    """
+    Measure both layouts in fresh processes and print the savings
+
+    Returns:
+        Reports for the separate and shell layouts
+    """
+    reports = []
+    for mode in ("separate", "shell"):
+        result = subprocess.run([sys.executable, __file__, "--measure", mode],
+                                capture_output=True, text=True, timeout=120)
+        lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+        if result.returncode != 0 or not lines:
+            print(f"❌ Could not measure {mode} startup: {result.stderr.strip()[-500:]}")
+            return reports
+        reports.append(StartupReport(**json.loads(lines[-1])))
+        print(reports[-1].format_line())
+
+    separate, shell = reports
+    print(f"💾 Shell saves {separate.rss_mb - shell.rss_mb:.1f}MB peak RSS "
+          f"and {separate.startup_ms - shell.startup_ms:.0f}ms startup")
+    return reports
+
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        report = measure_startup(sys.argv[sys.argv.index("--measure") + 1])
+        print(json.dumps(asdict(report)))
+    else:
+        compare_startup()
@@ -9,47 +9,129 @@ import customtkinter as ctk
 import threading
 import time
 import queue
-from whisper_wrapper import WhisperWrapper
-from text_input_automation import TextInputAutomation
+import os
+from typing import Optional
+from app_services import AppServices
+from delivery_executor import ResponsivenessProbe
+from ui_notifier import UINotifier
+from log_sink import FRAME_MS, LogSink, render_lines
+from perf_chart import CHART_POINTS, RollingChart
+from app_logging import configure_logging, get_logger, in_current_take
+import metrics
+import take_timing
+
+# Dashboard latency cards: title, histogram, unit
+LATENCY_CARDS = (
+    ("Stop → Text", metrics.STOP_TO_TEXT, "s"),
+    ("Decode Real-Time Factor", metrics.DECODE_RTF, "x"),
+    ("Insertion", metrics.INSERTION, "s")
+)
+# Performance panel charts: title, series source, unit, minimum scale, color
+PERFORMANCE_CHARTS = (
+    ("Stop → Text", metrics.STOP_TO_TEXT, "s", 1.0, "#4CAF50"),
+    ("Decode Real-Time Factor", metrics.DECODE_RTF, "x", 0.5, "#2196F3"),
+    ("CPU per Take", metrics.TAKE_CPU, "s", 1.0, "#FF9800"),
+    ("Delivery Queue Depth", metrics.DELIVERY_QUEUE, "", 2.0, "#E91E63")
+)
+PERFORMANCE_REFRESH_MS = 1000  # Charts refresh while the panel is showing
+
+log = get_logger("dashboard")
 
 # Set appearance mode
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
 class MetaVoiceApp:
-    def __init__(self):
-        self.root = ctk.CTk()
+    def __init__(self, master=None, services: Optional[AppServices] = None):
+        """
+        Initialize the dashboard
+
+        Args:
+            master: Shared Tk root from the app shell (the dashboard becomes a toplevel
+                    of it); None creates a standalone root
+            services: Services shared with the floating recorder; None builds (and owns) a set
+        """
+        if master is not None and services is None:
+            # Built lazily mid-session: a second service set would start a second helper and worker pools
+            raise ValueError("A dashboard hosted by the app shell must use the shell's services")
+        self.root = ctk.CTkToplevel(master) if master is not None else ctk.CTk()
+        self.app_root = master if master is not None else self.root
         self.root.title("metaVoice")
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
-        
-        # Initialize components
-        self.whisper = WhisperWrapper()
-        self.automation = TextInputAutomation()
+        if master is not None:
+            # Closing the hosted dashboard hides it; the floating recorder owns app exit
+            self.root.protocol("WM_DELETE_WINDOW", self.hide_window)
+        
+        # Initialize components (shared with the floating recorder when hosted by the app shell)
+        self.owns_services = services is None
+        self.services = services or AppServices()
+        self.whisper = self.services.whisper
+        self.automation = self.services.automation
         self.is_recording = False
         self.should_stop_recording = False  # Flag to stop recording early
+        self.stop_requested_at = None  # Monotonic time the user pressed stop
+        self.prefocus_future = None  # Target focusing that overlaps decoding
+        
+        # Persistent, searchable transcription history
+        self.transcript_store = self.services.transcript_store
+        self.history_query = ""
+        self.history_oldest_id = None
+        self.history_search_job = None
         
-        # Settings
+        # Settings (variables exist before the settings panel is built)
         self.target_app = "auto-detect"  # Default to auto-detection
-        self.input_method = "clipboard"  # Default method
+        self.input_method = "auto"  # Default: per-app delivery profile
         self.auto_input_enabled = True
-        
-        # Statistics tracking
-        self.recording_sessions = 0
-        self.words_captured = 0
-        self.total_speaking_time = 0
+        # Target resolved when recording starts, so prefocus and delivery know it before decoding ends
+        self.pre_recording_target = None
+        self.target_var = ctk.StringVar(master=self.root, value=self.target_app)
+        self.method_var = ctk.StringVar(master=self.root, value=self.input_method)
+        self.auto_var = ctk.BooleanVar(master=self.root, value=self.auto_input_enabled)
+        self.history_search_var = ctk.StringVar(master=self.root, value="")
+        
+        # Dashboard cards showing the metrics registry (filled when the panel is built)
+        self.stat_labels = {}
+        self.latency_labels = {}
+        self.performance_charts = []
+        self.performance_job = None
         
         # Floating recorder reference
         self.floating_recorder = None
         
-        # Thread-safe communication queue
-        self.update_queue = queue.Queue()
-        
+        # Thread-safe communication queue; each put wakes the Tk loop instead of polling it
+        self.ui_notifier = UINotifier(self.root, self.check_queue)
+        self.update_queue = self.ui_notifier.queue
+        
+        # Voice command handlers and delivery run on the shared workers and report back via update_queue
+        self.command_dispatcher = self.services.command_dispatcher
+        self.meeting_recorder = self.services.meeting_recorder
+        self.delivery_executor = self.services.delivery_executor
+        self.responsiveness_probe = ResponsivenessProbe(self.root.after)
+        
+        # Widgets are built on first show; most sessions never open the dashboard
+        self.widgets_built = False
+        self.panels = {}  # Panel name -> frame, for panels built so far
+        self.panel_builders = {
+            "Dashboard": self.create_dashboard,
+            "Settings": self.create_settings_panel,
+            "History": self.create_history_panel,
+            "Performance": self.create_performance_panel,
+            "About": self.create_about_panel
+        }
+        self.current_panel = None
+        # Bounded log shared by the status box; writes from any thread, repaints once per frame
+        self.log_sink = LogSink(self.request_log_flush)
+                
+    def ensure_widgets(self):
+        """Build the window chrome and the default panel on first use"""
+        if self.widgets_built:
+            return
+        self.widgets_built = True
+        started = time.monotonic()
         self.create_widgets()
-        
-        # Start checking for updates from background threads
-        self.check_queue()
-        
+        print(f"🧱 Dashboard built in {(time.monotonic() - started) * 1000:.0f}ms")
+    
     def create_widgets(self):
         # Main container
         main_container = ctk.CTkFrame(self.root, fg_color="transparent")
@@ -84,6 +166,7 @@ class MetaVoiceApp:
             ("Dashboard", "📊"),
             ("Settings", "⚙️"),
             ("History", "📝"),
+            ("Performance", "📈"),
             ("About", "ℹ️")
         ]
         
@@ -110,6 +193,8 @@ class MetaVoiceApp:
                 btn.configure(command=lambda: self.show_settings())
             elif text == "History":
                 btn.configure(command=lambda: self.show_history())
+            elif text == "Performance":
+                btn.configure(command=lambda: self.show_performance())
             elif text == "About":
                 btn.configure(command=lambda: self.show_about())
     
@@ -118,13 +203,7 @@ class MetaVoiceApp:
         self.main_content = ctk.CTkFrame(parent, fg_color="transparent")
         self.main_content.pack(side="right", fill="both", expand=True, padx=20, pady=20)
         
-        # Create different content areas
-        self.create_dashboard()
-        self.create_settings_panel()
-        self.create_history_panel()
-        self.create_about_panel()
-        
-        # Show dashboard by default
+        # Content panels are built when first shown; start on the dashboard
         self.show_dashboard()
     
     def create_dashboard(self):
@@ -283,6 +362,7 @@ class MetaVoiceApp:
                 text_color="#ffffff"
             )
             stat_value.pack()
+            self.stat_labels[title] = stat_value
             stat_title = ctk.CTkLabel(
                 stat_content,
                 text=title,
@@ -291,6 +371,33 @@ class MetaVoiceApp:
             )
             stat_title.pack()
         
+        # Latency percentiles over recent takes
+        latency_frame = ctk.CTkFrame(self.dashboard_frame, fg_color="transparent")
+        latency_frame.pack(fill="x", pady=(0, 20))
+        
+        for i, (title, _histogram, _unit) in enumerate(LATENCY_CARDS):
+            latency_card = ctk.CTkFrame(latency_frame, fg_color="#1a1a1a", height=70)
+            latency_card.pack(side="left", fill="x", expand=True, padx=(0 if i == 0 else 10, 0))
+            latency_card.pack_propagate(False)
+            
+            latency_title = ctk.CTkLabel(
+                latency_card,
+                text=title,
+                font=ctk.CTkFont(size=10),
+                text_color="#888888"
+            )
+            latency_title.pack(pady=(12, 0))
+            latency_value = ctk.CTkLabel(
+                latency_card,
+                text="no data yet",
+                font=ctk.CTkFont(size=13, weight="bold"),
+                text_color="#ffffff"
+            )
+            latency_value.pack()
+            self.latency_labels[title] = latency_value
+        
+        self.refresh_stats()
+        
         # Main recording section
         recording_frame = ctk.CTkFrame(self.dashboard_frame, fg_color="#1a1a1a")
         recording_frame.pack(fill="x", pady=(20, 0))
@@ -357,6 +464,11 @@ class MetaVoiceApp:
             hover_color="#1976D2"
         )
         minimize_button.pack(side="left", padx=5)
+        
+        # Shows anything logged before the status box existed, then each batch
+        self.log_sink.attach(
+            lambda lines, replace: render_lines(self.status_text, lines, replace, self.log_sink.capacity))
+        return self.dashboard_frame
     
     def create_settings_panel(self):
         self.settings_frame = ctk.CTkFrame(self.main_content, fg_color="transparent")
@@ -391,7 +503,6 @@ class MetaVoiceApp:
         target_label = ctk.CTkLabel(target_frame, text="Target App:", font=ctk.CTkFont(size=12))
         target_label.pack(side="left", padx=10, pady=5)
         
-        self.target_var = ctk.StringVar(value="auto-detect")
         target_options = ["auto-detect", "cursor", "qoder", "active", "safari", "chrome", "terminal", "notes", "vscode", "pycharm"]
         target_menu = ctk.CTkOptionMenu(target_frame, values=target_options, variable=self.target_var)
         target_menu.pack(side="left", padx=10, pady=5)
@@ -414,8 +525,7 @@ class MetaVoiceApp:
         method_label = ctk.CTkLabel(method_frame, text="Input Method:", font=ctk.CTkFont(size=12))
         method_label.pack(side="left", padx=10, pady=5)
         
-        self.method_var = ctk.StringVar(value="clipboard")
-        method_options = ["clipboard", "direct"]
+        method_options = ["auto", "clipboard", "direct"]
         method_menu = ctk.CTkOptionMenu(method_frame, values=method_options, variable=self.method_var)
         method_menu.pack(side="left", padx=10, pady=5)
         
@@ -434,26 +544,36 @@ class MetaVoiceApp:
         auto_frame = ctk.CTkFrame(auto_card, fg_color="transparent")
         auto_frame.pack(pady=(0, 15))
         
-        self.auto_var = ctk.BooleanVar(value=True)
         auto_checkbox = ctk.CTkCheckBox(auto_frame, text="Auto-input enabled", variable=self.auto_var)
         auto_checkbox.pack(side="left", padx=10, pady=5)
+        return self.settings_frame
         
     def create_history_panel(self):
         self.history_frame = ctk.CTkFrame(self.main_content, fg_color="transparent")
         
         history_title = ctk.CTkLabel(
             self.history_frame,
-            text="History & Logs",
+            text="History",
             font=ctk.CTkFont(size=32, weight="bold"),
             text_color="#ffffff"
         )
         history_title.pack(pady=(0, 30))
         
-        # History text area
+        # Search box - filters the transcript store as you type
+        history_search = ctk.CTkEntry(
+            self.history_frame,
+            width=800,
+            placeholder_text="🔍 Search transcriptions...",
+            textvariable=self.history_search_var
+        )
+        history_search.pack(pady=(0, 10))
+        history_search.bind("<KeyRelease>", self.on_history_search)
+        
+        # History text area - shows one page of stored transcriptions at a time
         self.history_text = ctk.CTkTextbox(
             self.history_frame,
             width=800,
-            height=500,
+            height=460,
             fg_color="#1a1a1a",
             text_color="#ffffff"
         )
@@ -463,6 +583,15 @@ class MetaVoiceApp:
         history_controls = ctk.CTkFrame(self.history_frame, fg_color="transparent")
         history_controls.pack()
         
+        self.load_more_button = ctk.CTkButton(
+            history_controls,
+            text="Load More",
+            command=self.load_more_history,
+            fg_color="#2196F3",
+            hover_color="#1976D2"
+        )
+        self.load_more_button.pack(side="left", padx=5)
+        
         clear_history_btn = ctk.CTkButton(
             history_controls,
             text="Clear History",
@@ -471,6 +600,44 @@ class MetaVoiceApp:
             hover_color="#555555"
         )
         clear_history_btn.pack(side="left", padx=5)
+        
+        self.history_count_label = ctk.CTkLabel(
+            history_controls,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="#888888"
+        )
+        self.history_count_label.pack(side="left", padx=10)
+        return self.history_frame
+    
+    def create_performance_panel(self):
+        self.performance_frame = ctk.CTkFrame(self.main_content, fg_color="transparent")
+        
+        performance_title = ctk.CTkLabel(
+            self.performance_frame,
+            text="Performance",
+            font=ctk.CTkFont(size=32, weight="bold"),
+            text_color="#ffffff"
+        )
+        performance_title.pack(pady=(0, 10))
+        
+        performance_note = ctk.CTkLabel(
+            self.performance_frame,
+            text=f"Last {CHART_POINTS} takes (queue depth: last {CHART_POINTS} changes)",
+            font=ctk.CTkFont(size=12),
+            text_color="#888888"
+        )
+        performance_note.pack(pady=(0, 20))
+        
+        charts_frame = ctk.CTkFrame(self.performance_frame, fg_color="transparent")
+        charts_frame.pack(fill="both", expand=True)
+        
+        width, height = 380, 150
+        for i, (title, _source, unit, min_scale, color) in enumerate(PERFORMANCE_CHARTS):
+            canvas = tk.Canvas(charts_frame, width=width, height=height, bg="#1a1a1a", highlightthickness=0)
+            canvas.grid(row=i // 2, column=i % 2, padx=10, pady=10)
+            self.performance_charts.append(RollingChart(canvas, title, width, height, unit, min_scale, color))
+        return self.performance_frame
     
     def create_about_panel(self):
         self.about_frame = ctk.CTkFrame(self.main_content, fg_color="transparent")
@@ -494,32 +661,68 @@ class MetaVoiceApp:
             justify="left"
         )
         about_text.pack(pady=20, padx=20)
+        return self.about_frame
     
-    def show_dashboard(self):
+    def show_panel(self, name):
+        """Show one content panel, building it on first use"""
+        self.ensure_widgets()
+        if name not in self.panels:
+            self.panels[name] = self.panel_builders[name]()
         self.hide_all_panels()
-        self.dashboard_frame.pack(fill="both", expand=True)
-        self.update_nav_selection("Dashboard")
+        self.panels[name].pack(fill="both", expand=True)
+        self.update_nav_selection(name)
+        self.current_panel = name
+    
+    def show_dashboard(self):
+        self.show_panel("Dashboard")
+        self.refresh_stats()
+    
+    def refresh_stats(self):
+        """Show the current metrics on the dashboard cards (UI thread)"""
+        if not self.stat_labels:
+            return
+        words = metrics.WORDS.value
+        takes = metrics.TAKES.value
+        minutes = metrics.AUDIO_SECONDS.sum / 60
+        values = {
+            "Words Captured": f"{words:.0f}",
+            "Voice-to-Text Sessions": f"{takes:.0f}",
+            "Average Words/Minute": f"{words / minutes:.0f}" if minutes else "0",
+            "Words/Session": f"{words / takes:.0f}" if takes else "0"
+        }
+        for title, label in self.stat_labels.items():
+            label.configure(text=values[title])
+        for title, histogram, unit in LATENCY_CARDS:
+            self.latency_labels[title].configure(text=metrics.format_percentiles(histogram, unit))
     
     def show_settings(self):
-        self.hide_all_panels()
-        self.settings_frame.pack(fill="both", expand=True)
-        self.update_nav_selection("Settings")
+        self.show_panel("Settings")
     
     def show_history(self):
-        self.hide_all_panels()
-        self.history_frame.pack(fill="both", expand=True)
-        self.update_nav_selection("History")
+        self.show_panel("History")
+        self.reload_history()
+    
+    def show_performance(self):
+        self.show_panel("Performance")
+        self.refresh_performance()
+    
+    def refresh_performance(self):
+        """Move the performance charts to the latest metrics, then again each second while they show"""
+        if self.performance_job is not None:
+            self.root.after_cancel(self.performance_job)
+            self.performance_job = None
+        if self.current_panel != "Performance" or not self.root.winfo_ismapped():
+            return
+        for chart, (_title, source, _unit, _min_scale, _color) in zip(self.performance_charts, PERFORMANCE_CHARTS):
+            chart.update(source.recent(CHART_POINTS))
+        self.performance_job = self.root.after(PERFORMANCE_REFRESH_MS, self.refresh_performance)
     
     def show_about(self):
-        self.hide_all_panels()
-        self.about_frame.pack(fill="both", expand=True)
-        self.update_nav_selection("About")
+        self.show_panel("About")
     
     def hide_all_panels(self):
-        self.dashboard_frame.pack_forget()
-        self.settings_frame.pack_forget()
-        self.history_frame.pack_forget()
-        self.about_frame.pack_forget()
+        for frame in self.panels.values():
+            frame.pack_forget()
     
     def update_nav_selection(self, selected):
         for name, btn in self.nav_buttons.items():
@@ -528,8 +731,45 @@ class MetaVoiceApp:
             else:
                 btn.configure(fg_color="transparent")
     
-    def clear_history(self):
+    def reload_history(self):
+        """Show the first page of transcriptions matching the current search"""
+        self.history_query = self.history_search_var.get()
+        self.history_oldest_id = None
         self.history_text.delete("1.0", "end")
+        self.load_more_history()
+    
+    def load_more_history(self, page_size=50):
+        """Append the next page of matching transcriptions"""
+        records = self.transcript_store.page(self.history_query, self.history_oldest_id, page_size)
+        for record in records:
+            self.history_text.insert("end", record.format_line() + "\n")
+        if records:
+            self.history_oldest_id = records[-1].id
+        
+        has_more = len(records) == page_size
+        self.load_more_button.configure(state="normal" if has_more else "disabled")
+        self.history_count_label.configure(text=f"{self.transcript_store.count()} transcriptions stored")
+    
+    def on_history_search(self, event=None):
+        """Debounce search-as-you-type"""
+        if self.history_search_job is not None:
+            self.root.after_cancel(self.history_search_job)
+        self.history_search_job = self.root.after(150, self._run_history_search)
+    
+    def _run_history_search(self):
+        self.history_search_job = None
+        self.reload_history()
+    
+    def clear_history(self):
+        """Delete all stored transcriptions"""
+        try:
+            import tkinter.messagebox as messagebox
+            if not messagebox.askyesno("Clear History", "Delete all stored transcriptions?"):
+                return
+        except:
+            pass
+        self.transcript_store.clear()
+        self.reload_history()
     
     def minimize_to_floating(self):
         """Minimize dashboard and show floating recorder"""
@@ -538,10 +778,13 @@ class MetaVoiceApp:
             self.floating_recorder.show_window()
     
     def show_window(self):
-        """Show the dashboard window"""
+        """Show the dashboard window (building it on first show)"""
+        self.ensure_widgets()
         self.root.deiconify()
         self.root.lift()
         self.root.focus_force()
+        if self.current_panel == "Performance":
+            self.root.after_idle(self.refresh_performance)
     
     def hide_window(self):
         """Hide the dashboard window"""
@@ -553,37 +796,53 @@ class MetaVoiceApp:
         print(f"✅ Floating recorder reference set: {floating_recorder is not None}")
     
     def check_queue(self):
-        """Check for updates from background threads"""
+        """
+        Handle updates from background threads (runs when the UI notifier wakes the loop)
+
+        Returns:
+            Number of updates handled
+        """
+        handled = 0
         try:
             while True:
                 # Non-blocking check for queue items
                 update_type, data = self.update_queue.get_nowait()
+                handled += 1
                 
                 if update_type == "transcription":
                     self.handle_transcription(data)
                 elif update_type == "error":
                     self.handle_error(data)
+                elif update_type == "command_result":
+                    self.handle_command_result(data)
+                elif update_type == "delivery_progress":
+                    self.log(data)
+                elif update_type == "delivery_result":
+                    self.handle_delivery_result(data)
+                elif update_type == "log_flush":
+                    self.root.after(FRAME_MS, self.log_sink.flush)
                     
         except queue.Empty:
-            # No updates in queue, continue
+            # Drained; the next put wakes us again
             pass
         
-        # Schedule next check
-        self.root.after(100, self.check_queue)
+        return handled
         
     def log(self, message):
-        """Add message to log"""
-        timestamp = time.strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        self.status_text.insert("end", log_message)
-        self.status_text.see("end")
-        self.history_text.insert("end", log_message)
-        self.history_text.see("end")
-        print(message)
+        """Add message to log (safe from worker threads)"""
+        self.log_sink.write(message)
+        log.info(message)
+    
+    def request_log_flush(self):
+        """Repaint the log within a frame; worker threads hand the request to the UI thread"""
+        if threading.current_thread() is threading.main_thread():
+            self.root.after(FRAME_MS, self.log_sink.flush)
+        else:
+            self.update_queue.put(("log_flush", None))
     
     def clear_log(self):
         """Clear the log"""
-        self.status_text.delete("1.0", "end")
+        self.log_sink.clear()
     
     def toggle_recording(self):
         """Toggle recording on/off"""
@@ -602,18 +861,28 @@ class MetaVoiceApp:
         self.input_method = self.method_var.get()
         self.auto_input_enabled = self.auto_var.get()
         
+        take_timing.begin_take()
+        # Resolve auto-detect now: the frontmost tracker ignores our own window, so this is
+        # the app the user came from (prefocus cannot work with "auto-detect")
+        if self.target_app == "auto-detect":
+            self.pre_recording_target = self.automation.auto_detect_target()
+        else:
+            self.pre_recording_target = self.target_app
+        
         self.log("🎤 Starting recording...")
-        self.log(f"📱 Target app: {self.target_app}")
-        self.log(f"⌨️ Input method: {self.input_method}")
-        self.log(f"🤖 Auto-input: {'Enabled' if self.auto_input_enabled else 'Disabled'}")
+        log.debug("📱 Target app: %s (%s), input method: %s, auto-input: %s", self.target_app,
+                  self.pre_recording_target, self.input_method, self.auto_input_enabled)
         
         # Start recording in thread
-        thread = threading.Thread(target=self.record_audio)
+        thread = threading.Thread(target=in_current_take(self.record_audio), name="metavoice-capture")
         thread.daemon = True
         thread.start()
     
     def stop_recording(self):
         """Stop recording"""
+        if self.is_recording:
+            self.stop_requested_at = time.monotonic()
+            take_timing.event("stop", self.stop_requested_at)
         self.should_stop_recording = True  # Set flag to stop recording
         self.is_recording = False
         self.record_button.configure(text="🎤 Start Recording", fg_color="#4CAF50")
@@ -622,119 +891,128 @@ class MetaVoiceApp:
     def record_audio(self):
         """Record audio with auto-input"""
         try:
-            self.log("🎤 Recording for 20 seconds...")
-            self.log("🎤 SPEAK NOW! Your words will be typed automatically!")
-            self.log("🎤 Click the stop button to finish early!")
-            self.log("🎯 Using ACCURATE mode for best transcription quality")
+            self.log("🎤 SPEAK NOW! Up to 20 seconds; click stop to finish early")
             
             # Reset stop flag
             self.should_stop_recording = False
+            self.stop_requested_at = None
+            self.prefocus_future = None
             
             # Create stop flag function
             def should_stop():
                 return self.should_stop_recording
             
-            # Record audio with accurate mode and stop flag
-            text = self.whisper.transcribe_microphone(
-                duration=20, 
-                speed_mode="accurate",
-                stop_flag=should_stop
-            )
+            # Record audio with accurate mode and stop flag (the target is tracked meanwhile)
+            with self.automation.tracking_frontmost():
+                text = self.whisper.transcribe_microphone(
+                    duration=20, 
+                    speed_mode="accurate",
+                    stop_flag=should_stop,
+                    on_recording_finished=self.start_prefocus
+                )
             
-            self.log("✅ Recording finished")
-            self.log(f"🎯 Transcribed text: '{text}'")
+            take_timing.event("text_ready")
+            log.debug("🎯 Transcribed text: %r", text)
             
-            # Update statistics
-            self.recording_sessions += 1
             if text and text.strip() and text.strip() != "[BLANK_AUDIO]":
-                words = len(text.split())
-                self.words_captured += words
-                self.total_speaking_time += 20
+                self.save_transcription(text, self.pre_recording_target)
             
             # Send update to main thread via queue
             self.update_queue.put(("transcription", text))
             
         except Exception as e:
-            self.log(f"❌ Error: {e}")
+            log.error("❌ Error: %s", e, exc_info=True)
             self.update_queue.put(("error", str(e)))
     
+    def start_prefocus(self):
+        """Focus the delivery target while whisper decodes (called from the recording thread)"""
+        if self.auto_input_enabled and self.pre_recording_target:
+            self.prefocus_future = self.automation.prefocus_async(self.pre_recording_target)
+    
+    def take_prefocus(self):
+        """Hand the focus started during decoding to the delivery worker"""
+        future, self.prefocus_future = self.prefocus_future, None
+        return future
+    
+    def save_transcription(self, text, target_app):
+        """Persist a transcription to the history store (called from the recording thread)"""
+        latency_ms = None
+        if self.stop_requested_at is not None:
+            latency_ms = (time.monotonic() - self.stop_requested_at) * 1000
+        try:
+            self.transcript_store.add(
+                text.strip(),
+                target_app=target_app,
+                model=os.path.basename(self.whisper.model_path),
+                latency_ms=latency_ms
+            )
+        except Exception as e:
+            print(f"⚠️ Could not save transcription to history: {e}")
+    
     def handle_transcription(self, text):
         """Handle transcription results"""
+        take_timing.stage_since("text_ready", "ui_handoff")
+        self.refresh_stats()
         if text and text.strip() and text.strip() != "[BLANK_AUDIO]":
-            self.log("✅ SUCCESS! Speech detected!")
-            
             # Parse command
             command = self.whisper.parse_command(text)
-            self.log(f"🔍 Parsed command: {command}")
+            log.debug("🔍 Parsed command: %s", command)
             
             if command["command"] != "unknown":
-                self.log("🎉 Command recognized!")
                 # Handle specific commands
                 self.handle_command(command)
             else:
-                self.log("⚠️ Command not recognized, treating as text input")
+                log.debug("⚠️ Command not recognized, treating as text input")
                 # Auto-input the transcribed text
                 if self.auto_input_enabled:
                     self.auto_input_text(text)
                 else:
                     self.log("🤖 Auto-input disabled, text not sent")
         else:
-            self.log("❌ No speech detected")
-            self.log("🔧 Troubleshooting:")
-            self.log("  - Did you speak during the recording?")
-            self.log("  - Was your speech loud enough?")
-            self.log("  - Try speaking louder and more clearly")
+            self.log("❌ No speech detected - try speaking louder and more clearly")
         
         self.is_recording = False
         self.record_button.configure(text="🎤 Start Recording", fg_color="#4CAF50")
     
     def handle_command(self, command):
         """Handle recognized commands"""
-        cmd = command["command"]
-        params = command["parameters"]
-        
-        if cmd == "record-meeting":
-            self.log("📹 Starting meeting recording...")
-            # TODO: Implement meeting recording
-            self.log("📹 Meeting recording started")
-        elif cmd == "build-app":
-            app_type = params.get("type", "react")
-            app_name = params.get("name", "my-app")
-            self.log(f"🚀 Building {app_type} app named '{app_name}'...")
-            # TODO: Implement app building
-            self.log(f"🚀 App building initiated")
+        log.debug("🔧 Dispatching command '%s'...", command["command"])
+        self.command_dispatcher.dispatch(command, self.update_queue)
+    
+    def handle_command_result(self, result):
+        """Handle a finished command reported by the dispatcher"""
+        if result.status == "ok":
+            self.log(f"{result.message} ({result.elapsed:.2f}s)")
+        elif result.status == "unhandled":
+            self.log(f"🔧 {result.message}")
         else:
-            self.log(f"🔧 Command '{cmd}' not yet implemented")
+            self.log(f"❌ {result.message}")
     
     def auto_input_text(self, text):
-        """Auto-input text into target application"""
+        """
+        Queue text for delivery into the target application
+        
+        Returns:
+            Future for the delivery report, or None if auto-input is disabled
+        """
         try:
-            self.log(f"📺 === DASHBOARD AUTO-INPUT DEBUG ===")
-            self.log(f"📝 Text to input: '{text[:50]}...'")
-            self.log(f"🎯 Dashboard target app setting: '{self.target_app}'")
-            self.log(f"⌨️ Dashboard input method: '{self.input_method}'")
-            self.log(f"🤖 Dashboard auto-input enabled: {self.auto_input_enabled}")
-            
             if not self.auto_input_enabled:
                 self.log("🚫 Auto-input is disabled in dashboard settings")
-                return False
+                return None
             
-            success = self.automation.auto_input_text(
+            # Delivery runs on the worker; the result arrives as "delivery_result"
+            self.responsiveness_probe.start()
+            return self.delivery_executor.submit(
                 text, 
-                self.target_app, 
-                self.input_method
+                self.pre_recording_target or self.target_app,  # Same target the prefocus used
+                self.input_method,
+                prefocus=self.take_prefocus(),
+                result_queue=self.update_queue
             )
-            
-            if success:
-                self.log("✅ Dashboard: Text successfully input!")
-            else:
-                self.log("❌ Dashboard: Failed to input text")
-                
-            return success
                 
         except Exception as e:
-            self.log(f"❌ Dashboard error auto-inputting text: {e}")
-            return False
+            log.error("❌ Error queuing text for delivery: %s", e, exc_info=True)
+            return None
     
     def test_automation(self):
         """Test the automation system"""
@@ -749,17 +1027,36 @@ class MetaVoiceApp:
         except Exception as e:
             self.log(f"❌ Automation test error: {e}")
     
+    def handle_delivery_result(self, report):
+        """Handle a finished delivery reported by the delivery worker"""
+        stall_ms = self.responsiveness_probe.stop()
+        self.log(f"{report.format_line()} (UI max stall {stall_ms:.0f}ms, "
+                 f"{self.ui_notifier.empty_wakeups} idle wakeups)")
+        timeline = take_timing.timings.get(report.take_id)
+        if timeline is not None:
+            self.log_sink.write(timeline.format_line())
+            log.info("%s", timeline, extra={"fields": {"timeline": timeline.to_dict()}})
+        self.refresh_stats()
+        self.refresh_performance()
+    
     def handle_error(self, error_msg):
         """Handle errors"""
         self.log(f"❌ Error: {error_msg}")
         self.is_recording = False
         self.record_button.configure(text="🎤 Start Recording", fg_color="#4CAF50")
     
+    def shutdown(self):
+        """Stop the services if this window built them (the app shell stops shared ones)"""
+        if self.owns_services:
+            self.services.shutdown()
+    
     def run(self):
         """Run the application"""
-        self.root.mainloop()
+        self.ensure_widgets()
+        self.app_root.mainloop()
 
 def main():
+    configure_logging()
     app = MetaVoiceApp()
     app.run()
 
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Automation Helper Client for metaVoice
+Talks to a long-lived helper process over a line-delimited JSON protocol so
+automation steps no longer pay a full osascript launch each
+
+Protocol (one JSON object per line):
+    request:  {"id": 1, "cmd": "run_script", "script": "...", "args": ["..."]}
+    reply:    {"id": 1, "ok": true, "result": "..."}  or  {"id": 1, "ok": false, "error": "..."}
+"""
+
+import itertools
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class AutomationHelperError(Exception):
+    """The helper failed, crashed or did not answer in time"""
+
+
+class AutomationScriptError(AutomationHelperError):
+    """The helper is healthy but the requested script or command failed"""
+
+
+class AutomationHelperUnavailable(AutomationHelperError):
+    """The request never reached a helper: it could not be started, or died before the write"""
+
+
+# A script's reply timeout grows with the text it carries, so slow but healthy
+# typing or pasting is not killed mid-delivery
+SCRIPT_SECONDS_PER_CHAR = 0.02
+
+
+def default_helper_command() -> List[str]:
+    """Command that starts the macOS helper server"""
+    if getattr(sys, 'frozen', False):
+        # Bundled app: main.py dispatches this flag to the helper server
+        return [sys.executable, "--automation-helper"]
+    server = os.path.join(os.path.dirname(os.path.abspath(__file__)), "automation_helper_server.py")
+    return [sys.executable, server]
+
+
+class AutomationHelperClient:
+    def __init__(self, command: Optional[List[str]] = None, timeout: float = 15.0):
+        """
+        Initialize the helper client (the process starts on first request)
+
+        Args:
+            command: Helper command line (defaults to automation_helper_server.py)
+            timeout: Seconds to wait for a reply before restarting the helper
+        """
+        self.command = command or default_helper_command()
+        self.timeout = timeout
+        self.restarts = 0
+        self._started = False
+        self._process = None
+        self._replies = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """True while the helper process is alive"""
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self):
+        """Spawn the helper and a reader thread for its replies"""
+        self._started = True
+        try:
+            self._process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        except OSError as e:
+            self._process = None
+            raise AutomationHelperUnavailable(f"Could not start helper: {e}")
+        self._replies = queue.Queue()
+        reader = threading.Thread(target=self._read_replies, args=(self._process, self._replies), daemon=True)
+        reader.start()
+
+    @staticmethod
+    def _read_replies(process, replies):
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                replies.put(json.loads(line))
+            except ValueError:
+                continue
+        # EOF: the helper exited
+        replies.put(None)
+
+    def _restart(self):
+        """Kill whatever is left of the helper and start a fresh one"""
+        self._kill()
+        self.restarts += 1
+        self._start()
+
+    def _kill(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait(timeout=1)
+            except Exception:
+                pass
+            self._process = None
+
+    def request(self, cmd: str, timeout: Optional[float] = None, **params) -> Any:
+        """
+        Send one command and wait for its reply
+
+        Args:
+            cmd: Command name
+            timeout: Override for the reply timeout
+            params: Command parameters
+
+        Returns:
+            The reply's "result" value
+
+        Raises:
+            AutomationHelperUnavailable: The request was never delivered (safe to retry elsewhere)
+            AutomationHelperError: On helper errors, crashes or timeouts after the request was sent
+        """
+        with self._lock:
+            if not self.is_running:
+                if self._started:
+                    self._restart()
+                else:
+                    self._start()
+
+            request_id = next(self._ids)
+            message = json.dumps({"id": request_id, "cmd": cmd, **params}) + "\n"
+            try:
+                self._process.stdin.write(message)
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                # Died before reading the request: safe to reconnect and resend
+                self._restart()
+                try:
+                    self._process.stdin.write(message)
+                    self._process.stdin.flush()
+                except (BrokenPipeError, OSError) as e:
+                    self._kill()
+                    raise AutomationHelperUnavailable(f"Helper is not accepting requests: {e}")
+
+            wait = self.timeout if timeout is None else timeout
+            while True:
+                try:
+                    reply = self._replies.get(timeout=wait)
+                except queue.Empty:
+                    self._restart()
+                    raise AutomationHelperError(f"Helper did not answer '{cmd}' within {wait}s")
+                if reply is None:
+                    # Crashed mid-request; reconnect for the next caller but do not
+                    # replay a command that may already have had side effects
+                    self._restart()
+                    raise AutomationHelperError(f"Helper exited while handling '{cmd}'")
+                if reply.get("id") == request_id:
+                    break
+
+        if not reply.get("ok"):
+            raise AutomationScriptError(reply.get("error", f"Helper failed '{cmd}'"))
+        return reply.get("result")
+
+    def ping(self) -> bool:
+        """Check that the helper answers"""
+        try:
+            return self.request("ping") == "pong"
+        except AutomationHelperError:
+            return False
+
+    def run_script(self, script: str, *args: str, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """
+        Run an AppleScript in the helper
+
+        Args:
+            script: AppleScript source
+            args: Values passed to the script's `on run argv` handler
+            timeout: Reply timeout; by default the client timeout plus time for the text in args
+
+        Returns:
+            A CompletedProcess shaped like subprocess.run(['osascript', ...]) output
+
+        Raises:
+            AutomationHelperError: If the helper itself crashed or timed out
+        """
+        argv = ["automation-helper", "run_script", *args]
+        if timeout is None:
+            timeout = self.timeout + SCRIPT_SECONDS_PER_CHAR * sum(len(arg) for arg in args)
+        try:
+            result = self.request("run_script", timeout=timeout, script=script, args=list(args))
+            return subprocess.CompletedProcess(argv, 0, f"{result or ''}\n", "")
+        except AutomationScriptError as e:
+            return subprocess.CompletedProcess(argv, 1, "", str(e))
+
+    def frontmost(self) -> Dict[str, Any]:
+        """Name, bundle id and pid of the frontmost application"""
+        return self.request("frontmost")
+
+    def set_clipboard(self, text: str) -> bool:
+        """Set the clipboard text"""
+        return bool(self.request("set_clipboard", text=text))
+
+    def get_clipboard(self) -> str:
+        """Read the clipboard text"""
+        return self.request("get_clipboard") or ""
+
+    def close(self):
+        """Stop the helper process"""
+        with self._lock:
+            if self.is_running:
+                try:
+                    self._process.stdin.close()
+                    self._process.wait(timeout=1)
+                except Exception:
+                    pass
+            self._kill()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Automation Helper Server for metaVoice (macOS)
+Long-lived process that runs AppleScript in-process via NSAppleScript and
+answers line-delimited JSON requests on stdin/stdout (see automation_helper.py)
+"""
+
+import json
+import struct
+import sys
+
+
+def _fourcc(code: str) -> int:
+    """Convert a four-character Apple event code to its integer value"""
+    return struct.unpack(">I", code.encode("ascii"))[0]
+
+
+class ScriptRunner:
+    def __init__(self):
+        """Load AppKit/Foundation and prepare the compiled script cache"""
+        import AppKit
+        import Foundation
+
+        self.AppKit = AppKit
+        self.Foundation = Foundation
+        # Compiled scripts keyed by source, so repeated steps skip compilation
+        self._scripts = {}
+
+    def _compiled(self, source: str):
+        script = self._scripts.get(source)
+        if script is None:
+            script = self.Foundation.NSAppleScript.alloc().initWithSource_(source)
+            ok, error = script.compileAndReturnError_(None)
+            if not ok:
+                raise RuntimeError(str(error))
+            self._scripts[source] = script
+        return script
+
+    def run_script(self, source: str, args) -> str:
+        """Run a script; args are passed to its `on run argv` handler"""
+        Foundation = self.Foundation
+        script = self._compiled(source)
+
+        if args:
+            # Same 'aevt/oapp' event osascript sends to invoke the run handler
+            event = Foundation.NSAppleEventDescriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+                _fourcc("aevt"), _fourcc("oapp"), Foundation.NSAppleEventDescriptor.nullDescriptor(), -1, 0)
+            argv = Foundation.NSAppleEventDescriptor.listDescriptor()
+            for index, arg in enumerate(args, start=1):
+                argv.insertDescriptor_atIndex_(Foundation.NSAppleEventDescriptor.descriptorWithString_(arg), index)
+            event.setParamDescriptor_forKeyword_(argv, _fourcc("----"))
+            result, error = script.executeAppleEvent_error_(event, None)
+        else:
+            result, error = script.executeAndReturnError_(None)
+
+        if result is None:
+            raise RuntimeError(str(error))
+        return result.stringValue() or ""
+
+    def frontmost(self):
+        # NSWorkspace only refreshes frontmostApplication while a run loop spins;
+        # this process otherwise blocks on stdin, so pump it briefly first
+        self.Foundation.NSRunLoop.currentRunLoop().runUntilDate_(
+            self.Foundation.NSDate.dateWithTimeIntervalSinceNow_(0.001))
+        app = self.AppKit.NSWorkspace.sharedWorkspace().frontmostApplication()
+        return {
+            "name": str(app.localizedName() or ""),
+            "bundle_id": str(app.bundleIdentifier() or ""),
+            "pid": int(app.processIdentifier())
+        }
+
+    def set_clipboard(self, text: str) -> bool:
+        pasteboard = self.AppKit.NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        return bool(pasteboard.setString_forType_(text, self.AppKit.NSPasteboardTypeString))
+
+    def get_clipboard(self) -> str:
+        pasteboard = self.AppKit.NSPasteboard.generalPasteboard()
+        return str(pasteboard.stringForType_(self.AppKit.NSPasteboardTypeString) or "")
+
+
+def handle(runner: ScriptRunner, request: dict):
+    """Execute one request and return its result value"""
+    cmd = request.get("cmd")
+    if cmd == "ping":
+        return "pong"
+    if cmd == "run_script":
+        return runner.run_script(request["script"], request.get("args", []))
+    if cmd == "frontmost":
+        return runner.frontmost()
+    if cmd == "set_clipboard":
+        return runner.set_clipboard(request["text"])
+    if cmd == "get_clipboard":
+        return runner.get_clipboard()
+    raise ValueError(f"Unknown command: {cmd}")
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout):
+    """Answer requests until stdin closes"""
+    runner = ScriptRunner()
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            reply = {"id": request_id, "ok": True, "result": handle(runner, request)}
+        except Exception as e:
+            reply = {"id": request_id, "ok": False, "error": str(e)}
+        stdout.write(json.dumps(reply) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    serve()
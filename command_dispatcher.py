@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Command Dispatch for metaVoice
+Maps parsed voice commands to handlers that run on a worker pool, with
+timeouts, and reports results back through the GUI's update queue
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from app_logging import in_current_take
+from session_trace import tracer
+
+# Handler signature: handler(command) -> optional status message
+CommandHandler = Callable[[Dict[str, Any]], Optional[str]]
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one dispatched command"""
+    command: str
+    status: str  # "ok", "error", "timeout" or "unhandled"
+    message: str = ""
+    elapsed: float = 0.0
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+
+class CommandDispatcher:
+    def __init__(self, result_queue=None, max_workers: int = 4, default_timeout: float = 30.0):
+        """
+        Initialize the dispatcher
+
+        Args:
+            result_queue: Default queue receiving ("command_result", CommandResult) tuples
+                          (each dispatch may name its own, e.g. the window that heard it)
+            max_workers: Size of the handler worker pool
+            default_timeout: Seconds before a handler is reported as timed out
+        """
+        self.result_queue = result_queue
+        self.default_timeout = default_timeout
+        self._handlers: Dict[str, CommandHandler] = {}
+        self._timeouts: Dict[str, float] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="metavoice-command")
+
+    def register(self, command: str, handler: CommandHandler, timeout: Optional[float] = None):
+        """
+        Register a handler for a command name
+
+        Args:
+            command: Command name as returned by parse_command
+            handler: Callable receiving the parsed command dict
+            timeout: Per-command timeout in seconds (defaults to default_timeout)
+        """
+        self._handlers[command] = handler
+        if timeout is not None:
+            self._timeouts[command] = timeout
+
+    def handler(self, command: str, timeout: Optional[float] = None):
+        """Decorator form of register"""
+        def decorator(func: CommandHandler) -> CommandHandler:
+            self.register(command, func, timeout)
+            return func
+        return decorator
+
+    def has_handler(self, command: str) -> bool:
+        """Check whether a command has a registered handler"""
+        return command in self._handlers
+
+    def dispatch(self, command: Dict[str, Any], result_queue=None) -> Optional[Future]:
+        """
+        Run the handler for a parsed command on the worker pool
+
+        Args:
+            command: Parsed command dict from parse_command
+            result_queue: Queue for this command's result (defaults to the dispatcher's)
+
+        Returns:
+            Future for the handler, or None if no handler is registered
+        """
+        name = command["command"]
+        params = command.get("parameters", {})
+        handler = self._handlers.get(name)
+        results = result_queue if result_queue is not None else self.result_queue
+
+        if handler is None:
+            results.put(("command_result", CommandResult(
+                name, "unhandled", f"Command '{name}' not yet implemented", 0.0, params)))
+            return None
+
+        # Exactly one result is reported: completion or timeout, whichever comes first
+        reported = threading.Lock()
+        timeout = self._timeouts.get(name, self.default_timeout)
+
+        def run():
+            # The timeout covers the handler itself, not time spent queued behind busy workers
+            started = time.monotonic()
+
+            def report(status, message):
+                if reported.acquire(blocking=False):
+                    results.put(("command_result", CommandResult(
+                        name, status, message, time.monotonic() - started, params)))
+
+            timer = threading.Timer(timeout, report, args=("timeout", f"Command '{name}' timed out after {timeout:.0f}s"))
+            timer.daemon = True
+            timer.start()
+            try:
+                with tracer.span(f"command:{name}", "command"):
+                    message = handler(command)
+                report("ok", message or f"Command '{name}' completed")
+            except Exception as e:
+                report("error", f"Command '{name}' failed: {e}")
+            finally:
+                timer.cancel()
+
+        return self._executor.submit(in_current_take(run))
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting commands and release the worker pool"""
+        self._executor.shutdown(wait=wait)
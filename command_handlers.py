@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Built-in Voice Command Handlers for metaVoice
+Handlers run on the CommandDispatcher worker pool, never on the Tk thread
+"""
+
+from typing import Any, Dict, Optional
+
+from command_dispatcher import CommandDispatcher
+
+
+def make_meeting_handlers(meeting_recorder):
+    """Create start/stop handlers bound to a MeetingRecorder"""
+    def handle_record_meeting(command: Dict[str, Any]) -> str:
+        if meeting_recorder.is_recording:
+            return f"📹 Meeting already recording to {meeting_recorder.meeting_dir}"
+        previous = ""
+        if meeting_recorder.has_session:
+            # Capture died without a stop: keep what was recorded before starting over
+            previous = f"; previous transcript saved to {meeting_recorder.stop()}"
+        meeting_dir = meeting_recorder.start()
+        return f"📹 Meeting recording started ({meeting_dir}){previous}"
+
+    def handle_stop_meeting(command: Dict[str, Any]) -> str:
+        # A session whose capture already died still has segments to transcribe
+        if not meeting_recorder.has_session:
+            return "📹 No meeting is being recorded"
+        error = meeting_recorder.capture_error
+        transcript_path = meeting_recorder.stop()
+        if error:
+            return f"📹 Meeting transcript ready: {transcript_path} (recording stopped early: {error})"
+        return f"📹 Meeting transcript ready: {transcript_path}"
+
+    return handle_record_meeting, handle_stop_meeting
+
+
+def register_default_handlers(dispatcher: CommandDispatcher, meeting_recorder: Optional[Any] = None):
+    """
+    Register metaVoice's built-in command handlers
+
+    build-app has no handler: app building is not supported, so the dispatcher
+    reports it as unhandled instead of claiming it started.
+
+    Args:
+        dispatcher: Dispatcher receiving the handlers
+        meeting_recorder: MeetingRecorder backing record-meeting/stop-meeting
+    """
+    if meeting_recorder is not None:
+        handle_record_meeting, handle_stop_meeting = make_meeting_handlers(meeting_recorder)
+        dispatcher.register("record-meeting", handle_record_meeting)
+        # Stopping waits for the last segment to be transcribed
+        dispatcher.register("stop-meeting", handle_stop_meeting, timeout=900.0)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Voice Command Registry for metaVoice
+Registers commands, keywords and parameter grammars once and compiles them
+into a single Aho-Corasick automaton that scores every command in one pass,
+with an n-gram index as fallback for near-miss transcriptions
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from fuzzy_matcher import NGramIndex, normalize_tokens
+
+# Roles a registered phrase can play for a command
+KEYWORD = "keyword"
+CONTEXT = "context"
+PARAMETER = "parameter"
+
+
+@dataclass
+class CommandSpec:
+    """A registered voice command"""
+    name: str
+    keywords: List[str]
+    context_keywords: List[str] = field(default_factory=list)
+    parameters: Dict[str, List[str]] = field(default_factory=dict)
+    phrases: List[str] = field(default_factory=list)
+    weight: float = 1.0
+    require_context: bool = False
+    order: int = 0
+
+    def fuzzy_phrases(self) -> List[str]:
+        """Phrases indexed for approximate matching"""
+        if self.context_keywords:
+            derived = [f"{k} {c}" for k in self.keywords for c in self.context_keywords]
+        else:
+            derived = list(self.keywords)
+        return self.phrases + [p for p in derived if p not in self.phrases]
+
+
+@dataclass
+class CommandMatch:
+    """A scored candidate produced by CommandRegistry.match"""
+    command: str
+    score: float
+    keywords: List[str] = field(default_factory=list)
+    context_keywords: List[str] = field(default_factory=list)
+
+
+class _Automaton:
+    """Aho-Corasick automaton over lowercase phrases"""
+
+    def __init__(self, phrases: Sequence[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+        self.phrases = list(phrases)
+
+        for phrase_id, phrase in enumerate(self.phrases):
+            node = 0
+            for char in phrase:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[node][char] = next_node
+                node = next_node
+            self.output[node].append(phrase_id)
+
+        # Breadth-first pass to wire failure links and merge outputs
+        pending = deque(self.goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self.goto[node].items():
+                pending.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def iter_matches(self, text: str):
+        """Yield (phrase_id, start, end) for every phrase occurrence in text"""
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            for phrase_id in self.output[node]:
+                end = index + 1
+                yield phrase_id, end - len(self.phrases[phrase_id]), end
+
+
+def _is_word_bounded(text: str, phrase: str, start: int, end: int) -> bool:
+    """Check that a phrase match does not start or end inside a word"""
+    if phrase[0].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if phrase[-1].isalnum() and end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+class CommandRegistry:
+    def __init__(self, fuzzy_threshold: float = 0.6, fuzzy_override_threshold: float = 0.8,
+                 fuzzy_max_tokens: int = 8):
+        """
+        Initialize an empty command registry
+
+        Args:
+            fuzzy_threshold: Minimum n-gram similarity for an approximate match
+            fuzzy_override_threshold: Similarity needed to overrule a keyword-only exact match
+            fuzzy_max_tokens: Longer utterances are treated as dictation, never fuzzy-matched
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self.fuzzy_override_threshold = fuzzy_override_threshold
+        self.fuzzy_max_tokens = fuzzy_max_tokens
+        self._commands: Dict[str, CommandSpec] = {}
+        self._global_parameters: Dict[str, List[str]] = {}
+        self._automaton: Optional[_Automaton] = None
+        self._fuzzy_index: Optional[NGramIndex] = None
+        # phrase -> list of (role, command name or None, extra)
+        self._phrase_roles: List[List[Tuple[str, Optional[str], str]]] = []
+
+    def register(self, name: str, keywords: Sequence[str],
+                 context_keywords: Sequence[str] = (),
+                 parameters: Optional[Dict[str, Sequence[str]]] = None,
+                 phrases: Sequence[str] = (),
+                 weight: float = 1.0,
+                 require_context: bool = False) -> CommandSpec:
+        """
+        Register a voice command
+
+        Args:
+            name: Command name returned by parse (e.g. "build-app")
+            keywords: Trigger phrases; at least one must be heard
+            context_keywords: Phrases that make this command more likely
+            parameters: Command-specific parameter markers, e.g. {"type": ["type:"]}
+            phrases: Canonical phrasings for approximate matching (keyword + context pairs are added automatically)
+            weight: Multiplier applied to the command's score
+            require_context: Only match when a context keyword is heard too
+
+        Returns:
+            The registered command spec
+        """
+        if not keywords:
+            raise ValueError(f"Command '{name}' needs at least one keyword")
+
+        spec = CommandSpec(
+            name=name,
+            keywords=[k.lower().strip() for k in keywords],
+            context_keywords=[k.lower().strip() for k in context_keywords],
+            parameters={p: [m.lower() for m in markers] for p, markers in (parameters or {}).items()},
+            phrases=[p.lower().strip() for p in phrases],
+            weight=weight,
+            require_context=require_context,
+            order=self._commands[name].order if name in self._commands else len(self._commands)
+        )
+        self._commands[name] = spec
+        self._automaton = None
+        return spec
+
+    def register_parameter(self, name: str, markers: Sequence[str]):
+        """
+        Register a parameter grammar shared by every command
+
+        Args:
+            name: Parameter name (e.g. "type")
+            markers: Phrases that introduce the value (e.g. ["type:"])
+        """
+        self._global_parameters[name] = [m.lower() for m in markers]
+        self._automaton = None
+
+    @property
+    def commands(self) -> List[CommandSpec]:
+        """Registered commands in registration order"""
+        return sorted(self._commands.values(), key=lambda spec: spec.order)
+
+    def compile(self):
+        """Compile all registered phrases into one automaton and one n-gram index"""
+        roles: Dict[str, List[Tuple[str, Optional[str], str]]] = {}
+
+        for spec in self._commands.values():
+            for keyword in spec.keywords:
+                roles.setdefault(keyword, []).append((KEYWORD, spec.name, keyword))
+            for keyword in spec.context_keywords:
+                roles.setdefault(keyword, []).append((CONTEXT, spec.name, keyword))
+            for param, markers in spec.parameters.items():
+                for marker in markers:
+                    roles.setdefault(marker, []).append((PARAMETER, spec.name, param))
+
+        for param, markers in self._global_parameters.items():
+            for marker in markers:
+                roles.setdefault(marker, []).append((PARAMETER, None, param))
+
+        phrases = list(roles.keys())
+        self._phrase_roles = [roles[phrase] for phrase in phrases]
+        self._automaton = _Automaton(phrases)
+
+        # Approximate matches must still hear (something close to) a keyword, and a
+        # context word when the command requires one, as exact matches do
+        self._fuzzy_index = NGramIndex()
+        for spec in self.commands:
+            anchors = [[t for k in spec.keywords for t in normalize_tokens(k)]]
+            if spec.require_context:
+                anchors.append([t for k in spec.context_keywords for t in normalize_tokens(k)])
+            for phrase in spec.fuzzy_phrases():
+                self._fuzzy_index.add(phrase, spec.name, anchors)
+
+    def _scan(self, text: str):
+        """Single pass over text collecting candidates and parameter markers"""
+        if self._automaton is None:
+            self.compile()
+
+        candidates: Dict[str, CommandMatch] = {}
+        markers: List[Tuple[int, int, Optional[str], str]] = []
+
+        for phrase_id, start, end in self._automaton.iter_matches(text):
+            phrase = self._automaton.phrases[phrase_id]
+            if not _is_word_bounded(text, phrase, start, end):
+                continue
+            for role, command, extra in self._phrase_roles[phrase_id]:
+                if role == PARAMETER:
+                    markers.append((start, end, command, extra))
+                    continue
+                match = candidates.get(command)
+                if match is None:
+                    match = candidates[command] = CommandMatch(command=command, score=0.0)
+                hits = match.keywords if role == KEYWORD else match.context_keywords
+                if extra not in hits:
+                    hits.append(extra)
+
+        return candidates, markers
+
+    def _rank(self, candidates: Dict[str, CommandMatch]) -> List[CommandMatch]:
+        """Score candidates that heard at least one keyword, best first"""
+        matches = []
+        for match in candidates.values():
+            spec = self._commands[match.command]
+            if not match.keywords or (spec.require_context and not match.context_keywords):
+                continue
+            match.score = (len(match.keywords) + len(match.context_keywords)) * spec.weight
+            matches.append(match)
+
+        # Ties go to the command registered first
+        matches.sort(key=lambda m: (-m.score, self._commands[m.command].order))
+        return matches
+
+    def match(self, text: str) -> List[CommandMatch]:
+        """
+        Score every registered command against the text
+
+        Args:
+            text: Transcribed text
+
+        Returns:
+            Candidates that heard at least one keyword, best first
+        """
+        candidates, _ = self._scan(text.lower())
+        return self._rank(candidates)
+
+    def fuzzy_match(self, text: str) -> Optional[CommandMatch]:
+        """
+        Approximate match against registered command phrases
+
+        Args:
+            text: Transcribed text
+
+        Returns:
+            Best match above fuzzy_threshold, or None
+        """
+        if self._automaton is None:
+            self.compile()
+
+        match = self._fuzzy_index.best_match(text, self.fuzzy_threshold, self.fuzzy_max_tokens)
+        if match is None:
+            return None
+        return CommandMatch(command=match.payload, score=match.score, keywords=[match.phrase])
+
+    def _extract_parameters(self, text: str, markers, command: str) -> Dict[str, str]:
+        """Read the word following the first marker of each parameter"""
+        params = {}
+        for start, end, owner, param in sorted(markers):
+            if owner not in (None, command) or param in params:
+                continue
+            value_start = end
+            while value_start < len(text) and text[value_start] == " ":
+                value_start += 1
+            value_end = text.find(" ", value_start)
+            if value_end == -1:
+                value_end = len(text)
+            params[param] = text[value_start:value_end].strip()
+        return params
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """
+        Parse transcribed text as a structured command
+
+        Args:
+            text: Transcribed text
+
+        Returns:
+            Dictionary with command, parameters, original_text, score and
+            match ("exact", "fuzzy" or "none")
+        """
+        text = text.lower().strip()
+        candidates, markers = self._scan(text)
+        ranked = self._rank(candidates)
+        best = ranked[0] if ranked else None
+        match_type = "exact"
+
+        # A bare keyword with none of its context words is weak evidence;
+        # a close approximate match ("create compo nent") should beat it
+        weak = best is not None and not best.context_keywords and self._commands[best.command].context_keywords
+        if best is None or weak:
+            fuzzy = self.fuzzy_match(text)
+            if fuzzy is not None and (not weak or fuzzy.score >= self.fuzzy_override_threshold):
+                best = fuzzy
+                match_type = "fuzzy"
+
+        if best is None:
+            return {
+                "command": "unknown",
+                "parameters": {},
+                "original_text": text,
+                "score": 0.0,
+                "match": "none"
+            }
+
+        return {
+            "command": best.command,
+            "parameters": self._extract_parameters(text, markers, best.command),
+            "original_text": text,
+            "score": best.score,
+            "match": match_type
+        }
+
+
+def build_default_registry() -> CommandRegistry:
+    """Create the registry with metaVoice's built-in commands"""
+    registry = CommandRegistry()
+    registry.register(
+        "build-app",
+        keywords=["build", "create", "make", "new"],
+        context_keywords=["app", "application", "project"]
+    )
+    registry.register(
+        "record-meeting",
+        keywords=["record", "start recording", "begin recording"],
+        context_keywords=["meeting", "call", "zoom", "teams"]
+    )
+    registry.register(
+        "stop-meeting",
+        keywords=["stop", "end", "finish"],
+        context_keywords=["meeting", "meeting recording"],
+        require_context=True
+    )
+    registry.register(
+        "analyze-meeting",
+        keywords=["analyze", "transcribe", "summarize"],
+        context_keywords=["meeting", "recording", "call"]
+    )
+    registry.register(
+        "create-component",
+        keywords=["create", "make", "build"],
+        context_keywords=["component", "button", "input", "form"]
+    )
+    registry.register_parameter("type", ["type:"])
+    registry.register_parameter("name", ["name:"])
+    registry.compile()
+    return registry
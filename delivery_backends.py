@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Text Delivery Backends for metaVoice
+The platform operations delivery is built from (focus, frontmost, clipboard,
+paste, type), with implementations for macOS, X11 and an in-memory recorder
+for headless tests and benchmarks
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from automation_helper import AutomationHelperError, AutomationHelperUnavailable
+from delivery_profiles import split_keystroke
+from readiness import wait_until
+
+# (frontmost app, focus wait, clipboard wait) from one delivery; a wait is seconds,
+# None if its budget ran out, or False if it was not measured
+DeliveryOutcome = Tuple[str, object, object]
+
+
+# Presses a key with modifiers given by name, e.g. ("v", "command,shift")
+KEYSTROKE_HANDLER = '''
+on pressKeystroke(theKey, modifierNames)
+    tell application "System Events"
+        set mods to {}
+        if modifierNames contains "command" then set end of mods to command down
+        if modifierNames contains "shift" then set end of mods to shift down
+        if modifierNames contains "option" then set end of mods to option down
+        if modifierNames contains "control" then set end of mods to control down
+        keystroke theKey using mods
+    end tell
+end pressKeystroke
+'''
+
+KEYSTROKE_SCRIPT = '''
+on run argv
+    my pressKeystroke(item 1 of argv, item 2 of argv)
+end run
+''' + KEYSTROKE_HANDLER
+
+# Types one chunk of text; the text arrives via argv so nothing needs escaping
+TYPE_CHUNK_SCRIPT = '''
+on run argv
+    tell application "System Events"
+        keystroke (item 1 of argv)
+    end tell
+end run
+'''
+
+# Presses Delete (backspace) the number of times given in argv
+DELETE_BACKWARD_SCRIPT = '''
+on run argv
+    tell application "System Events"
+        repeat ((item 1 of argv) as integer) times
+            key code 51
+        end repeat
+    end tell
+end run
+'''
+
+# Focus, clipboard set and paste in one osascript run. Text, target, wait
+# budgets and the paste shortcut arrive via argv, so nothing needs escaping;
+# readiness is polled inside the script with exponential backoff. Replies
+# "frontmost|focusMs|clipboardMs", where a wait of -1 means its budget ran out.
+DELIVERY_SCRIPT = '''
+on run argv
+    set theText to item 1 of argv
+    set targetApp to item 2 of argv
+    set focusBudget to (item 3 of argv) as real
+    set clipboardBudget to (item 4 of argv) as real
+    set pasteKey to item 5 of argv
+    set pasteModifiers to item 6 of argv
+    set focusWait to 0
+    if targetApp is not "" then
+        tell application targetApp to activate
+        set focusWait to my waitUntilFrontmost(targetApp, focusBudget)
+    end if
+    set the clipboard to theText
+    set clipboardWait to my waitUntilClipboard(theText, clipboardBudget)
+    my pressKeystroke(pasteKey, pasteModifiers)
+    tell application "System Events"
+        set frontName to name of first application process whose frontmost is true
+    end tell
+    return frontName & "|" & my toMillis(focusWait) & "|" & my toMillis(clipboardWait)
+end run
+
+on waitUntilFrontmost(targetApp, budget)
+    set waited to 0
+    set pause to 0.01
+    repeat
+        try
+            if frontmost of application targetApp then return waited
+        end try
+        if waited >= budget then return -1
+        delay pause
+        set waited to waited + pause
+        if pause < 0.1 then set pause to pause * 2
+    end repeat
+end waitUntilFrontmost
+
+on waitUntilClipboard(theText, budget)
+    set waited to 0
+    set pause to 0.01
+    repeat
+        try
+            if (the clipboard as text) is theText then return waited
+        end try
+        if waited >= budget then return -1
+        delay pause
+        set waited to waited + pause
+        if pause < 0.1 then set pause to pause * 2
+    end repeat
+end waitUntilClipboard
+
+on toMillis(seconds)
+    if seconds < 0 then return "-1"
+    return (round (seconds * 1000)) as integer as text
+end toMillis
+''' + KEYSTROKE_HANDLER
+
+
+class InterruptedRun(subprocess.CompletedProcess):
+    """Failed result of a script the helper may have partly carried out before it crashed or timed out"""
+
+
+class DeliveryInterrupted(Exception):
+    """Input may already have reached the target; retrying could insert it twice"""
+
+
+def run_applescript(helper, script: str, *args: str) -> subprocess.CompletedProcess:
+    """
+    Run an AppleScript via the automation helper, falling back to an osascript launch
+
+    Only a request that never reached the helper is re-run with osascript. If the
+    helper crashed or timed out while running the script, it may already have
+    pasted or typed, so the run is reported as failed rather than repeated.
+
+    Args:
+        helper: AutomationHelperClient, or None to always launch osascript
+        script: AppleScript source
+        args: Values passed to the script's `on run argv` handler
+
+    Returns:
+        CompletedProcess with returncode, stdout and stderr
+    """
+    if helper is not None:
+        try:
+            return helper.run_script(script, *args)
+        except AutomationHelperUnavailable as e:
+            print(f"⚠️ Automation helper unavailable ({e}), using osascript")
+        except AutomationHelperError as e:
+            print(f"❌ Automation helper failed mid-script ({e}); not re-running it")
+            return InterruptedRun(['automation-helper', 'run_script', *args], 1, "", str(e))
+    return subprocess.run(['osascript', '-e', script, *args], capture_output=True, text=True)
+
+
+class DeliveryBackend:
+    """Platform operations used by TextInputAutomation; subclasses implement them"""
+
+    name = "base"
+
+    def focus(self, app_name: str) -> bool:
+        """Bring an application to the front"""
+        raise NotImplementedError
+
+    def frontmost(self) -> Optional[Dict]:
+        """{"name", "bundle_id", "pid"} of the frontmost application, or None"""
+        raise NotImplementedError
+
+    def is_frontmost(self, app_name: str) -> bool:
+        info = self.frontmost()
+        return bool(info) and info.get("name", "").lower() == app_name.lower()
+
+    def set_clipboard(self, text: str) -> bool:
+        raise NotImplementedError
+
+    def get_clipboard(self) -> Optional[str]:
+        raise NotImplementedError
+
+    def paste(self, keystroke: str = "command+v") -> bool:
+        """Press the paste shortcut in the frontmost application"""
+        raise NotImplementedError
+
+    def type_text(self, text: str) -> bool:
+        """Type text as keystrokes into the frontmost application"""
+        raise NotImplementedError
+
+    def delete_backward(self, count: int) -> bool:
+        """Press backspace count times"""
+        raise NotImplementedError
+
+    def deliver(self, text: str, app_name: str, focus_budget: float, clipboard_budget: float,
+                keystroke: str = "command+v") -> Optional[DeliveryOutcome]:
+        """
+        Focus (unless app_name is ""), set the clipboard and paste
+
+        Backends that can do this in one round trip override it.
+
+        Returns:
+            DeliveryOutcome, or None if a step failed
+        """
+        focus_wait = False
+        if app_name:
+            if not self.focus(app_name):
+                return None
+            focus_wait = wait_until(lambda: self.is_frontmost(app_name), focus_budget)
+        if not self.set_clipboard(text):
+            return None
+        clipboard_wait = wait_until(lambda: self.get_clipboard() == text, clipboard_budget)
+        if not self.paste(keystroke):
+            return None
+        info = self.frontmost() or {}
+        return info.get("name", ""), focus_wait, clipboard_wait
+
+    def close(self):
+        """Release backend resources"""
+
+
+class MacOSBackend(DeliveryBackend):
+    name = "macos"
+
+    def __init__(self, helper=None):
+        """
+        Args:
+            helper: Long-lived AutomationHelperClient; None launches osascript per script
+        """
+        self.helper = helper
+
+    def run_script(self, script: str, *args: str) -> subprocess.CompletedProcess:
+        return run_applescript(self.helper, script, *args)
+
+    def _ok(self, action: str, result: subprocess.CompletedProcess) -> bool:
+        if isinstance(result, InterruptedRun):
+            raise DeliveryInterrupted(f"{action} was interrupted: {result.stderr.strip()}")
+        if result.returncode != 0:
+            print(f"❌ {action} failed: {result.stderr.strip()}")
+        return result.returncode == 0
+
+    def focus(self, app_name: str) -> bool:
+        result = self.run_script('on run argv\n tell application (item 1 of argv) to activate\nend run', app_name)
+        return self._ok(f"Focusing {app_name}", result)
+
+    def frontmost(self) -> Optional[Dict]:
+        if self.helper is not None:
+            try:
+                return self.helper.frontmost()
+            except AutomationHelperError:
+                pass
+        # Name, bundle identifier and pid in a single osascript run
+        script = '''
+        tell application "System Events"
+            set frontApp to first application process whose frontmost is true
+            return (name of frontApp) & "|" & (bundle identifier of frontApp) & "|" & (unix id of frontApp)
+        end tell
+        '''
+        result = self.run_script(script)
+        if not self._ok("Getting frontmost app", result):
+            return None
+        name, _, rest = result.stdout.strip().partition("|")
+        bundle_id, _, pid = rest.partition("|")
+        return {"name": name, "bundle_id": bundle_id, "pid": int(pid) if pid.isdigit() else None}
+
+    def is_frontmost(self, app_name: str) -> bool:
+        if self.helper is not None:
+            return super().is_frontmost(app_name)
+        result = self.run_script('on run argv\n return frontmost of application (item 1 of argv)\nend run', app_name)
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
+    def set_clipboard(self, text: str) -> bool:
+        if self.helper is not None:
+            try:
+                return self.helper.set_clipboard(text)
+            except AutomationHelperError:
+                pass
+        try:
+            result = subprocess.run(['pbcopy'], input=text, text=True, capture_output=True)
+        except OSError as e:
+            print(f"❌ pbcopy error: {e}")
+            return False
+        return self._ok("pbcopy", result)
+
+    def get_clipboard(self) -> Optional[str]:
+        if self.helper is not None:
+            try:
+                return self.helper.get_clipboard()
+            except AutomationHelperError:
+                pass
+        try:
+            result = subprocess.run(['pbpaste'], capture_output=True, text=True)
+        except OSError:
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def paste(self, keystroke: str = "command+v") -> bool:
+        key, modifiers = split_keystroke(keystroke)
+        return self._ok("Paste", self.run_script(KEYSTROKE_SCRIPT, key, ",".join(modifiers)))
+
+    def type_text(self, text: str) -> bool:
+        return self._ok("Typing", self.run_script(TYPE_CHUNK_SCRIPT, text))
+
+    def delete_backward(self, count: int) -> bool:
+        return self._ok("Backspace", self.run_script(DELETE_BACKWARD_SCRIPT, str(count)))
+
+    def deliver(self, text: str, app_name: str, focus_budget: float, clipboard_budget: float,
+                keystroke: str = "command+v") -> Optional[DeliveryOutcome]:
+        key, modifiers = split_keystroke(keystroke)
+        result = self.run_script(DELIVERY_SCRIPT, text, app_name, f"{focus_budget:.3f}",
+                                 f"{clipboard_budget:.3f}", key, ",".join(modifiers))
+        if not self._ok("Single-script delivery", result):
+            return None
+        return self.parse_delivery_reply(result.stdout)
+
+    @staticmethod
+    def parse_delivery_reply(reply: str) -> DeliveryOutcome:
+        """
+        Split a DELIVERY_SCRIPT reply into (frontmost, focus wait, clipboard wait)
+
+        Waits are seconds, None for a timeout, or False if the reply did not include them.
+        """
+        parts = reply.strip().split("|")
+        waits = []
+        for raw in parts[1:3]:
+            try:
+                millis = int(raw)
+            except ValueError:
+                waits.append(False)
+                continue
+            waits.append(None if millis < 0 else millis / 1000.0)
+        waits += [False] * (2 - len(waits))
+        return parts[0], waits[0], waits[1]
+
+    def close(self):
+        if self.helper is not None:
+            self.helper.close()
+
+
+class X11Backend(DeliveryBackend):
+    name = "x11"
+
+    # Modifier names as xdotool spells them; Command maps to Ctrl on Linux
+    XDOTOOL_MODIFIERS = {"command": "ctrl", "control": "ctrl", "option": "alt", "shift": "shift"}
+
+    def __init__(self, type_delay_ms: int = 5):
+        """
+        Args:
+            type_delay_ms: Delay xdotool leaves between typed characters
+        """
+        self.type_delay_ms = type_delay_ms
+
+    def _run(self, *args: str, **kwargs) -> Optional[subprocess.CompletedProcess]:
+        try:
+            return subprocess.run(list(args), text=True, **kwargs)
+        except OSError as e:
+            print(f"❌ {args[0]} error: {e}")
+            return None
+
+    def _xdotool(self, *args: str) -> bool:
+        result = self._run("xdotool", *args, capture_output=True)
+        if result is None or result.returncode != 0:
+            print(f"❌ xdotool {args[0]} failed: {result.stderr.strip() if result else ''}")
+            return False
+        return True
+
+    def focus(self, app_name: str) -> bool:
+        for match in ("--class", "--name"):
+            result = self._run("xdotool", "search", "--onlyvisible", match, app_name, capture_output=True)
+            windows = result.stdout.split() if result is not None and result.returncode == 0 else []
+            if windows:
+                return self._xdotool("windowactivate", "--sync", windows[0])
+        print(f"❌ No visible window for {app_name}")
+        return False
+
+    def frontmost(self) -> Optional[Dict]:
+        result = self._run("xdotool", "getactivewindow", "getwindowclassname", "getwindowpid",
+                           capture_output=True)
+        if result is None or result.returncode != 0:
+            return None
+        lines = result.stdout.splitlines()
+        pid = lines[1].strip() if len(lines) > 1 else ""
+        return {"name": lines[0].strip() if lines else "", "bundle_id": "",
+                "pid": int(pid) if pid.isdigit() else None}
+
+    def is_frontmost(self, app_name: str) -> bool:
+        # WM_CLASS names rarely match display names exactly ("code" vs "Visual Studio Code")
+        info = self.frontmost()
+        if not info or not info["name"]:
+            return False
+        name, wanted = info["name"].lower(), app_name.lower()
+        return name in wanted or wanted in name
+
+    def set_clipboard(self, text: str) -> bool:
+        # xclip keeps serving the selection in a forked child, so its output must not be piped
+        result = self._run("xclip", "-selection", "clipboard", "-i", input=text,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result is not None and result.returncode == 0
+
+    def get_clipboard(self) -> Optional[str]:
+        result = self._run("xclip", "-selection", "clipboard", "-o", capture_output=True)
+        return result.stdout if result is not None and result.returncode == 0 else None
+
+    def paste(self, keystroke: str = "command+v") -> bool:
+        key, modifiers = split_keystroke(keystroke)
+        return self._xdotool("key", "+".join([self.XDOTOOL_MODIFIERS.get(m, m) for m in modifiers] + [key]))
+
+    def type_text(self, text: str) -> bool:
+        return self._xdotool("type", "--delay", str(self.type_delay_ms), "--", text)
+
+    def delete_backward(self, count: int) -> bool:
+        return self._xdotool("key", "--repeat", str(count), "BackSpace")
+
+
+class RecordingBackend(DeliveryBackend):
+    name = "recording"
+
+    def __init__(self, frontmost: str = "Terminal", focus_delay: float = 0.0,
+                 clipboard_delay: float = 0.0, keystroke_delay: float = 0.0):
+        """
+        In-memory desktop: each app has a text document, and every call is logged
+
+        Args:
+            frontmost: Application that starts out frontmost
+            focus_delay: Seconds before a focused app reports frontmost
+            clipboard_delay: Seconds before a clipboard write becomes readable
+            keystroke_delay: Seconds per typed character
+        """
+        self.frontmost_app = frontmost
+        self.focus_delay = focus_delay
+        self.clipboard_delay = clipboard_delay
+        self.keystroke_delay = keystroke_delay
+        self.documents: Dict[str, str] = {}
+        self.clipboard = ""
+        self.events: List[Tuple[float, str, str]] = []
+        self.failing: set = set()  # Operation names that should fail
+        self._focus_pending: Optional[Tuple[str, float]] = None
+        self._clipboard_pending: Optional[Tuple[str, float]] = None
+
+    def _log(self, action: str, detail: str = "") -> bool:
+        self.events.append((time.monotonic(), action, detail))
+        return action not in self.failing
+
+    def _settle(self):
+        now = time.monotonic()
+        if self._focus_pending and now >= self._focus_pending[1]:
+            self.frontmost_app = self._focus_pending[0]
+            self._focus_pending = None
+        if self._clipboard_pending and now >= self._clipboard_pending[1]:
+            self.clipboard = self._clipboard_pending[0]
+            self._clipboard_pending = None
+
+    def actions(self) -> List[str]:
+        """Logged action names, in order"""
+        return [action for _, action, _ in self.events]
+
+    def focus(self, app_name: str) -> bool:
+        if not self._log("focus", app_name):
+            return False
+        self._focus_pending = (app_name, time.monotonic() + self.focus_delay)
+        return True
+
+    def frontmost(self) -> Optional[Dict]:
+        self._settle()
+        return {"name": self.frontmost_app, "bundle_id": "", "pid": None}
+
+    def set_clipboard(self, text: str) -> bool:
+        if not self._log("set_clipboard", text):
+            return False
+        self._clipboard_pending = (text, time.monotonic() + self.clipboard_delay)
+        return True
+
+    def get_clipboard(self) -> Optional[str]:
+        self._settle()
+        return self.clipboard
+
+    def paste(self, keystroke: str = "command+v") -> bool:
+        if not self._log("paste", keystroke):
+            return False
+        self._settle()
+        self.documents[self.frontmost_app] = self.documents.get(self.frontmost_app, "") + self.clipboard
+        return True
+
+    def type_text(self, text: str) -> bool:
+        if not self._log("type", text):
+            return False
+        time.sleep(self.keystroke_delay * len(text))
+        self._settle()
+        self.documents[self.frontmost_app] = self.documents.get(self.frontmost_app, "") + text
+        return True
+
+    def delete_backward(self, count: int) -> bool:
+        if not self._log("delete_backward", str(count)):
+            return False
+        self._settle()
+        document = self.documents.get(self.frontmost_app, "")
+        self.documents[self.frontmost_app] = document[:max(0, len(document) - count)]
+        return True
+
+
+def default_backend(helper=None) -> DeliveryBackend:
+    """
+    Pick the delivery backend for this machine
+
+    METAVOICE_DELIVERY_BACKEND ("macos", "x11" or "recording") overrides the choice.
+
+    Args:
+        helper: Automation helper for the macOS backend
+    """
+    choice = os.environ.get("METAVOICE_DELIVERY_BACKEND", "").lower()
+    if choice == "recording":
+        return RecordingBackend()
+    if choice == "x11" or (not choice and sys.platform.startswith("linux")
+                           and os.environ.get("DISPLAY") and shutil.which("xdotool")):
+        return X11Backend()
+    return MacOSBackend(helper)
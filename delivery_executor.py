@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Text Delivery Executor for metaVoice
+Runs focus, copy and paste on a worker thread so the Tk main loop never
+blocks on automation, and reports progress back through the GUI's update queue
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app_logging import current_take, in_current_take
+import take_timing
+from delivery_profiles import DeliveryReport
+import metrics
+from session_trace import tracer
+
+
+class DeliveryExecutor:
+    def __init__(self, automation, result_queue=None, prefocus_timeout: float = 2.0):
+        """
+        Initialize the executor
+
+        Args:
+            automation: TextInputAutomation used for delivery
+            result_queue: Default queue receiving ("delivery_progress", message) and
+                          ("delivery_result", DeliveryReport) tuples (each submit may name its own)
+            prefocus_timeout: Seconds to wait for a prefocus started during decoding
+        """
+        self.automation = automation
+        self.result_queue = result_queue
+        self.prefocus_timeout = prefocus_timeout
+        # One worker keeps deliveries in the order they were spoken
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="metavoice-delivery")
+
+    def submit(self, text: str, target_app: str, method: str,
+               prefocus: Optional[Future] = None, result_queue=None) -> Future:
+        """
+        Queue a delivery
+
+        Args:
+            text: Text to insert
+            target_app: Target key or application name
+            method: Input method ("auto", "clipboard", "direct")
+            prefocus: Future from prefocus_async, resolved on the worker
+            result_queue: Queue for this delivery's progress and result (defaults to the executor's)
+
+        Returns:
+            Future resolving to the DeliveryReport
+        """
+        results = result_queue if result_queue is not None else self.result_queue
+        results.put(("delivery_progress", f"⏳ Queued {len(text)} chars for {target_app}"))
+        metrics.DELIVERY_QUEUE.inc()
+        return self._executor.submit(in_current_take(self._deliver), text, target_app, method, prefocus,
+                                     time.monotonic(), results)
+
+    def _deliver(self, text: str, target_app: str, method: str, prefocus: Optional[Future],
+                 queued_at: float, results) -> DeliveryReport:
+        started = time.monotonic()
+        take_timing.add_stage("delivery_queue", queued_at, started)
+        try:
+            focused = False
+            if prefocus is not None:
+                try:
+                    with take_timing.stage("prefocus_wait"):
+                        focused = prefocus.result(timeout=self.prefocus_timeout)
+                except Exception as e:
+                    print(f"⚠️ Prefocus did not finish: {e}")
+            results.put(("delivery_progress", "📋 Delivering text..."))
+
+            success = self.automation.auto_input_text(text, target_app, method, focused=focused)
+            report = self.automation.last_report
+            if report is None or report.chars != len(text):
+                report = DeliveryReport("", method, len(text), (time.monotonic() - started) * 1000, success,
+                                        current_take.get())
+        except Exception as e:
+            print(f"❌ Delivery error: {e}")
+            report = DeliveryReport("", method, len(text), (time.monotonic() - started) * 1000, False,
+                                    current_take.get())
+
+        metrics.DELIVERY_QUEUE.dec()
+        self._record_metrics(report)
+        tracer.complete("deliver", started, cat="delivery",
+                        args={"app": report.app, "method": report.method, "chars": report.chars,
+                              "success": report.success})
+        results.put(("delivery_result", report))
+        return report
+
+    def _record_metrics(self, report: DeliveryReport):
+        if not report.success:
+            metrics.DELIVERY_FAILURES.inc()
+            return
+        metrics.DELIVERIES.inc()
+        metrics.INSERTION.observe(report.elapsed_ms / 1000)
+        timeline = take_timing.current_timeline()
+        stop_to_text_ms = timeline.stop_to_text_ms() if timeline is not None else None
+        if stop_to_text_ms is not None:
+            metrics.STOP_TO_TEXT.observe(stop_to_text_ms / 1000)
+
+    def shutdown(self):
+        """Stop accepting deliveries; a delivery in flight finishes in the background"""
+        self._executor.shutdown(wait=False)
+
+
+class ResponsivenessProbe:
+    def __init__(self, schedule: Callable, interval_ms: int = 20):
+        """
+        Measure how long the UI thread goes without servicing its event loop
+
+        Args:
+            schedule: The UI's after(ms, callback) (e.g. root.after)
+            interval_ms: Tick interval; a tick arriving late means the loop was blocked
+        """
+        self.schedule = schedule
+        self.interval_ms = interval_ms
+        self.running = False
+        self.max_stall_ms = 0.0
+        self.ticks = 0
+        self._last = 0.0
+        self._generation = 0  # Ticks left over from an earlier run stop themselves
+
+    def start(self):
+        """Begin ticking (call on the UI thread)"""
+        if self.running:
+            return
+        self.running = True
+        self.max_stall_ms = 0.0
+        self.ticks = 0
+        self._last = time.monotonic()
+        self._generation += 1
+        self.schedule(self.interval_ms, self._tick, self._generation)
+
+    def _tick(self, generation: int):
+        if not self.running or generation != self._generation:
+            return
+        now = time.monotonic()
+        stall_ms = (now - self._last) * 1000 - self.interval_ms
+        if stall_ms > self.interval_ms:
+            # The loop was blocked for more than a tick: show it on the UI thread's track
+            tracer.complete("ui_stall", self._last + self.interval_ms / 1000, now, cat="ui",
+                            args={"stall_ms": round(stall_ms, 1)})
+        self.max_stall_ms = max(self.max_stall_ms, stall_ms)
+        self._last = now
+        self.ticks += 1
+        self.schedule(self.interval_ms, self._tick, generation)
+
+    def stop(self) -> float:
+        """
+        Stop ticking
+
+        Returns:
+            Longest stall beyond the tick interval, in milliseconds
+        """
+        self.running = False
+        # Count the time since the last tick too
+        stall = (time.monotonic() - self._last) * 1000 - self.interval_ms
+        self.max_stall_ms = max(self.max_stall_ms, stall)
+        return self.max_stall_ms
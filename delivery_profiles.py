@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Delivery Profiles for metaVoice
+Per-application settings for how text is inserted (input method, focus strategy,
+wait budget, paste keystroke), learned from the outcome of past insertions
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+from app_paths import get_data_dir
+
+INPUT_METHODS = ("clipboard", "direct")
+# "activate" brings the app to the front by name; "none" inputs into whatever is frontmost
+FOCUS_STRATEGIES = ("activate", "none")
+MODIFIER_ALIASES = {"cmd": "command", "alt": "option", "ctrl": "control"}
+
+
+def split_keystroke(keystroke: str):
+    """
+    Split a shortcut like "command+shift+v" into its key and modifier names
+
+    Returns:
+        (key, [modifiers]) with modifiers normalized to command/shift/option/control
+    """
+    *modifiers, key = keystroke.lower().split("+")
+    return key, [MODIFIER_ALIASES.get(m, m) for m in modifiers]
+
+
+# Cost model priors until a method has been measured in an app:
+# (fixed overhead ms, ms per character)
+METHOD_COST_PRIORS = {
+    "clipboard": (150.0, 0.0),
+    "direct": (20.0, 6.0)
+}
+
+
+@dataclass
+class MethodStats:
+    """Outcome counters and a latency ~ overhead + per_char * chars fit for one method in one app"""
+    attempts: int = 0
+    successes: int = 0
+    total_ms: float = 0.0
+    # Least-squares sums over successful deliveries
+    total_chars: float = 0.0
+    sum_chars_sq: float = 0.0
+    sum_chars_ms: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.successes if self.successes else float("inf")
+
+    @property
+    def mean_chars(self) -> float:
+        return self.total_chars / self.successes if self.successes else 0.0
+
+    def add(self, success: bool, latency_ms: float, chars: int):
+        self.attempts += 1
+        if success:
+            self.successes += 1
+            self.total_ms += latency_ms
+            self.total_chars += chars
+            self.sum_chars_sq += chars * chars
+            self.sum_chars_ms += chars * latency_ms
+
+    def cost_model(self, prior):
+        """
+        Fit (overhead_ms, per_char_ms) to the measured deliveries
+
+        Falls back to the prior's per-character cost when lengths have not varied
+        enough to separate overhead from throughput.
+        """
+        n = self.successes
+        if n == 0:
+            return prior
+        variance = self.sum_chars_sq - self.total_chars ** 2 / n
+        if n >= 2 and variance > 1e-6:
+            per_char = (self.sum_chars_ms - self.total_chars * self.total_ms / n) / variance
+            per_char = max(0.0, per_char)
+        else:
+            per_char = prior[1]
+        overhead = max(0.0, (self.total_ms - per_char * self.total_chars) / n)
+        return overhead, per_char
+
+    def estimate_ms(self, chars: int, prior) -> float:
+        overhead, per_char = self.cost_model(prior)
+        return overhead + per_char * chars
+
+
+@dataclass
+class DeliveryProfile:
+    """How text is delivered to one application"""
+    key: str
+    app_name: str
+    input_method: str = "clipboard"  # Fallback, and the method used when pinned
+    focus_strategy: str = "activate"
+    wait_budget: Optional[float] = None  # None: learned from readiness history
+    paste_keystroke: str = "command+v"
+    pinned: bool = False  # Hand-edited profiles are not re-tuned
+    stats: Dict[str, MethodStats] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DeliveryProfile":
+        data = dict(data)
+        stats = {method: MethodStats(**values) for method, values in data.pop("stats", {}).items()}
+        return cls(stats=stats, **data)
+
+
+@dataclass
+class DeliveryReport:
+    """Outcome and throughput of one insertion"""
+    app: str
+    method: str
+    chars: int
+    elapsed_ms: float
+    success: bool
+    take_id: Optional[str] = None  # Take the text came from, for its timing record
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / (self.elapsed_ms / 1000.0) if self.elapsed_ms > 0 else 0.0
+
+    def format_line(self) -> str:
+        status = "✅" if self.success else "❌"
+        return (f"{status} {self.chars} chars → {self.app or 'active app'} via {self.method} "
+                f"in {self.elapsed_ms:.0f}ms ({self.chars_per_second:.0f} chars/s)")
+
+    def __str__(self) -> str:
+        # Lets loggers format the line lazily
+        return self.format_line()
+
+
+class DeliveryProfiles:
+    def __init__(self, path: Optional[str] = None, min_attempts: int = 3,
+                 min_success_rate: float = 0.9, explore_every: int = 10, explore_max_chars: int = 40,
+                 save_delay: float = 2.0):
+        """
+        Initialize the profile table
+
+        Args:
+            path: JSON file to persist profiles (defaults to delivery_profiles.json in the app data dir)
+            min_attempts: Attempts before a method's stats are trusted
+            min_success_rate: Success rate a method needs to be chosen
+            explore_every: Every Nth delivery tries an under-sampled method
+            explore_max_chars: Only texts up to this length are used to explore
+            save_delay: Seconds after a change before the file is written, so a burst of
+                        deliveries costs one write (close() writes immediately)
+        """
+        self.path = path or os.path.join(get_data_dir(), "delivery_profiles.json")
+        self.min_attempts = min_attempts
+        self.min_success_rate = min_success_rate
+        self.explore_every = explore_every
+        self.explore_max_chars = explore_max_chars
+        self.save_delay = save_delay
+        self.saves = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._profiles: Dict[str, DeliveryProfile] = {}
+        # Lowercase app name -> profile key, so name-only lookups find bundle-keyed profiles
+        self._names: Dict[str, str] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for values in data.get("profiles", []):
+            try:
+                profile = DeliveryProfile.from_dict(values)
+            except TypeError:
+                continue
+            self._profiles[profile.key] = profile
+            self._names[profile.app_name.lower()] = profile.key
+
+    def _save(self):
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({"profiles": [p.to_dict() for p in self._profiles.values()]}, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self.saves += 1
+        except OSError as e:
+            print(f"⚠️ Could not save delivery profiles: {e}")
+
+    def _schedule_save(self):
+        """Mark the profiles changed and start the save timer (caller holds _lock)"""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes now"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._save()
+
+    def close(self):
+        """Write pending changes before shutdown"""
+        self.flush()
+
+    def get(self, app_name: str, bundle_id: str = "") -> DeliveryProfile:
+        """
+        Look up (or create) the profile for an application
+
+        Args:
+            app_name: Application name
+            bundle_id: Bundle identifier, preferred as the key when known
+
+        Returns:
+            The application's profile
+        """
+        with self._lock:
+            key = bundle_id or self._names.get(app_name.lower()) or app_name.lower()
+            profile = self._profiles.get(key)
+            if profile is None:
+                # A bundle id may arrive for an app first seen by name only
+                name_key = self._names.get(app_name.lower())
+                profile = self._profiles.pop(name_key, None) if name_key else None
+                if profile is not None:
+                    profile.key = key
+                else:
+                    profile = DeliveryProfile(key=key, app_name=app_name)
+                self._profiles[key] = profile
+                self._names[app_name.lower()] = key
+                self._schedule_save()
+            return profile
+
+    def estimate_ms(self, profile: DeliveryProfile, method: str, chars: int) -> float:
+        """Predicted delivery time for a text length with one method"""
+        return profile.stats.get(method, MethodStats()).estimate_ms(chars, METHOD_COST_PRIORS[method])
+
+    def _usable(self, profile: DeliveryProfile):
+        """Methods that are reliable, or not measured enough to tell yet"""
+        usable = []
+        for method in INPUT_METHODS:
+            stats = profile.stats.get(method, MethodStats())
+            if stats.attempts < self.min_attempts or stats.success_rate >= self.min_success_rate:
+                usable.append(method)
+        return usable or [profile.input_method]
+
+    def choose_method(self, profile: DeliveryProfile, text: str) -> str:
+        """
+        Pick the input method for one delivery
+
+        The usable method with the lowest predicted time for this text's length;
+        every explore_every-th short text tries a method not measured enough yet.
+        """
+        if profile.pinned:
+            return profile.input_method
+        with self._lock:
+            deliveries = sum(s.attempts for s in profile.stats.values())
+            if len(text) <= self.explore_max_chars and deliveries % self.explore_every == self.explore_every - 1:
+                for method in INPUT_METHODS:
+                    if method != profile.input_method and \
+                            profile.stats.get(method, MethodStats()).attempts < self.min_attempts:
+                        return method
+            return min(self._usable(profile), key=lambda m: self.estimate_ms(profile, m, len(text)))
+
+    def record(self, profile: DeliveryProfile, method: str, success: bool, latency_ms: float, chars: int = 0):
+        """
+        Record the outcome of one delivery and re-tune the profile
+
+        Args:
+            profile: Profile the delivery used
+            method: Input method actually used
+            success: Whether the input step reported success
+            latency_ms: Time spent delivering
+            chars: Length of the delivered text
+        """
+        with self._lock:
+            profile.stats.setdefault(method, MethodStats()).add(success, latency_ms, chars)
+            if not profile.pinned:
+                best = self._best_method(profile)
+                if best and best != profile.input_method:
+                    print(f"📈 {profile.app_name}: switching input method {profile.input_method} → {best}")
+                    profile.input_method = best
+            self._schedule_save()
+
+    def _best_method(self, profile: DeliveryProfile) -> Optional[str]:
+        """Usable method that is fastest at this app's typical text length"""
+        measured = [stats for stats in profile.stats.values() if stats.successes]
+        if not measured:
+            return None
+        typical_chars = int(sum(s.total_chars for s in measured) / sum(s.successes for s in measured))
+        return min(self._usable(profile), key=lambda m: self.estimate_ms(profile, m, typical_chars))
+
+    def all(self):
+        """All profiles, for display"""
+        with self._lock:
+            return list(self._profiles.values())
@@ -9,26 +9,42 @@ import customtkinter as ctk
 import threading
 import time
 import queue
+import os
+import random
+from typing import Optional
 from pynput import keyboard
-import pyaudio
-import numpy as np
-from whisper_wrapper import WhisperWrapper
-from text_input_automation import TextInputAutomation
+from app_services import AppServices
+from delivery_executor import ResponsivenessProbe
+from ui_notifier import UINotifier
+from startup_profile import profiler
+from app_logging import configure_logging, get_logger, in_current_take
+import take_timing
+
+log = get_logger("recorder")
 
 # Set appearance mode
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("dark-blue")
 
 class FloatingRecorder:
-    def __init__(self):
-        self.root = ctk.CTk()
+    def __init__(self, master=None, services: Optional[AppServices] = None):
+        """
+        Initialize the floating recorder
+
+        Args:
+            master: Shared Tk root from the app shell (the recorder becomes a toplevel
+                    of it); None creates a standalone root
+            services: Services shared with the dashboard; None builds (and owns) a set
+        """
+        self.root = ctk.CTkToplevel(master) if master is not None else ctk.CTk()
+        self.app_root = master if master is not None else self.root
         self.root.title("metaVoice Recorder")
         self.root.geometry("300x100")  # Increased height to accommodate all buttons
         self.root.resizable(False, False)
         self.root.attributes('-topmost', True)
         # Set maximum window level to stay above all apps
         try:
-            self.root.call('wm', 'attributes', '.', '-level', 'floating')
+            self.root.call('wm', 'attributes', str(self.root), '-level', 'floating')
         except:
             pass
         
@@ -52,13 +68,22 @@ class FloatingRecorder:
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
         self.root.geometry(f"300x100+{screen_width-320}+20")  # Updated height
-        
-        # Initialize components
-        self.whisper = WhisperWrapper()
-        self.automation = TextInputAutomation()
+        profiler.mark("recorder window")
+        
+        # Initialize components (shared with the dashboard when hosted by the app shell)
+        self.owns_services = services is None
+        self.services = services or AppServices()
+        self.whisper = self.services.whisper
+        self.automation = self.services.automation
+        profiler.mark("recorder services")
         self.is_recording = False
         self.is_visible = False
         self.should_stop_recording = False  # Flag to stop recording early
+        self.stop_requested_at = None  # Monotonic time the user pressed stop
+        self.prefocus_future = None  # Target focusing that overlaps decoding
+        
+        # Persistent, searchable transcription history (shared with the dashboard)
+        self.transcript_store = self.services.transcript_store
         
         # Hotkey listener
         self.hotkey_listener = None
@@ -70,7 +95,7 @@ class FloatingRecorder:
         
         # Settings
         self.target_app = "auto-detect"  # Default to auto-detection
-        self.input_method = "clipboard"
+        self.input_method = "auto"  # Per-app delivery profile
         self.auto_input_enabled = True
         
         # Pre-recording target (to avoid Python detection issue)
@@ -79,18 +104,24 @@ class FloatingRecorder:
         # Dashboard reference (will be set later)
         self.dashboard = None
         
-        # Thread-safe communication queue
-        self.update_queue = queue.Queue()
+        # Thread-safe communication queue; each put wakes the Tk loop instead of polling it
+        self.ui_notifier = UINotifier(self.root, self.check_queue)
+        self.update_queue = self.ui_notifier.queue
+        
+        # Voice command handlers and delivery run on the shared workers and report back via update_queue
+        self.command_dispatcher = self.services.command_dispatcher
+        self.meeting_recorder = self.services.meeting_recorder
+        self.delivery_executor = self.services.delivery_executor
+        self.responsiveness_probe = ResponsivenessProbe(self.root.after)
         
         # Create a simple restore file to help users find the window
         self.create_restore_file()
         
         self.create_widgets()
+        profiler.mark("recorder widgets")
         self.setup_hotkey()
-        
-        # Start checking for updates from background threads
-        self.check_queue()
-    
+        profiler.mark("global hotkeys")
+            
     def create_restore_file(self):
         """Create a simple restore file to help users find the window"""
         try:
@@ -206,6 +237,7 @@ class FloatingRecorder:
     def setup_hotkey(self):
         """Setup global hotkeys for the floating window using pynput"""
         self.hotkeys_registered = False
+        self.hotkey_ready_at = None  # Monotonic time the global hotkeys went live
         
         try:
             # Define hotkey mappings
@@ -219,6 +251,8 @@ class FloatingRecorder:
             # Create and start the global hotkey listener
             self.hotkey_listener = keyboard.GlobalHotKeys(hotkey_map)
             self.hotkey_listener.start()
+            self.hotkey_listener.wait()  # Until the OS hook is installed
+            self.hotkey_ready_at = time.monotonic()
             
             print("✅ Recording hotkey registered: Command+Alt")
             print("✅ Window hotkey registered: F2")
@@ -305,7 +339,7 @@ class FloatingRecorder:
         # Ensure maximum priority
         self.root.attributes('-topmost', True)
         try:
-            self.root.call('wm', 'attributes', '.', '-level', 'floating')
+            self.root.call('wm', 'attributes', str(self.root), '-level', 'floating')
         except:
             pass
     
@@ -360,13 +394,11 @@ class FloatingRecorder:
         # Stop audio visualization
         self.stop_audio_visualization()
         
-        # Stop hotkey listener
-        if self.hotkey_listener:
-            try:
-                self.hotkey_listener.stop()
-                print("🔇 Hotkey listener stopped")
-            except:
-                pass
+        self.shutdown()
+        if self.dashboard:
+            self.dashboard.shutdown()
+        # The recorder owns app exit, so the shared services stop here
+        self.services.shutdown()
         
         # Clean up restore file
         try:
@@ -377,13 +409,29 @@ class FloatingRecorder:
         except:
             pass
         
-        # Close the window
-        self.root.destroy()
+        # Close the window (and the shared root when hosted by the app shell)
+        self.app_root.destroy()
         
         # Exit the application
         import sys
         sys.exit(0)
     
+    def shutdown(self):
+        """Stop the hotkey listener, and the services if this window built them"""
+        if self.owns_services:
+            self.services.shutdown()
+        
+        stats = self.ui_notifier.stats()
+        print(f"⏰ UI wakeups: {stats['wakeups']} ({stats['empty_wakeups']} idle) "
+              f"for {stats['notifications']} updates")
+        
+        if self.hotkey_listener:
+            try:
+                self.hotkey_listener.stop()
+                print("🔇 Hotkey listener stopped")
+            except:
+                pass
+    
     def start_drag(self, event):
         """Start dragging the window"""
         self.x = event.x
@@ -412,7 +460,7 @@ class FloatingRecorder:
         # Simulate audio levels (replace with real audio analysis)
         if self.is_recording:
             # Generate random levels for demo
-            self.audio_levels = [np.random.randint(5, 25) for _ in range(12)]
+            self.audio_levels = [random.randint(5, 24) for _ in range(12)]
         else:
             # Reset to low levels
             self.audio_levels = [2] * 12
@@ -440,32 +488,27 @@ class FloatingRecorder:
     def toggle_recording(self):
         """Toggle recording on/off"""
         if self.is_recording:
-            print("⏹️ Hotkey: Stopping recording...")
+            log.debug("⏹️ Hotkey: Stopping recording...")
             self.show_hotkey_notification("⏹️ Stopping...")
             self.stop_recording()
         else:
-            print("🎤 Hotkey: Starting recording...")
+            log.debug("🎤 Hotkey: Starting recording...")
             self.show_hotkey_notification("🎤 Recording...")
             self.start_recording()
     
     def start_recording(self):
         """Start recording"""
-        print("🎤 === RECORDING START DEBUG ===")
+        take_id = take_timing.begin_take()  # Correlates this take's log lines and timings across threads
         
         # IMPORTANT: Capture target app BEFORE recording starts
         # (Before Python becomes the frontmost app)
         if self.target_app == "auto-detect":
-            print("🔍 Pre-recording auto-detection (before Python takes focus)...")
-            detected_target = self.automation.auto_detect_target()
-            print(f"🎯 Pre-recording detected target: '{detected_target}'")
-            
-            # Store the detected target for use during recording
-            self.pre_recording_target = detected_target
-            print(f"💾 Stored pre-recording target: '{self.pre_recording_target}'")
+            self.pre_recording_target = self.automation.auto_detect_target()
+            log.debug("🎯 Pre-recording detected target: '%s'", self.pre_recording_target)
         else:
             # Use manually specified target
             self.pre_recording_target = self.target_app
-            print(f"🎯 Using manual target: '{self.pre_recording_target}'")
+            log.debug("🎯 Using manual target: '%s'", self.pre_recording_target)
         
         self.is_recording = True
         self.update_record_button()
@@ -474,15 +517,18 @@ class FloatingRecorder:
         # Show window during recording
         self.show_window()
         
-        print("🎤 Starting recording...")
+        log.info("🎤 Starting recording (take %s, target '%s')...", take_id, self.pre_recording_target)
         
         # Start recording in thread
-        thread = threading.Thread(target=self.record_audio)
+        thread = threading.Thread(target=in_current_take(self.record_audio), name="metavoice-capture")
         thread.daemon = True
         thread.start()
     
     def stop_recording(self):
         """Stop recording"""
+        if self.is_recording and not self.should_stop_recording:
+            self.stop_requested_at = time.monotonic()
+            take_timing.event("stop", self.stop_requested_at)
         self.should_stop_recording = True  # Set flag to stop recording
         self.is_recording = False
         self.update_record_button()
@@ -491,172 +537,215 @@ class FloatingRecorder:
         # Hide window after recording
         self.hide_window()
         
-        print("⏹️ Recording stopped")
+        log.debug("⏹️ Recording stopped")
     
     def record_audio(self):
         """Record audio with auto-input"""
         try:
-            print("🎤 Recording for 20 seconds...")
-            print("🎤 SPEAK NOW! Your words will be typed automatically!")
-            print("🎤 Click the stop button to finish early!")
-            print("🎯 Using ACCURATE mode for best transcription quality")
+            log.info("🎤 SPEAK NOW! Up to 20 seconds; click stop to finish early")
             
             # Reset stop flag
             self.should_stop_recording = False
+            self.stop_requested_at = None
+            self.prefocus_future = None
             
             # Create stop flag function
             def should_stop():
                 return self.should_stop_recording
             
-            # Record audio with accurate mode and stop flag
-            text = self.whisper.transcribe_microphone(
-                duration=20, 
-                speed_mode="accurate",
-                stop_flag=should_stop
-            )
+            # Record audio with accurate mode and stop flag (the target is tracked meanwhile)
+            with self.automation.tracking_frontmost():
+                text = self.whisper.transcribe_microphone(
+                    duration=20, 
+                    speed_mode="accurate",
+                    stop_flag=should_stop,
+                    on_recording_finished=self.start_prefocus
+                )
+            
+            take_timing.event("text_ready")
+            log.debug("🎯 Transcribed text: %r", text)
             
-            print("✅ Recording finished")
-            print(f"🎯 Transcribed text: '{text}'")
+            if text and text.strip() and text.strip() != "[BLANK_AUDIO]":
+                self.save_transcription(text, self.pre_recording_target)
             
             # Send update to main thread via queue
             self.update_queue.put(("transcription", text))
             
         except Exception as e:
-            print(f"❌ Error: {e}")
+            log.error("❌ Error: %s", e, exc_info=True)
             self.update_queue.put(("error", str(e)))
     
+    def start_prefocus(self):
+        """Focus the delivery target while whisper decodes (called from the recording thread)"""
+        if self.auto_input_enabled and self.pre_recording_target:
+            self.prefocus_future = self.automation.prefocus_async(self.pre_recording_target)
+    
+    def take_prefocus(self):
+        """Hand the focus started during decoding to the delivery worker"""
+        future, self.prefocus_future = self.prefocus_future, None
+        return future
+    
+    def save_transcription(self, text, target_app):
+        """Persist a transcription to the history store (called from the recording thread)"""
+        latency_ms = None
+        if self.stop_requested_at is not None:
+            latency_ms = (time.monotonic() - self.stop_requested_at) * 1000
+        try:
+            self.transcript_store.add(
+                text.strip(),
+                target_app=target_app,
+                model=os.path.basename(self.whisper.model_path),
+                latency_ms=latency_ms
+            )
+        except Exception as e:
+            log.warning("⚠️ Could not save transcription to history: %s", e)
+    
     def handle_transcription(self, text):
         """Handle transcription results"""
+        take_timing.stage_since("text_ready", "ui_handoff")
         self.stop_recording()
         
         if text and text.strip() and text.strip() != "[BLANK_AUDIO]":
-            print("✅ SUCCESS! Speech detected!")
+            log.debug("✅ SUCCESS! Speech detected!")
             
             # Parse command
             command = self.whisper.parse_command(text)
-            print(f"🔍 Parsed command: {command}")
+            log.debug("🔍 Parsed command: %s", command)
             
             if command["command"] != "unknown":
-                print("🎉 Command recognized!")
+                log.debug("🎉 Command recognized!")
                 # Handle specific commands
                 self.handle_command(command)
             else:
-                print("⚠️ Command not recognized, treating as text input")
+                log.debug("⚠️ Command not recognized, treating as text input")
                 # Auto-input the transcribed text
                 if self.auto_input_enabled:
                     self.auto_input_text(text)
                 else:
-                    print("🤖 Auto-input disabled, text not sent")
+                    log.debug("🤖 Auto-input disabled, text not sent")
         else:
-            print("❌ No speech detected")
+            log.info("❌ No speech detected")
     
     def handle_command(self, command):
         """Handle recognized commands"""
-        cmd = command["command"]
-        params = command["parameters"]
-        
-        if cmd == "record-meeting":
-            print("📹 Starting meeting recording...")
-            # TODO: Implement meeting recording
-            print("📹 Meeting recording started")
-        elif cmd == "build-app":
-            app_type = params.get("type", "react")
-            app_name = params.get("name", "my-app")
-            print(f"🚀 Building {app_type} app named '{app_name}'...")
-            # TODO: Implement app building
-            print(f"🚀 App building initiated")
+        log.debug("🔧 Dispatching command '%s'...", command['command'])
+        self.command_dispatcher.dispatch(command, self.update_queue)
+    
+    def handle_command_result(self, result):
+        """Handle a finished command reported by the dispatcher"""
+        if result.status == "ok":
+            log.info("%s (%.2fs)", result.message, result.elapsed)
+        elif result.status == "unhandled":
+            log.info("🔧 %s", result.message)
         else:
-            print(f"🔧 Command '{cmd}' not yet implemented")
+            log.error("❌ %s", result.message)
     
     def auto_input_text(self, text):
-        """Auto-input text into target application"""
+        """
+        Queue text for delivery into the target application
+        
+        Returns:
+            Future for the delivery report, or None if auto-input is disabled
+        """
         try:
-            print(f"🎤 === FLOATING RECORDER AUTO-INPUT DEBUG ===")
-            print(f"📝 Text to input: '{text[:50]}...'")
-            print(f"🎯 Floating recorder target app: '{self.target_app}'")
-            print(f"⌨️ Floating recorder input method: '{self.input_method}'")
-            print(f"🤖 Floating recorder auto-input enabled: {self.auto_input_enabled}")
-            
             if not self.auto_input_enabled:
-                print("🚫 Auto-input is disabled in floating recorder settings")
-                return False
+                log.debug("🚫 Auto-input is disabled in floating recorder settings")
+                return None
             
             # Use pre-recording target if available (to avoid Python detection issue)
             actual_target = getattr(self, 'pre_recording_target', self.target_app)
-            print(f"💾 Using target: '{actual_target}' (pre-recording: {hasattr(self, 'pre_recording_target')})")
             
-            success = self.automation.auto_input_text(
+            # Delivery runs on the worker; the result arrives as "delivery_result"
+            self.responsiveness_probe.start()
+            return self.delivery_executor.submit(
                 text, 
                 actual_target,  # Use pre-recording target
-                self.input_method
+                self.input_method,
+                prefocus=self.take_prefocus(),
+                result_queue=self.update_queue
             )
-            
-            if success:
-                print("✅ Floating recorder: Text successfully input!")
-            else:
-                print("❌ Floating recorder: Failed to input text")
-                
-            return success
                 
         except Exception as e:
-            print(f"❌ Floating recorder error auto-inputting text: {e}")
-            return False
+            log.error("❌ Error queuing text for delivery: %s", e, exc_info=True)
+            return None
+    
+    def handle_delivery_result(self, report):
+        """Handle a finished delivery reported by the delivery worker"""
+        stall_ms = self.responsiveness_probe.stop()
+        log.info("%s (UI max stall %.0fms, %s idle wakeups)",
+                 report.format_line(), stall_ms, self.ui_notifier.empty_wakeups)
+        timeline = take_timing.timings.get(report.take_id)
+        if timeline is not None:
+            log.info("%s", timeline, extra={"fields": {"timeline": timeline.to_dict()}})
     
     def handle_error(self, error_msg):
         """Handle errors"""
-        print(f"❌ Error: {error_msg}")
+        log.error("❌ Error: %s", error_msg)
         self.stop_recording()
     
     def open_dashboard(self):
         """Open the main dashboard window"""
-        print("⚙️ Hotkey: Opening dashboard...")
+        log.debug("⚙️ Hotkey: Opening dashboard...")
         if self.dashboard:
-            print("✅ Dashboard found, opening...")
+            log.debug("✅ Dashboard found, opening...")
             # Schedule dashboard opening on main thread to avoid threading issues
             self.root.after(0, self._open_dashboard_safe)
-            print("✅ Dashboard opening scheduled")
+            log.debug("✅ Dashboard opening scheduled")
         else:
-            print("⚠️ Dashboard not available - reference not set")
-            print("💡 This might be a connection issue between windows")
+            log.warning("⚠️ Dashboard not available - reference not set")
+            log.debug("💡 This might be a connection issue between windows")
     
     def _open_dashboard_safe(self):
         """Safely open dashboard on main thread"""
         try:
             self.dashboard.show_window()
-            print("✅ Dashboard opened successfully")
+            log.debug("✅ Dashboard opened successfully")
         except Exception as e:
-            print(f"❌ Error opening dashboard: {e}")
+            log.error("❌ Error opening dashboard: %s", e)
     
     def set_dashboard(self, dashboard):
         """Set reference to main dashboard"""
         self.dashboard = dashboard
-        print(f"✅ Dashboard reference set: {dashboard is not None}")
+        log.debug("✅ Dashboard reference set: %s", dashboard is not None)
     
     def check_queue(self):
-        """Check for updates from background threads"""
+        """
+        Handle updates from background threads (runs when the UI notifier wakes the loop)
+
+        Returns:
+            Number of updates handled
+        """
+        handled = 0
         try:
             while True:
                 # Non-blocking check for queue items
                 update_type, data = self.update_queue.get_nowait()
+                handled += 1
                 
                 if update_type == "transcription":
                     self.handle_transcription(data)
                 elif update_type == "error":
                     self.handle_error(data)
+                elif update_type == "command_result":
+                    self.handle_command_result(data)
+                elif update_type == "delivery_progress":
+                    print(data)
+                elif update_type == "delivery_result":
+                    self.handle_delivery_result(data)
                     
         except queue.Empty:
-            # No updates in queue, continue
+            # Drained; the next put wakes us again
             pass
         
-        # Schedule next check
-        self.root.after(100, self.check_queue)
+        return handled
     
     def run(self):
         """Run the floating recorder"""
-        self.root.mainloop()
+        self.app_root.mainloop()
 
 def main():
     """Main function for testing the floating recorder"""
+    configure_logging()
     recorder = FloatingRecorder()
     recorder.show_window()
     recorder.run()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Frontmost Application Tracker for metaVoice
+Keeps the current frontmost app in memory so target detection is a dict read
+instead of an osascript round trip
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+# Application names (lowercase) mapped to target keys
+APP_TARGETS = {
+    "cursor": "cursor",
+    "qoder": "qoder",
+    "qoder ide": "qoder",
+    "electron": "qoder",  # Qoder runs on Electron
+    "visual studio code": "vscode",
+    "code": "vscode",
+    "pycharm": "pycharm",
+    "safari": "safari",
+    "google chrome": "chrome",
+    "chrome": "chrome",
+    "terminal": "terminal",
+    "iterm2": "terminal",
+    "notes": "notes",
+    "textedit": "notes"
+}
+
+
+@lru_cache(maxsize=256)
+def target_for_app(app_name: str) -> str:
+    """
+    Map an application name to a target key
+
+    Exact names are a dict lookup; other names fall back to a substring scan
+    once and are memoized.
+
+    Args:
+        app_name: Application name as reported by the system
+
+    Returns:
+        Target key, or "active" for unknown applications
+    """
+    name = app_name.lower()
+    if name in APP_TARGETS:
+        return APP_TARGETS[name]
+    for app_key, target in APP_TARGETS.items():
+        if app_key in name:
+            return target
+    return "active"
+
+
+@dataclass
+class FrontmostApp:
+    """A frontmost-application observation"""
+    name: str
+    bundle_id: str = ""
+    pid: Optional[int] = None
+    observed_at: float = 0.0
+
+    @property
+    def target(self) -> str:
+        return target_for_app(self.name)
+
+
+class FrontmostTracker:
+    def __init__(self, source: Optional[Callable[[], Optional[Dict]]] = None,
+                 poll_interval: float = 0.25, ttl: float = 1.0,
+                 ignore_pids: Optional[List[int]] = None):
+        """
+        Initialize the tracker
+
+        Args:
+            source: Returns {"name", "bundle_id", "pid"} for the frontmost app; None
+                    means state only arrives through feed() (e.g. in tests)
+            poll_interval: Seconds between background polls while started or held
+            ttl: Age after which a cached observation is refreshed on read
+            ignore_pids: Processes whose activation is not recorded (defaults to our own,
+                         so showing the recorder window does not replace the target)
+        """
+        self.source = source
+        self.poll_interval = poll_interval
+        self.ttl = ttl
+        self.ignore_pids = set(ignore_pids if ignore_pids is not None else [os.getpid()])
+        self._current: Optional[FrontmostApp] = None
+        self._listeners: List[Callable[[FrontmostApp], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._holds = 0
+
+    def start(self):
+        """Start the background poller"""
+        with self._lock:
+            if self.source is None or self._thread is not None:
+                return
+            # Each poller gets its own stop event, so a quick stop/start never revives an old one
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._poll_loop, args=(self._stop,),
+                                            name="frontmost-tracker", daemon=True)
+            self._thread.start()
+
+    def stop(self, wait: bool = True):
+        """Stop the background poller"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _poll_loop(self, stop: threading.Event):
+        while not stop.is_set():
+            self.refresh()
+            stop.wait(self.poll_interval)
+
+    def hold(self):
+        """Poll in the background until the matching release() (e.g. while recording)"""
+        with self._lock:
+            self._holds += 1
+            first = self._holds == 1
+        if first:
+            self.start()
+
+    def release(self):
+        """End a hold(); polling stops when no holds remain"""
+        with self._lock:
+            self._holds = max(0, self._holds - 1)
+            last = self._holds == 0
+        if last:
+            self.stop(wait=False)
+
+    @contextmanager
+    def held(self):
+        """Poll in the background for the duration of a block"""
+        self.hold()
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def attach(self, source: Callable[[], Optional[Dict]]):
+        """Use source if the tracker has none (polling resumes if a hold is active)"""
+        with self._lock:
+            if self.source is not None:
+                return
+            self.source = source
+            held = self._holds > 0
+        if held:
+            self.start()
+
+    def detach(self, source: Callable[[], Optional[Dict]]):
+        """Stop querying source (e.g. when its helper closes); the cached app is kept"""
+        with self._lock:
+            if self.source != source:
+                return
+            self.source = None
+        self.stop()
+
+    def add_listener(self, callback: Callable[[FrontmostApp], None]):
+        """Call back with the new app whenever the frontmost app changes"""
+        self._listeners.append(callback)
+
+    def feed(self, name: str, bundle_id: str = "", pid: Optional[int] = None):
+        """
+        Record an app-switch event
+
+        Args:
+            name: Application name
+            bundle_id: Bundle identifier
+            pid: Process id (activations of ignored pids are dropped)
+        """
+        now = time.monotonic()
+        if pid is not None and pid in self.ignore_pids:
+            # Still the last external app as far as targeting is concerned
+            with self._lock:
+                if self._current is not None:
+                    self._current.observed_at = now
+            return
+        app = FrontmostApp(name, bundle_id, pid, now)
+        with self._lock:
+            previous = self._current
+            self._current = app
+        if previous is None or (previous.name, previous.pid) != (app.name, app.pid):
+            for callback in list(self._listeners):
+                try:
+                    callback(app)
+                except Exception as e:
+                    print(f"⚠️ Frontmost listener error: {e}")
+
+    def refresh(self) -> Optional[FrontmostApp]:
+        """Query the source now and record the result"""
+        if self.source is not None:
+            try:
+                info = self.source()
+            except Exception as e:
+                print(f"⚠️ Could not query frontmost app: {e}")
+                info = None
+            if info and info.get("name"):
+                self.feed(info["name"], info.get("bundle_id", ""), info.get("pid"))
+        with self._lock:
+            return self._current
+
+    def peek(self) -> Optional[FrontmostApp]:
+        """The cached observation, however old, without querying the system"""
+        with self._lock:
+            return self._current
+
+    def current(self) -> Optional[FrontmostApp]:
+        """
+        The most recent frontmost app other than our own windows
+
+        Returns:
+            The cached observation, refreshed first if older than the TTL and a
+            source is available; None if nothing has been observed
+        """
+        with self._lock:
+            app = self._current
+        if self.source is not None and (app is None or time.monotonic() - app.observed_at > self.ttl):
+            app = self.refresh()
+        return app
+
+
+_shared: Optional[FrontmostTracker] = None
+_shared_lock = threading.Lock()
+
+
+def shared_tracker(source: Optional[Callable[[], Optional[Dict]]] = None) -> FrontmostTracker:
+    """
+    The process-wide tracker, so every automation reads the same cached state
+
+    Args:
+        source: Frontmost-app query, used if the tracker has no source yet
+
+    Returns:
+        The shared FrontmostTracker
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = FrontmostTracker()
+        tracker = _shared
+    if source is not None:
+        tracker.attach(source)
+    return tracker
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Approximate Phrase Matching for metaVoice
+Character n-gram index that tolerates Whisper near-misses such as
+"bill the app" or "compo nent" when matching registered command phrases
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
+
+# Filler words Whisper and speakers insert between command words
+STOPWORDS = frozenset(["a", "an", "the", "please", "to", "my", "me", "for", "of", "uh", "um"])
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """Lowercase, strip punctuation and drop filler words"""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def is_near_word(token: str, anchor: str, threshold: float = 0.6) -> bool:
+    """
+    Whether a heard token could be a misrecognized anchor word ("bill" for "build")
+
+    Anchors of three letters or fewer must be heard exactly, so "and" is not "end".
+    """
+    if token == anchor:
+        return True
+    if len(anchor) <= 3:
+        return False
+    return SequenceMatcher(None, token, anchor).ratio() >= threshold
+
+
+def char_ngrams(tokens: List[str], n: int = 2) -> FrozenSet[str]:
+    """Space-padded character n-grams of a token sequence"""
+    padded = " " + " ".join(tokens) + " "
+    return frozenset(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+@dataclass
+class FuzzyMatch:
+    """Best approximate match for an utterance"""
+    payload: Any
+    phrase: str
+    score: float
+
+
+class NGramIndex:
+    def __init__(self, n: int = 2, candidates: int = 5):
+        """
+        Initialize an n-gram index
+
+        Args:
+            n: Character n-gram size
+            candidates: Phrases re-scored per query after the posting-list pass
+        """
+        self.n = n
+        self.candidates = candidates
+        self._phrases: List[str] = []
+        self._payloads: List[Any] = []
+        self._grams: List[FrozenSet[str]] = []
+        self._token_counts: List[int] = []
+        self._anchors: List[List[FrozenSet[str]]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self.max_phrase_tokens = 0
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def add(self, phrase: str, payload: Any, anchors: Sequence[Sequence[str]] = ()):
+        """
+        Index a phrase; payload is returned when it matches
+
+        Args:
+            phrase: Phrase to index
+            payload: Returned with the match
+            anchors: Word groups; a matching window must contain a word near one
+                     word of every group (e.g. the command's keywords)
+        """
+        tokens = normalize_tokens(phrase)
+        if not tokens:
+            return
+        grams = char_ngrams(tokens, self.n)
+        phrase_id = len(self._phrases)
+        self._phrases.append(" ".join(tokens))
+        self._payloads.append(payload)
+        self._grams.append(grams)
+        self._token_counts.append(len(tokens))
+        self._anchors.append([frozenset(group) for group in anchors if group])
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(tokens))
+        for gram in grams:
+            self._postings[gram].append(phrase_id)
+
+    def best_match(self, text: str, threshold: float = 0.6,
+                   max_tokens: Optional[int] = None) -> Optional[FuzzyMatch]:
+        """
+        Find the indexed phrase most similar to any window of the text
+
+        Args:
+            text: Utterance to match
+            threshold: Minimum Dice similarity (0-1) to accept
+            max_tokens: Skip utterances longer than this (long dictation is not a command)
+
+        Returns:
+            The best match at or above threshold, or None
+        """
+        tokens = normalize_tokens(text)
+        if not tokens or not self._phrases:
+            return None
+        if max_tokens is not None and len(tokens) > max_tokens:
+            return None
+
+        # Pass 1: one walk over the posting lists of the utterance's grams
+        shared = defaultdict(int)
+        for gram in char_ngrams(tokens, self.n):
+            for phrase_id in self._postings.get(gram, ()):
+                shared[phrase_id] += 1
+        if not shared:
+            return None
+        shortlist = sorted(shared, key=lambda pid: shared[pid] / len(self._grams[pid]),
+                           reverse=True)[:self.candidates]
+
+        # Pass 2: Dice similarity against token windows at least as long as the phrase
+        # (a lone "meeting" is not "stop meeting"), holding a word near each anchor group
+        window_grams = {}
+        best = None
+        for phrase_id in shortlist:
+            phrase_grams = self._grams[phrase_id]
+            size = self._token_counts[phrase_id]
+            for width in range(size, size + 2):
+                for start in range(0, len(tokens) - width + 1):
+                    key = (start, width)
+                    grams = window_grams.get(key)
+                    if grams is None:
+                        grams = window_grams[key] = char_ngrams(tokens[start:start + width], self.n)
+                    score = 2 * len(grams & phrase_grams) / (len(grams) + len(phrase_grams))
+                    if (best is None or score > best.score) and \
+                            self._anchored(tokens[start:start + width], self._anchors[phrase_id]):
+                        best = FuzzyMatch(self._payloads[phrase_id], self._phrases[phrase_id], score)
+
+        if best is None or best.score < threshold:
+            return None
+        return best
+
+    @staticmethod
+    def _anchored(window: List[str], anchors: List[FrozenSet[str]]) -> bool:
+        return all(any(is_near_word(token, anchor) for token in window for anchor in group)
+                   for group in anchors)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Live Typing for metaVoice
+Types a changing transcript hypothesis into the target app, sending only the
+minimal edit (backspaces plus the new suffix) for each revision
+"""
+
+import unicodedata
+from typing import Tuple
+
+
+def _cluster_start(text: str, index: int) -> int:
+    """Move an index back so it does not split a base character from its combining marks"""
+    while 0 < index < len(text) and unicodedata.combining(text[index]):
+        index -= 1
+    return index
+
+
+def keystroke_length(text: str) -> int:
+    """Backspaces needed to delete text (combining marks go with their base character)"""
+    return sum(1 for char in text if not unicodedata.combining(char))
+
+
+def minimal_edit(typed: str, hypothesis: str) -> Tuple[int, str]:
+    """
+    Compute the edit that turns what is on screen into the new hypothesis
+
+    Args:
+        typed: Text already typed into the target
+        hypothesis: Text that should be there now
+
+    Returns:
+        (backspaces, suffix): delete this many characters, then type suffix
+    """
+    limit = min(len(typed), len(hypothesis))
+    prefix = 0
+    while prefix < limit and typed[prefix] == hypothesis[prefix]:
+        prefix += 1
+    prefix = min(_cluster_start(typed, prefix), _cluster_start(hypothesis, prefix))
+    return keystroke_length(typed[prefix:]), hypothesis[prefix:]
+
+
+class LiveTyper:
+    def __init__(self, automation):
+        """
+        Initialize live typing into the frontmost application
+
+        Args:
+            automation: TextInputAutomation providing delete_backward and type_text_chunked
+        """
+        self.automation = automation
+        self.typed = ""
+        self.keystrokes = 0
+        self.revisions = 0
+        self.stalled = False  # A keystroke step failed; what is on screen is unknown
+
+    def update(self, hypothesis: str) -> bool:
+        """
+        Bring the target in line with a new partial transcript
+
+        Args:
+            hypothesis: Latest transcript for the current utterance
+
+        Returns:
+            True if the edit was applied, False if a keystroke step failed (live
+            typing then stays off until the next utterance)
+        """
+        if self.stalled:
+            return False
+        backspaces, suffix = minimal_edit(self.typed, hypothesis)
+        if not backspaces and not suffix:
+            return True
+        self.revisions += 1
+
+        if backspaces:
+            if not self.automation.delete_backward(backspaces):
+                # Unknown how much was deleted; further edits could eat text before the utterance
+                self.stalled = True
+                return False
+            self.keystrokes += backspaces
+            self.typed = hypothesis[:len(hypothesis) - len(suffix)]
+
+        if suffix:
+            if not self.automation.type_text_chunked(suffix):
+                self.stalled = True
+                return False
+            self.keystrokes += len(suffix)
+        self.typed = hypothesis
+        return True
+
+    def finish(self, final_text: str) -> bool:
+        """Apply the final transcript and start a new utterance"""
+        success = self.update(final_text)
+        self.reset()
+        return success
+
+    def reset(self):
+        """Forget the current utterance without touching the target"""
+        self.typed = ""
+        self.stalled = False
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Log Sink for metaVoice
+Bounded, thread-safe log buffer whose UI views are refreshed in batches at
+most once per frame instead of once per message
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, List
+
+# One flush per frame at ~60 fps
+FRAME_MS = 16
+
+
+class LogSink:
+    def __init__(self, request_flush: Callable[[], None], capacity: int = 500):
+        """
+        Initialize the sink
+
+        Args:
+            request_flush: Arranges for flush() to run on the UI thread within a frame;
+                           called from any thread, at most once per flush
+            capacity: Lines kept (older lines are dropped from the buffer and the views)
+        """
+        self.request_flush = request_flush
+        self.capacity = capacity
+        self.lines = deque(maxlen=capacity)  # Ring buffer of formatted lines
+        self._pending = deque(maxlen=capacity)  # Written since the last flush
+        self._overflowed = False  # More lines arrived between flushes than a view keeps
+        self._flush_requested = False
+        self._lock = threading.Lock()
+        self._views: List[Callable[[List[str], bool], None]] = []
+        self.flushes = 0
+
+    def attach(self, view: Callable[[List[str], bool], None]):
+        """
+        Add a view and show it the buffered lines
+
+        Args:
+            view: Called on the UI thread as view(lines, replace); replace means the
+                  lines are the full contents rather than an append
+        """
+        self._views.append(view)
+        with self._lock:
+            lines = list(self.lines)
+        view(lines, True)
+
+    def write(self, message: str) -> str:
+        """
+        Buffer a message (safe from any thread)
+
+        Returns:
+            The formatted line
+        """
+        line = f"[{time.strftime('%H:%M:%S')}] {message}\n"
+        with self._lock:
+            self.lines.append(line)
+            if len(self._pending) == self.capacity:
+                self._overflowed = True
+            self._pending.append(line)
+            request = not self._flush_requested
+            self._flush_requested = True
+        if request:
+            self.request_flush()
+        return line
+
+    def flush(self) -> int:
+        """
+        Push buffered lines to the views (UI thread only)
+
+        Returns:
+            Number of lines pushed
+        """
+        with self._lock:
+            lines = list(self._pending)
+            replace = self._overflowed
+            self._pending.clear()
+            self._overflowed = False
+            self._flush_requested = False
+        if not lines and not replace:
+            return 0
+        self.flushes += 1
+        for view in self._views:
+            try:
+                view(lines, replace)
+            except Exception as e:
+                print(f"⚠️ Log view error: {e}")
+        return len(lines)
+
+    def clear(self):
+        """Drop all buffered lines and empty the views"""
+        with self._lock:
+            self.lines.clear()
+            self._pending.clear()
+            self._overflowed = False
+        for view in self._views:
+            view([], True)
+
+
+def render_lines(textbox, lines: List[str], replace: bool, max_lines: int):
+    """
+    Show a batch of log lines in a Tk text widget, keeping at most max_lines
+
+    Args:
+        textbox: tkinter.Text or CTkTextbox
+        lines: Lines to show
+        replace: Replace the widget contents instead of appending
+        max_lines: Lines kept in the widget
+    """
+    if replace:
+        textbox.delete("1.0", "end")
+    if lines:
+        textbox.insert("end", "".join(lines[-max_lines:]))
+    # Text widgets keep a trailing newline, so "end-1c" sits on the last line + 1
+    line_count = int(textbox.index("end-1c").split(".")[0]) - 1
+    if line_count > max_lines:
+        textbox.delete("1.0", f"{line_count - max_lines + 1}.0")
+    textbox.see("end")
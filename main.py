@@ -9,6 +9,10 @@ import os
 import threading
 import time
 
+from startup_profile import profiler
+from app_logging import configure_logging
+from session_trace import tracer
+
 def setup_macos_app():
     """Setup macOS application environment"""
     try:
@@ -56,37 +60,45 @@ def setup_macos_app():
 
 def main():
     """Main function that starts both components"""
+    # The bundled app re-launches itself as the automation helper process
+    if "--automation-helper" in sys.argv:
+        from automation_helper_server import serve
+        serve()
+        return
+    
+    # --startup-profile prints time-to-ready broken down by step and import
+    if "--startup-profile" in sys.argv:
+        profiler.enable()
+        profiler.track_imports()
+    
+    # --trace FILE records thread spans for the session and writes them as Chrome trace JSON on exit
+    trace_path = None
+    if "--trace" in sys.argv:
+        index = sys.argv.index("--trace")
+        following = sys.argv[index + 1:index + 2]
+        trace_path = following[0] if following and not following[0].startswith("--") else "metavoice-trace.json"
+        tracer.enable()
+    
+    # Console plus logs/metavoice.jsonl; METAVOICE_LOG_LEVEL=DEBUG shows the detailed traces
+    configure_logging()
+    
     print("🚀 Starting metaVoice...")
     
     # Setup macOS application environment first
-    setup_macos_app()
+    with profiler.step("macOS setup"):
+        setup_macos_app()
     
-    # Import components after macOS setup
-    from auto_input_voice_gui import MetaVoiceApp
-    from floating_recorder import FloatingRecorder
+    # Import components after macOS setup; only what the floating recorder needs
+    # is loaded here (the dashboard and PortAudio are deferred)
+    with profiler.step("import app shell + floating recorder"):
+        from app_shell import AppShell
     
-    print("📊 Initializing dashboard (hidden by default)...")
-    print("🎤 Initializing floating recorder (visible by default)...")
+    print("🎤 Initializing floating recorder (dashboard opens on demand)...")
     
     try:
-        # Create dashboard instance (will be hidden by default)
-        dashboard = MetaVoiceApp()
-        
-        # Create floating recorder instance (will be visible by default)
-        floating_recorder = FloatingRecorder()
-        
-        # Set up cross-references between components
-        print("🔗 Setting up component communication...")
-        dashboard.set_floating_recorder(floating_recorder)
-        floating_recorder.set_dashboard(dashboard)
-        
-        # Start dashboard in hidden mode
-        print("📊 Starting dashboard in hidden mode...")
-        dashboard.hide_window()
-        
-        # Start floating recorder in hidden mode (will show during recording)
-        print("🎤 Starting floating recorder in hidden mode...")
-        floating_recorder.hide_window()
+        # One Tk root hosts both windows; dashboard and recorder start hidden
+        # (the floating window shows during recording)
+        shell = AppShell()
         
         print("✅ metaVoice started successfully!")
         print("💡 Floating window will appear automatically during recording")
@@ -95,15 +107,22 @@ def main():
         print("💡 Use Command+Shift+D to open the dashboard")
         print("💡 Use Command+Shift+Z to open the dashboard (alternative)")
         
-        # Run floating recorder in main thread (this will show the floating window)
-        print("🎤 Starting floating recorder main loop...")
-        floating_recorder.run()
+        # Run the shared event loop in the main thread
+        print("🎤 Starting main loop...")
+        shell.run()
         
     except Exception as e:
         print(f"❌ Error starting metaVoice: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if trace_path:
+            try:
+                count = tracer.export(trace_path)
+                print(f"🧭 Wrote {count} trace events to {trace_path} (open in ui.perfetto.dev)")
+            except OSError as e:
+                print(f"⚠️ Could not write trace: {e}")
 
 if __name__ == "__main__":
     main()
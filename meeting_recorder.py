@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Meeting Recorder for metaVoice
+Streams long recordings to rolling WAV segment files with bounded memory and
+transcribes each closed segment in the background while recording continues
+"""
+
+import os
+import queue
+import threading
+import time
+import wave
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from app_paths import get_data_dir
+
+
+@dataclass
+class MeetingSegment:
+    """One closed audio segment of a meeting"""
+    index: int
+    path: str
+    start: float  # seconds from meeting start
+    duration: float
+    text: str = ""
+    lines: List[dict] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def format_timestamp(seconds: float) -> str:
+    """Format seconds as HH:MM:SS"""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class MeetingRecorder:
+    def __init__(self, whisper, output_dir: Optional[str] = None, segment_seconds: int = 60,
+                 sample_rate: int = 16000, chunk: int = 1024, speed_mode: str = "balanced",
+                 stream_factory: Optional[Callable] = None):
+        """
+        Initialize the meeting recorder
+
+        Args:
+            whisper: WhisperWrapper used to transcribe closed segments
+            output_dir: Base directory for meeting folders (defaults to the app data dir)
+            segment_seconds: Length of each rolling segment file
+            sample_rate: Audio sample rate
+            chunk: Frames read per microphone read
+            speed_mode: Whisper speed mode for segment transcription
+            stream_factory: Returns (stream, sample_width, close) for capture; defaults to PyAudio
+        """
+        self.whisper = whisper
+        self.output_dir = output_dir
+        self.segment_seconds = segment_seconds
+        self.sample_rate = sample_rate
+        self.chunk = chunk
+        self.speed_mode = speed_mode
+        self.stream_factory = stream_factory or self._open_microphone
+
+        self.meeting_dir = None
+        self.segments: List[MeetingSegment] = []
+        # Each session gets its own stop event, segment queue and list (see start()), so a
+        # transcription worker outliving stop()'s timeout never touches the next session
+        self._stop_event = threading.Event()
+        self._capture_thread = None
+        self._transcribe_thread = None
+        self._started_at = None
+        self._capture_error = None
+
+    @property
+    def is_recording(self) -> bool:
+        """True while audio is being captured"""
+        return self._capture_thread is not None and self._capture_thread.is_alive()
+
+    @property
+    def has_session(self) -> bool:
+        """True from start() until stop(), even if capture has already died"""
+        return self._capture_thread is not None
+
+    @property
+    def capture_error(self) -> Optional[str]:
+        """Why capture ended early, if it did"""
+        return self._capture_error
+
+    def _open_microphone(self):
+        """Open the default microphone with PyAudio"""
+        import pyaudio
+
+        p = pyaudio.PyAudio()
+        try:
+            device = self.whisper.find_input_device(p)
+            stream = p.open(format=pyaudio.paInt16,
+                            channels=1,
+                            rate=self.sample_rate,
+                            input=True,
+                            input_device_index=device,
+                            frames_per_buffer=self.chunk)
+        except Exception:
+            p.terminate()
+            raise
+
+        def close():
+            stream.stop_stream()
+            stream.close()
+            p.terminate()
+
+        return stream, p.get_sample_size(pyaudio.paInt16), close
+
+    def start(self) -> str:
+        """
+        Start recording a meeting
+
+        Returns:
+            Directory receiving the segment files and transcript
+        """
+        if self.has_session:
+            raise RuntimeError("A meeting is already being recorded")
+
+        base_dir = self.output_dir or get_data_dir("meetings")
+        meeting_dir = os.path.join(base_dir, time.strftime("meeting-%Y%m%d-%H%M%S"))
+        suffix = 1
+        while os.path.exists(meeting_dir):
+            # Another meeting started within the same second
+            suffix += 1
+            meeting_dir = os.path.join(base_dir, time.strftime("meeting-%Y%m%d-%H%M%S") + f"-{suffix}")
+        os.makedirs(meeting_dir)
+        self.meeting_dir = meeting_dir
+
+        self.segments = []
+        self._stop_event = threading.Event()
+        self._capture_error = None
+        self._started_at = time.time()
+        pending = queue.Queue()
+
+        self._transcribe_thread = threading.Thread(target=self._transcribe_segments, args=(pending,),
+                                                   daemon=True)
+        self._transcribe_thread.start()
+        self._capture_thread = threading.Thread(
+            target=self._capture, args=(meeting_dir, self.segments, pending, self._stop_event), daemon=True)
+        self._capture_thread.start()
+
+        print(f"📹 Meeting recording to {self.meeting_dir}")
+        return self.meeting_dir
+
+    def _capture(self, meeting_dir: str, segments: List[MeetingSegment], pending: queue.Queue,
+                 stop_event: threading.Event):
+        """Capture thread: write chunks straight into rolling segment files"""
+        try:
+            stream, sample_width, close = self.stream_factory()
+        except Exception as e:
+            self._capture_error = str(e)
+            print(f"❌ Meeting recorder could not open microphone: {e}")
+            pending.put(None)
+            return
+
+        frames_per_segment = self.segment_seconds * self.sample_rate
+        index = 0
+        recorded_frames = 0
+
+        try:
+            while not stop_event.is_set() and self._capture_error is None:
+                path = os.path.join(meeting_dir, f"segment-{index:04d}.wav")
+                segment_frames = 0
+                with wave.open(path, 'wb') as wf:
+                    wf.setnchannels(1)
+                    wf.setsampwidth(sample_width)
+                    wf.setframerate(self.sample_rate)
+                    while segment_frames < frames_per_segment and not stop_event.is_set():
+                        try:
+                            data = stream.read(self.chunk)
+                        except Exception as e:
+                            # Keep the partial segment; stop() still transcribes it
+                            self._capture_error = str(e)
+                            print(f"❌ Meeting capture error: {e}")
+                            break
+                        wf.writeframes(data)
+                        segment_frames += len(data) // sample_width
+
+                if segment_frames:
+                    segment = MeetingSegment(index=index, path=path,
+                                             start=recorded_frames / self.sample_rate,
+                                             duration=segment_frames / self.sample_rate)
+                    segments.append(segment)
+                    pending.put(segment)
+                else:
+                    os.unlink(path)
+                recorded_frames += segment_frames
+                index += 1
+        except Exception as e:
+            self._capture_error = str(e)
+            print(f"❌ Meeting capture error: {e}")
+        finally:
+            close()
+            # Sentinel: no more segments after this
+            pending.put(None)
+
+    def _transcribe_segments(self, pending: queue.Queue):
+        """Background worker: transcribe each segment of one session as soon as it closes"""
+        while True:
+            segment = pending.get()
+            if segment is None:
+                break
+            try:
+                result = self.whisper.transcribe_audio_file(segment.path, speed_mode=self.speed_mode)
+                segment.text = result.get("text", "").strip()
+                segment.lines = result.get("segments") or [
+                    {"start": 0.0, "end": segment.duration, "text": segment.text}]
+                print(f"📝 Transcribed meeting segment {segment.index} "
+                      f"({format_timestamp(segment.start)})")
+            except Exception as e:
+                segment.error = str(e)
+                print(f"❌ Meeting segment {segment.index} transcription failed: {e}")
+
+    def stop(self, timeout: Optional[float] = None) -> str:
+        """
+        Stop recording and write the timestamped transcript
+
+        Args:
+            timeout: Maximum seconds to wait for the final segment transcription (segments
+                     still pending are marked in the transcript; the next session is unaffected)
+
+        Returns:
+            Path of the transcript file
+        """
+        if self._capture_thread is None:
+            raise RuntimeError("No meeting is being recorded")
+
+        self._stop_event.set()
+        self._capture_thread.join()
+        self._transcribe_thread.join(timeout)
+        self._capture_thread = None
+
+        transcript_path = os.path.join(self.meeting_dir, "transcript.txt")
+        with open(transcript_path, 'w') as f:
+            f.write(self.format_transcript())
+
+        print(f"📹 Meeting transcript written to {transcript_path}")
+        return transcript_path
+
+    def format_transcript(self) -> str:
+        """Render all transcribed segments with meeting-relative timestamps"""
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self._started_at or time.time()))
+        out = [f"metaVoice meeting transcript - {started}", ""]
+        for segment in self.segments:
+            if segment.error:
+                out.append(f"[{format_timestamp(segment.start)}] (transcription failed: {segment.error})")
+                continue
+            if not segment.lines:
+                out.append(f"[{format_timestamp(segment.start)}] (not transcribed before stop)")
+                continue
+            for line in segment.lines:
+                if line.get("text") and line["text"] != "[BLANK_AUDIO]":
+                    out.append(f"[{format_timestamp(segment.start + line['start'])}] {line['text']}")
+        if self._capture_error:
+            out.append(f"(recording ended early: {self._capture_error})")
+        return "\n".join(out) + "\n"
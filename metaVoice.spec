@@ -40,9 +40,35 @@ datas = [
 # Define hidden imports
 hiddenimports = [
     'whisper_wrapper',
+    'command_registry',
+    'fuzzy_matcher',
+    'command_dispatcher',
+    'delivery_executor',
+    'ui_notifier',
+    'log_sink',
+    'command_handlers',
+    'meeting_recorder',
+    'app_services',
+    'app_paths',
+    'app_logging',
+    'take_timing',
+    'session_trace',
+    'metrics',
+    'perf_chart',
+    'transcript_store',
+    'sqlite3',
     'text_input_automation',
+    'delivery_backends',
+    'automation_helper',
+    'automation_helper_server',
+    'readiness',
+    'frontmost_tracker',
+    'delivery_profiles',
+    'live_typing',
     'floating_recorder',
     'auto_input_voice_gui',
+    'app_shell',
+    'startup_profile',
     'customtkinter',
     'customtkinter.windows.widgets',
     'customtkinter.windows.widgets.core_rendering',
@@ -84,7 +110,6 @@ hiddenimports = [
     'tkinter.messagebox',
     'tkinter.filedialog',
     'pyaudio',
-    'numpy',
     'threading',
     'queue',
     'time',
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Metrics for metaVoice
+In-process counters and latency histograms, exposed in Prometheus text format on
+a localhost endpoint and summarized (p50/p95/p99) on the dashboard
+"""
+
+import bisect
+import math
+import os
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_PORT = 9817
+# Latency buckets in seconds (Prometheus "le" upper bounds)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+
+def process_cpu_seconds() -> float:
+    """User + system CPU time of this process and its finished children (e.g. whisper-cli)"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        """
+        A monotonically increasing total
+
+        Args:
+            name: Metric name (snake_case, with a unit suffix such as _total)
+            help: One-line description shown by Prometheus
+        """
+        self.name = name
+        self.help = help
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter",
+                f"{self.name} {_format_value(self.value)}"]
+
+
+class Gauge:
+    def __init__(self, name: str, help: str, window: int = 1000):
+        """
+        A value that goes up and down, with its recent history for charts
+
+        Args:
+            name: Metric name
+            help: One-line description shown by Prometheus
+            window: Most recent values kept for recent()
+        """
+        self.name = name
+        self.help = help
+        self.value = 0.0
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        with self._lock:
+            self.value = value
+            self.samples.append(value)
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+            self.samples.append(self.value)
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def recent(self, count: int) -> List[float]:
+        """The last count values, oldest first"""
+        with self._lock:
+            return list(self.samples)[-count:]
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge",
+                f"{self.name} {_format_value(self.value)}"]
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS, window: int = 1000):
+        """
+        Cumulative bucket counts for Prometheus plus recent samples for percentiles
+
+        Args:
+            name: Metric name (with its unit, e.g. _seconds)
+            help: One-line description shown by Prometheus
+            buckets: Ascending bucket upper bounds
+            window: Most recent observations kept for quantile()
+        """
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.samples.append(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Percentile of the recent observations (nearest rank)
+
+        Args:
+            q: Quantile between 0 and 1 (0.95 for p95)
+
+        Returns:
+            The value, or None before the first observation
+        """
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+    def recent(self, count: int) -> List[float]:
+        """The last count observations, oldest first"""
+        with self._lock:
+            return list(self.samples)[-count:]
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        """p50, p95 and p99 of the recent observations"""
+        return {"p50": self.quantile(0.5), "p95": self.quantile(0.95), "p99": self.quantile(0.99)}
+
+    def render(self) -> List[str]:
+        with self._lock:
+            counts = list(self.bucket_counts)
+            count, total = self.count, self.sum
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {_format_value(total)}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+def format_percentiles(histogram: Histogram, unit: str = "s") -> str:
+    """
+    One-line p50/p95/p99 summary for display
+
+    Returns:
+        e.g. "p50 0.82s · p95 1.40s · p99 2.10s", or "no data yet"
+    """
+    values = histogram.percentiles()
+    if values["p50"] is None:
+        return "no data yet"
+    return " · ".join(f"{name} {value:.2f}{unit}" for name, value in values.items())
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """Named metrics, rendered together for the endpoint"""
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} is already registered as a {type(existing).__name__}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        """Get or create a counter"""
+        return self._register(Counter(name, help))
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        """Get or create a gauge"""
+        return self._register(Gauge(name, help))
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        """Get or create a histogram"""
+        return self._register(Histogram(name, help, buckets))
+
+    def get(self, name: str):
+        return self._metrics.get(name)
+
+    def render_prometheus(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    def __init__(self, registry: MetricsRegistry, port: Optional[int] = None, host: str = "127.0.0.1"):
+        """
+        Serve /metrics for Prometheus on a background thread
+
+        Args:
+            registry: Metrics to expose
+            port: TCP port (defaults to $METAVOICE_METRICS_PORT, then DEFAULT_PORT; 0 disables)
+            host: Interface to bind; localhost only by default
+        """
+        self.registry = registry
+        self.port = port if port is not None else int(os.environ.get("METAVOICE_METRICS_PORT", DEFAULT_PORT))
+        self.host = host
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> bool:
+        """
+        Bind and start serving
+
+        Returns:
+            True if the endpoint is up
+        """
+        if not self.port:
+            return False
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes would flood the console
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"⚠️ Metrics endpoint unavailable on port {self.port}: {e}")
+            return False
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="metavoice-metrics", daemon=True).start()
+        print(f"📈 Metrics at http://{self.host}:{self.port}/metrics")
+        return True
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# Process-wide registry and the metrics recorded for every take
+registry = MetricsRegistry()
+TAKES = registry.counter("metavoice_takes_total", "Recordings transcribed")
+WORDS = registry.counter("metavoice_words_total", "Words transcribed")
+DELIVERIES = registry.counter("metavoice_deliveries_total", "Texts delivered into an application")
+DELIVERY_FAILURES = registry.counter("metavoice_delivery_failures_total", "Deliveries that failed")
+AUDIO_SECONDS = registry.histogram("metavoice_audio_seconds", "Length of captured audio per take",
+                                   (1, 2, 5, 10, 15, 20, 30, 60))
+DECODE_RTF = registry.histogram("metavoice_decode_realtime_factor", "Decode time divided by audio length",
+                                (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0))
+STOP_TO_TEXT = registry.histogram("metavoice_stop_to_text_seconds", "Stop press to text delivered")
+INSERTION = registry.histogram("metavoice_insertion_seconds", "Time to insert text into the target application")
+TAKE_CPU = registry.histogram("metavoice_take_cpu_seconds", "Process and whisper CPU time to capture and decode a take",
+                              (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0))
+DELIVERY_QUEUE = registry.gauge("metavoice_delivery_queue_depth", "Deliveries queued or running")
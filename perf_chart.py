@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Performance Charts for metaVoice
+Rolling line charts on a Tk canvas for the dashboard's performance panel. Each
+chart keeps its canvas items and only moves their coordinates on update.
+"""
+
+from typing import List, Sequence
+
+CHART_POINTS = 60  # Most recent values drawn per chart
+CHART_PAD = 6
+
+
+def chart_coords(values: Sequence[float], width: int, height: int, y_max: float,
+                 capacity: int = CHART_POINTS, pad: int = CHART_PAD) -> List[float]:
+    """
+    Flat x0, y0, x1, y1, ... coordinates for a rolling line, newest value on the right
+
+    Args:
+        values: Values to plot, oldest first (at most capacity are used)
+        width: Chart width in pixels
+        height: Chart height in pixels
+        y_max: Value drawn at the top edge
+        capacity: Points across the full width
+        pad: Margin inside the chart
+
+    Returns:
+        Coordinates for Canvas.coords (at least two points, so Tk accepts the line)
+    """
+    values = list(values)[-capacity:]
+    if not values:
+        return [pad, height - pad, pad, height - pad]
+    step = (width - 2 * pad) / max(1, capacity - 1)
+    right = width - pad
+    coords: List[float] = []
+    for i, value in enumerate(values):
+        x = right - (len(values) - 1 - i) * step
+        y = height - pad - (min(value, y_max) / y_max) * (height - 2 * pad) if y_max > 0 else height - pad
+        coords.extend((round(x, 1), round(y, 1)))
+    if len(values) == 1:
+        coords.extend(coords)
+    return coords
+
+
+class RollingChart:
+    def __init__(self, canvas, title: str, width: int, height: int, unit: str = "",
+                 min_scale: float = 1.0, color: str = "#4CAF50", capacity: int = CHART_POINTS):
+        """
+        Create the chart's canvas items (a line and two labels)
+
+        Args:
+            canvas: tkinter Canvas sized width x height
+            title: Label drawn in the top-left corner
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            unit: Suffix for the value readout
+            min_scale: Smallest top-of-chart value, so small values are not blown up
+            color: Line color
+            capacity: Points across the full width
+        """
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.unit = unit
+        self.min_scale = min_scale
+        self.capacity = capacity
+        self.updates = 0
+        self._shown = None
+        self.line = canvas.create_line(*chart_coords([], width, height, min_scale, capacity), fill=color, width=2)
+        canvas.create_text(CHART_PAD, CHART_PAD, anchor="nw", text=title, fill="#888888")
+        self.readout = canvas.create_text(width - CHART_PAD, CHART_PAD, anchor="ne",
+                                          text="no data yet", fill="#ffffff")
+
+    def update(self, values: Sequence[float]) -> bool:
+        """
+        Move the line to the latest values (UI thread)
+
+        Returns:
+            False if nothing changed since the last update (the canvas is not touched)
+        """
+        values = tuple(values[-self.capacity:])
+        if values == self._shown:
+            return False
+        self._shown = values
+        self.updates += 1
+        y_max = max(self.min_scale, max(values, default=0.0) * 1.2)
+        self.canvas.coords(self.line, *chart_coords(values, self.width, self.height, y_max, self.capacity))
+        if values:
+            readout = f"last {values[-1]:.2f}{self.unit} · max {max(values):.2f}{self.unit}"
+        else:
+            readout = "no data yet"
+        self.canvas.itemconfigure(self.readout, text=readout)
+        return True
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Readiness Waiting for metaVoice
+Condition-based waits with exponential backoff and a deadline, plus a
+per-application history of observed readiness times used to tune budgets
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from app_paths import get_data_dir
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float, initial_interval: float = 0.01,
+               factor: float = 2.0, max_interval: float = 0.1) -> Optional[float]:
+    """
+    Poll a condition with exponential backoff until it holds or the deadline passes
+
+    Args:
+        predicate: Returns True once the condition is met
+        timeout: Seconds before giving up
+        initial_interval: First pause between polls
+        factor: Backoff multiplier per poll
+        max_interval: Longest pause between polls
+
+    Returns:
+        Seconds waited until the condition held, or None on timeout
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    interval = initial_interval
+
+    while True:
+        try:
+            if predicate():
+                return time.monotonic() - started
+        except Exception:
+            pass
+        now = time.monotonic()
+        if now >= deadline:
+            return None
+        time.sleep(min(interval, deadline - now))
+        interval = min(interval * factor, max_interval)
+
+
+class ReadinessHistory:
+    def __init__(self, path: Optional[str] = None, max_samples: int = 50,
+                 min_budget: float = 0.1, max_budget: float = 2.0, save_delay: float = 2.0):
+        """
+        Initialize readiness history
+
+        Args:
+            path: JSON file to persist samples (defaults to readiness.json in the app data dir)
+            max_samples: Samples kept per app and kind
+            min_budget: Smallest wait budget ever suggested
+            max_budget: Largest wait budget ever suggested
+            save_delay: Seconds after a new sample before the file is written, so a
+                        burst of samples costs one write (close() writes immediately)
+        """
+        self.path = path or os.path.join(get_data_dir(), "readiness.json")
+        self.max_samples = max_samples
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.save_delay = save_delay
+        self.saves = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # {app: {kind: [seconds or None for timeouts]}}
+        self._samples: Dict[str, Dict[str, List[Optional[float]]]] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                self._samples = json.load(f)
+        except (OSError, ValueError):
+            self._samples = {}
+
+    def _save(self):
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._samples, f)
+            os.replace(tmp_path, self.path)
+            self.saves += 1
+        except OSError as e:
+            print(f"⚠️ Could not save readiness history: {e}")
+
+    def flush(self):
+        """Write pending samples now"""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._save()
+
+    def close(self):
+        """Write pending samples before shutdown"""
+        self.flush()
+
+    def record(self, app: str, kind: str, seconds: Optional[float]):
+        """
+        Record how long an app took to become ready
+
+        Args:
+            app: Application key (e.g. "Cursor")
+            kind: What was awaited ("focus", "clipboard")
+            seconds: Observed wait, or None if the deadline passed
+        """
+        with self._lock:
+            samples = self._samples.setdefault(app.lower(), {}).setdefault(kind, [])
+            samples.append(None if seconds is None else round(seconds, 4))
+            del samples[:-self.max_samples]
+            self._dirty = True
+            # Delivery threads record samples; writing the file is left to a timer
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.save_delay, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def budget(self, app: str, kind: str, default: float) -> float:
+        """
+        Suggest a wait budget from observed readiness times
+
+        Args:
+            app: Application key
+            kind: What is awaited
+            default: Budget used until enough samples exist
+
+        Returns:
+            Seconds to wait before giving up
+        """
+        with self._lock:
+            samples = list(self._samples.get(app.lower(), {}).get(kind, []))
+
+        if len(samples) < 5:
+            return default
+
+        observed = sorted(s for s in samples if s is not None)
+        timeouts = len(samples) - len(observed)
+        if not observed:
+            return self.max_budget
+
+        # 95th percentile with headroom; recent timeouts push the budget up
+        p95 = observed[min(len(observed) - 1, int(len(observed) * 0.95))]
+        budget = p95 * 1.5 + 0.05
+        if timeouts:
+            budget = max(budget, default) * (1 + timeouts / len(samples))
+        return max(self.min_budget, min(self.max_budget, budget))
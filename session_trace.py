@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Session Trace for metaVoice
+Spans from the capture thread, decode, UI thread and delivery workers, exported
+as Chrome trace-event JSON (loads in Perfetto or chrome://tracing) so thread
+overlap, UI stalls and queueing delays can be seen on one timeline
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from app_logging import current_take
+
+
+class SessionTrace:
+    def __init__(self, enabled: bool = False, max_events: int = 50000):
+        """
+        Initialize the trace buffer
+
+        Args:
+            enabled: When False, recording calls return immediately
+            max_events: Most recent events kept (older ones are dropped)
+        """
+        self.enabled = enabled
+        self.origin = time.monotonic()
+        self.dropped = 0
+        self._events = deque(maxlen=max_events)
+        self._threads: Dict[int, str] = {}
+
+    def enable(self):
+        """Start recording now; timestamps count from this moment"""
+        self.enabled = True
+        self.origin = time.monotonic()
+
+    def _micros(self, at: float) -> float:
+        return round((at - self.origin) * 1e6, 1)
+
+    def _add(self, event: Dict):
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        event["pid"] = os.getpid()
+        event["tid"] = thread.ident
+        take = current_take.get()
+        if take is not None:
+            event.setdefault("args", {})["take"] = take
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append(event)
+
+    def complete(self, name: str, start: float, end: Optional[float] = None,
+                 cat: str = "span", args: Optional[Dict] = None):
+        """
+        Record a span on the calling thread from monotonic timestamps
+
+        Args:
+            name: Span name
+            start: time.monotonic() when the span began
+            end: time.monotonic() when it ended (defaults to now)
+            cat: Category, used for filtering in the viewer
+            args: Extra values shown with the span
+        """
+        if not self.enabled:
+            return
+        end = end if end is not None else time.monotonic()
+        self._add({"name": name, "cat": cat, "ph": "X", "ts": self._micros(start),
+                   "dur": round(max(0.0, end - start) * 1e6, 1), "args": dict(args or {})})
+
+    @contextmanager
+    def span(self, name: str, cat: str = "span", **args):
+        """Record a block as a span on the calling thread"""
+        if not self.enabled:
+            yield
+            return
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.complete(name, start, cat=cat, args=args)
+
+    def instant(self, name: str, at: Optional[float] = None, cat: str = "event", args: Optional[Dict] = None):
+        """Record a point in time on the calling thread"""
+        if not self.enabled:
+            return
+        self._add({"name": name, "cat": cat, "ph": "i", "s": "t",
+                   "ts": self._micros(at if at is not None else time.monotonic()), "args": dict(args or {})})
+
+    def counter(self, name: str, **values: float):
+        """Record the current value of one or more counters (drawn as a track)"""
+        if not self.enabled:
+            return
+        self._add({"name": name, "cat": "counter", "ph": "C",
+                   "ts": self._micros(time.monotonic()), "args": values})
+
+    def to_chrome_trace(self) -> Dict:
+        """
+        The recorded session in Chrome trace-event format
+
+        Returns:
+            {"traceEvents": [...], "displayTimeUnit": "ms"} with thread-name metadata
+        """
+        pid = os.getpid()
+        events: List[Dict] = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                               "args": {"name": "metaVoice"}}]
+        for tid, name in list(self._threads.items()):
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+        events.extend(sorted(list(self._events), key=lambda event: event["ts"]))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str) -> int:
+        """
+        Write the session as a Chrome trace JSON file
+
+        Returns:
+            Number of trace events written (excluding metadata)
+        """
+        trace = self.to_chrome_trace()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(trace, f)
+        os.replace(tmp_path, path)
+        return sum(1 for event in trace["traceEvents"] if event["ph"] != "M")
+
+
+# Process-wide trace; disabled unless main() is started with --trace
+tracer = SessionTrace()
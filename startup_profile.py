@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Startup Profiler for metaVoice
+Breaks time-to-ready down by initialization step and by top-level import
+(enabled with --startup-profile)
+"""
+
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class StartupStep:
+    """One timed initialization step"""
+    name: str
+    started_ms: float  # Offset from profiler start
+    elapsed_ms: float
+
+
+@dataclass
+class _ImportFrame:
+    name: str
+    started: float
+    child_seconds: float = 0.0
+
+
+class StartupProfiler:
+    def __init__(self, enabled: bool = True):
+        """
+        Collect step and import timings from process start until the app is ready
+
+        Args:
+            enabled: When False, step() and track_imports() cost nothing
+        """
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self._last_mark = self.started
+        self.steps: List[StartupStep] = []
+        self.imports: Dict[str, float] = {}  # Top-level package -> self time (ms)
+        self._import_stack: List[_ImportFrame] = []
+        self._original_import = None
+
+    def enable(self):
+        """Start profiling now (called first thing in main)"""
+        self.enabled = True
+        self.started = self._last_mark = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str):
+        """Time a block of startup work"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.steps.append(StartupStep(name, (start - self.started) * 1000, (end - start) * 1000))
+            self._last_mark = end
+
+    def mark(self, name: str):
+        """Record the work since the previous step or mark as one step"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.steps.append(StartupStep(name, (self._last_mark - self.started) * 1000,
+                                      (now - self._last_mark) * 1000))
+        self._last_mark = now
+
+    def track_imports(self):
+        """Time each top-level package the first time it is imported (until stop_tracking)"""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        original = self._original_import
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            top = name.partition(".")[0]
+            # Worker threads import concurrently; only the main thread's startup path is timed
+            if level or top in sys.modules or threading.current_thread() is not threading.main_thread():
+                return original(name, globals, locals, fromlist, level)
+            frame = _ImportFrame(top, time.perf_counter())
+            self._import_stack.append(frame)
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                self._import_stack.pop()
+                elapsed = time.perf_counter() - frame.started
+                if self._import_stack:
+                    self._import_stack[-1].child_seconds += elapsed
+                # Self time: a package's own dependencies are reported separately
+                self.imports[top] = self.imports.get(top, 0.0) + (elapsed - frame.child_seconds) * 1000
+
+        builtins.__import__ = timed_import
+
+    def stop_tracking(self):
+        """Restore the normal import machinery"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def report(self, top_imports: int = 12) -> str:
+        """
+        Format the breakdown
+
+        Args:
+            top_imports: How many of the slowest imports to list
+
+        Returns:
+            Multi-line report (empty when profiling is disabled)
+        """
+        if not self.enabled:
+            return ""
+        total_ms = (time.perf_counter() - self.started) * 1000
+        lines = [f"⏱️ Startup profile: ready in {total_ms:.0f}ms"]
+        for step in self.steps:
+            lines.append(f"   {step.started_ms:7.0f}ms  +{step.elapsed_ms:6.0f}ms  {step.name}")
+        if self.imports:
+            lines.append("   Slowest imports (self time):")
+            slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:top_imports]
+            for name, elapsed_ms in slowest:
+                lines.append(f"   {elapsed_ms:17.0f}ms  {name}")
+        return "\n".join(lines)
+
+
+# Process-wide profiler; disabled unless main() enables it
+profiler = StartupProfiler(enabled=False)
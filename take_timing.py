@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Take Timing for metaVoice
+Per-take timelines of monotonic stage timestamps (microphone open, capture,
+WAV write, whisper run, JSON parse, focus, clipboard, paste...) so stop-to-text
+latency can be attributed to the stage that caused it
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from app_logging import current_take, start_take
+from session_trace import tracer
+
+# whisper.cpp's own timing summary on stderr, e.g. "whisper_print_timings:  load time =  84.12 ms"
+WHISPER_TIMING_RE = re.compile(r"whisper_print_timings:\s+(\w+) time =\s+([\d.]+) ms")
+
+
+def parse_whisper_timings(stderr: str) -> Dict[str, float]:
+    """
+    Extract whisper.cpp's reported phase times
+
+    Returns:
+        {"load": ms, "mel": ms, "encode": ms, "decode": ms, ..., "total": ms}
+    """
+    return {name: float(ms) for name, ms in WHISPER_TIMING_RE.findall(stderr or "")}
+
+
+@dataclass
+class Stage:
+    """One timed stage of a take (monotonic seconds)"""
+    name: str
+    start: float
+    end: float
+    thread: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+
+@dataclass
+class TakeTimeline:
+    """Everything that happened to one take, from recording start to text in the target"""
+    take_id: str
+    started: float = field(default_factory=time.monotonic)
+    stages: List[Stage] = field(default_factory=list)
+    events: Dict[str, float] = field(default_factory=dict)  # Instants: stop, text_ready, delivered
+    reported: Dict[str, float] = field(default_factory=dict)  # Durations measured by other tools (ms)
+
+    def add_stage(self, name: str, start: float, end: Optional[float] = None):
+        stage = Stage(name, start, end if end is not None else time.monotonic(),
+                      threading.current_thread().name)
+        self.stages.append(stage)
+        tracer.complete(name, stage.start, stage.end, cat="take", args={"take": self.take_id})
+
+    def event(self, name: str, at: Optional[float] = None):
+        self.events[name] = at if at is not None else time.monotonic()
+        tracer.instant(name, self.events[name], cat="take", args={"take": self.take_id})
+
+    def duration_ms(self, name: str) -> float:
+        """Total time spent in a stage (summed if it ran more than once)"""
+        return sum(stage.duration_ms for stage in self.stages if stage.name == name)
+
+    def stop_point(self) -> Optional[float]:
+        """When the user stopped talking: the stop press, or the end of capture (time limit)"""
+        if "stop" in self.events:
+            return self.events["stop"]
+        captures = [stage.end for stage in self.stages if stage.name == "capture"]
+        return captures[-1] if captures else None
+
+    def stop_to_text_ms(self) -> Optional[float]:
+        """Stop press to text delivered into the target app"""
+        stop = self.stop_point()
+        if stop is None or "delivered" not in self.events:
+            return None
+        return (self.events["delivered"] - stop) * 1000
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        Each stage's share of the stop-to-text window, in order of start
+
+        Stages are clipped to the window; stages that ran in parallel (e.g. prefocus
+        during decoding) both count their overlap.
+        """
+        stop = self.stop_point()
+        end = self.events.get("delivered")
+        if stop is None or end is None:
+            return {}
+        shares: Dict[str, float] = {}
+        for stage in sorted(self.stages, key=lambda s: s.start):
+            overlap = min(stage.end, end) - max(stage.start, stop)
+            if overlap > 0:
+                shares[stage.name] = shares.get(stage.name, 0.0) + overlap * 1000
+        return shares
+
+    def to_dict(self) -> Dict:
+        """Export form; times are milliseconds since the take started"""
+        def offset(at):
+            return round((at - self.started) * 1000, 2)
+        return {
+            "take_id": self.take_id,
+            "stop_to_text_ms": self.stop_to_text_ms(),
+            "events": {name: offset(at) for name, at in self.events.items()},
+            "stages": [{"name": s.name, "start_ms": offset(s.start), "end_ms": offset(s.end),
+                        "duration_ms": round(s.duration_ms, 2), "thread": s.thread} for s in self.stages],
+            "reported_ms": dict(self.reported)
+        }
+
+    def format_line(self) -> str:
+        total = self.stop_to_text_ms()
+        if total is None:
+            return f"⏱️ Take {self.take_id}: not delivered"
+        parts = " + ".join(f"{name} {ms:.0f}" for name, ms in self.breakdown().items())
+        return f"⏱️ Take {self.take_id}: stop→text {total:.0f}ms ({parts})"
+
+    def __str__(self) -> str:
+        return self.format_line()
+
+
+class TakeTimings:
+    def __init__(self, max_takes: int = 200):
+        """
+        Initialize the in-memory timeline store
+
+        Args:
+            max_takes: Most recent takes kept (older ones are dropped)
+        """
+        self.max_takes = max_takes
+        self._takes: "OrderedDict[str, TakeTimeline]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def begin(self, take_id: str) -> TakeTimeline:
+        """Start the timeline for a new take"""
+        timeline = TakeTimeline(take_id)
+        with self._lock:
+            self._takes[take_id] = timeline
+            while len(self._takes) > self.max_takes:
+                self._takes.popitem(last=False)
+        return timeline
+
+    def get(self, take_id: Optional[str]) -> Optional[TakeTimeline]:
+        if take_id is None:
+            return None
+        with self._lock:
+            return self._takes.get(take_id)
+
+    def recent(self, count: int = 20) -> List[TakeTimeline]:
+        """Most recent takes, newest last"""
+        with self._lock:
+            return list(self._takes.values())[-count:]
+
+    def export_jsonl(self, path: str) -> int:
+        """
+        Write every stored take as one JSON object per line
+
+        Returns:
+            Number of takes written
+        """
+        takes = self.recent(self.max_takes)
+        with open(path, 'w') as f:
+            for timeline in takes:
+                f.write(json.dumps(timeline.to_dict()) + "\n")
+        return len(takes)
+
+
+# Process-wide store; instrumentation below writes to the current take's timeline
+timings = TakeTimings()
+
+
+def begin_take() -> str:
+    """
+    Start a take in the current context and its timeline
+
+    Returns:
+        The take's correlation ID
+    """
+    take_id = start_take()
+    timings.begin(take_id)
+    return take_id
+
+
+def current_timeline() -> Optional[TakeTimeline]:
+    """Timeline of the take running in this context, if any"""
+    return timings.get(current_take.get())
+
+
+@contextmanager
+def stage(name: str):
+    """Time a block as a stage of the current take (no-op outside a take)"""
+    timeline = current_timeline()
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        if timeline is not None:
+            timeline.add_stage(name, start)
+
+
+def add_stage(name: str, start: float, end: Optional[float] = None):
+    """Record a stage of the current take from timestamps taken by the caller"""
+    timeline = current_timeline()
+    if timeline is not None:
+        timeline.add_stage(name, start, end)
+
+
+def stage_since(event_name: str, name: str):
+    """Record the time from an earlier event of the current take until now as a stage"""
+    timeline = current_timeline()
+    if timeline is not None and event_name in timeline.events:
+        timeline.add_stage(name, timeline.events[event_name])
+
+
+def timed(name: str, func: Callable) -> Callable:
+    """Wrap a callable so each call is recorded as a stage of the take it runs in"""
+    def run(*args, **kwargs):
+        with stage(name):
+            return func(*args, **kwargs)
+    return run
+
+
+def event(name: str, at: Optional[float] = None):
+    """Mark an instant in the current take"""
+    timeline = current_timeline()
+    if timeline is not None:
+        timeline.event(name, at)
+
+
+def report(name: str, ms: float):
+    """Record a duration measured elsewhere (e.g. by whisper.cpp) for the current take"""
+    timeline = current_timeline()
+    if timeline is not None:
+        timeline.reported[name] = ms
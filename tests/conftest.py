@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+"""
+
+import json
+import os
+
+import pytest
+
+import frontmost_tracker
+
+FAKES_DIR = os.path.join(os.path.dirname(__file__), "fakes")
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep app data (history, readiness samples) out of the real home directory"""
+    data_dir = tmp_path / "metavoice-data"
+    monkeypatch.setenv("METAVOICE_DATA_DIR", str(data_dir))
+    return data_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_tracker(monkeypatch):
+    """Give each test its own process-wide frontmost tracker, so no test queries another's backend"""
+    monkeypatch.setattr(frontmost_tracker, "_shared", None)
+    yield
+    if frontmost_tracker._shared is not None:
+        frontmost_tracker._shared.stop()
+
+
+@pytest.fixture
+def osascript_log(tmp_path, monkeypatch):
+    """
+    Put the fake osascript first on PATH and return its invocation log
+
+    Pins the macOS delivery backend, so a DISPLAY and xdotool on the test machine
+    do not route delivery through X11 instead.
+    """
+    log_path = tmp_path / "osascript.log"
+    monkeypatch.setenv("METAVOICE_DELIVERY_BACKEND", "macos")
+    monkeypatch.setenv("PATH", FAKES_DIR + os.pathsep + os.environ.get("PATH", ""))
+    monkeypatch.setenv("FAKE_OSASCRIPT_LOG", str(log_path))
+    monkeypatch.setenv("FAKE_OSASCRIPT_STDOUT", "Cursor")
+
+    def invocations():
+        if not log_path.exists():
+            return []
+        return [json.loads(line) for line in log_path.read_text().splitlines()]
+
+    return invocations
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Scriptable stand-in for automation_helper_server.py on Linux
+Speaks the same line-delimited JSON protocol. Behaviour is driven by env:
+    FAKE_HELPER_LOG        append each request as a JSON line
+    FAKE_HELPER_RESULT     result returned for run_script (default "")
+    FAKE_HELPER_CRASH_FILE if this file exists, delete it and exit on the next request
+    FAKE_HELPER_CRASH_ON   only crash on this command (e.g. "run_script")
+"""
+
+import json
+import os
+import sys
+
+clipboard = ""
+
+for line in sys.stdin:
+    request = json.loads(line)
+
+    log_path = os.environ.get("FAKE_HELPER_LOG")
+    if log_path:
+        with open(log_path, "a") as f:
+            f.write(json.dumps({"pid": os.getpid(), **request}) + "\n")
+
+    crash_file = os.environ.get("FAKE_HELPER_CRASH_FILE")
+    crash_on = os.environ.get("FAKE_HELPER_CRASH_ON")
+    if crash_file and os.path.exists(crash_file) and crash_on in (None, request["cmd"]):
+        os.unlink(crash_file)
+        sys.exit(1)
+
+    cmd = request["cmd"]
+    reply = {"id": request["id"], "ok": True}
+    if cmd == "ping":
+        reply["result"] = "pong"
+    elif cmd == "run_script":
+        if "error" in request["script"]:
+            reply = {"id": request["id"], "ok": False, "error": "script error"}
+        else:
+            reply["result"] = os.environ.get("FAKE_HELPER_RESULT", "")
+    elif cmd == "frontmost":
+        reply["result"] = {"name": "Cursor", "bundle_id": "com.todesktop.cursor", "pid": 42}
+    elif cmd == "set_clipboard":
+        clipboard = request["text"]
+        reply["result"] = True
+    elif cmd == "get_clipboard":
+        reply["result"] = clipboard
+    else:
+        reply = {"id": request["id"], "ok": False, "error": f"Unknown command: {cmd}"}
+
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
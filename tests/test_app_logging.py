@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for leveled, structured logging with take correlation IDs
+"""
+
+import json
+import logging
+import os
+import threading
+
+import pytest
+
+from app_logging import LOGGER_NAME, configure_logging, current_take, get_logger, in_current_take, start_take
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = str(tmp_path / "metavoice.jsonl")
+    yield path
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    current_take.set(None)
+
+
+def read_entries(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_json_lines_with_take_and_fields(log_path):
+    configure_logging("INFO", path=log_path)
+    take_id = start_take()
+    get_logger("whisper").info("🧠 Decoded in %.0fms", 412.4, extra={"fields": {"decode_ms": 412.4}})
+
+    entry, = read_entries(log_path)
+    assert entry["msg"] == "🧠 Decoded in 412ms"
+    assert entry["logger"] == "metavoice.whisper"
+    assert entry["level"] == "INFO"
+    assert entry["take"] == take_id
+    assert entry["decode_ms"] == 412.4
+
+
+def test_disabled_debug_is_never_formatted(log_path):
+    configure_logging("INFO", path=log_path)
+
+    class Expensive:
+        formatted = 0
+
+        def __str__(self):
+            Expensive.formatted += 1
+            return "dump"
+
+    get_logger("automation").debug("📱 %s", Expensive())
+    assert Expensive.formatted == 0
+    assert not os.path.exists(log_path)
+
+    configure_logging("DEBUG", path=log_path)
+    get_logger("automation").debug("📱 %s", Expensive())
+    assert Expensive.formatted >= 1
+    assert read_entries(log_path)[0]["msg"] == "📱 dump"
+
+
+def test_take_follows_work_handed_to_other_threads(log_path):
+    configure_logging("INFO", path=log_path)
+    take_id = start_take()
+    worker = threading.Thread(target=in_current_take(lambda: get_logger("delivery").info("handed over")))
+    plain = threading.Thread(target=lambda: get_logger("delivery").info("not handed over"))
+    worker.start()
+    worker.join()
+    plain.start()
+    plain.join()
+
+    takes = {entry["msg"]: entry["take"] for entry in read_entries(log_path)}
+    assert takes == {"handed over": take_id, "not handed over": None}
+
+
+def test_file_rotates_at_max_bytes(log_path):
+    configure_logging("INFO", path=log_path, max_bytes=400, backup_count=2)
+    for i in range(40):
+        get_logger("recorder").info("line %d", i)
+
+    assert os.path.exists(log_path + ".1")
+    assert not os.path.exists(log_path + ".3")
+    assert os.path.getsize(log_path) <= 400
+
+
+def test_reconfiguring_does_not_duplicate_output(log_path):
+    configure_logging("INFO", path=log_path)
+    configure_logging("INFO", path=log_path)
+    get_logger("recorder").info("once")
+    assert len(read_entries(log_path)) == 1
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for the services shared by the dashboard and floating recorder
+"""
+
+import queue
+
+from app_services import AppServices
+from delivery_backends import RecordingBackend
+from text_input_automation import TextInputAutomation
+
+
+class FakeWhisper:
+    model_path = "fake.bin"
+
+
+def test_one_service_set_reports_to_each_window():
+    """Commands and deliveries share one worker pool; results go back to the window that asked"""
+    services = AppServices(FakeWhisper(), TextInputAutomation(backend=RecordingBackend("Notes")))
+    recorder_updates, dashboard_updates = queue.Queue(), queue.Queue()
+    services.command_dispatcher.register("build-app", lambda cmd: "built")
+
+    services.command_dispatcher.dispatch({"command": "build-app", "parameters": {}}, dashboard_updates)
+    assert dashboard_updates.get(timeout=2.0)[1].message == "built"
+
+    services.delivery_executor.submit("hello", "active", "clipboard", result_queue=recorder_updates).result(timeout=5.0)
+    kinds = [recorder_updates.get_nowait()[0] for _ in range(recorder_updates.qsize())]
+    assert kinds[-1] == "delivery_result"
+    assert services.automation.backend.documents["Notes"] == "hello"
+    assert dashboard_updates.empty()
+
+    services.shutdown()
+    services.shutdown()  # Both windows and the shell may call it
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent automation helper using a scriptable stand-in
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from automation_helper import AutomationHelperClient, AutomationHelperError, AutomationHelperUnavailable
+from delivery_backends import MacOSBackend, run_applescript
+from text_input_automation import TextInputAutomation
+
+FAKE_HELPER = os.path.join(os.path.dirname(__file__), "fakes", "fake_automation_helper.py")
+
+
+@pytest.fixture
+def helper(tmp_path, monkeypatch):
+    log_path = tmp_path / "helper.log"
+    monkeypatch.setenv("FAKE_HELPER_LOG", str(log_path))
+    monkeypatch.setenv("FAKE_HELPER_RESULT", "Cursor")
+    monkeypatch.setenv("FAKE_HELPER_CRASH_FILE", str(tmp_path / "crash"))
+    client = AutomationHelperClient([sys.executable, FAKE_HELPER], timeout=5.0)
+    client.requests = lambda: [json.loads(l) for l in log_path.read_text().splitlines()]
+    yield client
+    client.close()
+
+
+def test_one_process_serves_many_requests(helper):
+    """Structured replies come back from a single long-lived process"""
+    assert helper.ping()
+    assert helper.frontmost()["bundle_id"] == "com.todesktop.cursor"
+    assert helper.set_clipboard("hello")
+    assert helper.get_clipboard() == "hello"
+
+    pids = {r["pid"] for r in helper.requests()}
+    assert len(pids) == 1 and helper.restarts == 0
+
+
+def test_script_errors_do_not_restart_helper(helper):
+    """A failing script is a normal reply, shaped like osascript's exit status"""
+    result = helper.run_script("this causes an error")
+    assert result.returncode == 1 and "script error" in result.stderr
+    assert helper.run_script("return 1", "arg").stdout.strip() == "Cursor"
+    assert helper.restarts == 0
+
+
+def test_reconnects_after_crash(helper, tmp_path):
+    """A crash fails the in-flight request, and the next one reconnects"""
+    assert helper.ping()
+    (tmp_path / "crash").write_text("")
+
+    with pytest.raises(AutomationHelperError):
+        helper.request("ping")
+    assert helper.ping()
+    assert helper.restarts == 1
+
+
+def test_text_automation_routes_scripts_through_helper(helper, tmp_path, monkeypatch):
+    """Delivery uses the helper, not an osascript launch"""
+    monkeypatch.setenv("PATH", str(tmp_path))  # no osascript available at all
+    automation = TextInputAutomation(helper=helper)
+
+    assert automation.auto_input_text("hello world", "cursor", "clipboard")
+
+    scripts = [r for r in helper.requests() if r["cmd"] == "run_script"]
+    assert len(scripts) == 1
+    assert scripts[0]["args"][:2] == ["hello world", "Cursor"]
+
+
+def test_crash_mid_script_is_not_replayed_with_osascript(helper, tmp_path, osascript_log):
+    """The helper read the script before dying, so it may already have pasted"""
+    assert helper.ping()
+    (tmp_path / "crash").write_text("")
+
+    result = run_applescript(helper, "paste", "hello")
+    assert result.returncode == 1 and "exited" in result.stderr
+    assert osascript_log() == []
+
+
+def test_unstartable_helper_falls_back_to_osascript(tmp_path, osascript_log):
+    """A request that never reached a helper is safe to run with osascript"""
+    client = AutomationHelperClient([str(tmp_path / "no-such-helper")])
+    with pytest.raises(AutomationHelperUnavailable):
+        client.request("ping")
+
+    result = run_applescript(client, "paste", "hello")
+    assert result.returncode == 0
+    assert len(osascript_log()) == 1
+
+
+def test_interrupted_delivery_is_not_retried(helper, tmp_path, osascript_log, monkeypatch):
+    """A crash during the delivery script neither falls back to step-by-step nor retries the paste"""
+    monkeypatch.setenv("FAKE_HELPER_CRASH_ON", "run_script")
+    automation = TextInputAutomation(helper=helper, backend=MacOSBackend(helper))
+    (tmp_path / "crash").write_text("")
+
+    assert not automation.auto_input_text("hello world", "cursor", "clipboard")
+
+    scripts = [r for r in helper.requests() if r["cmd"] == "run_script"]
+    assert len(scripts) == 1
+    assert osascript_log() == []
+
+
+def test_script_timeout_scales_with_text(helper):
+    """Long typing gets more time than the base reply timeout"""
+    seen = {}
+    helper.request = lambda cmd, timeout=None, **params: seen.setdefault("timeout", timeout)
+    helper.run_script("type", "x" * 1000)
+    assert seen["timeout"] == pytest.approx(helper.timeout + 20)
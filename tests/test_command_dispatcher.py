@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for worker-pool command dispatch
+"""
+
+import queue
+import time
+
+from command_dispatcher import CommandDispatcher
+from command_handlers import register_default_handlers
+
+
+def _next_result(results, timeout=2.0):
+    update_type, result = results.get(timeout=timeout)
+    assert update_type == "command_result"
+    return result
+
+
+def test_handler_runs_off_caller_thread_and_reports_back():
+    """Handlers report their message through the result queue"""
+    results = queue.Queue()
+    dispatcher = CommandDispatcher(results)
+    dispatcher.register("build-app", lambda cmd: f"building {cmd['parameters']['name']}")
+
+    dispatcher.dispatch({"command": "build-app", "parameters": {"name": "demo"}})
+    result = _next_result(results)
+
+    assert result.status == "ok"
+    assert result.message == "building demo"
+    dispatcher.shutdown()
+
+
+def test_slow_handler_times_out_without_blocking():
+    """dispatch returns immediately and a timeout result is posted"""
+    results = queue.Queue()
+    dispatcher = CommandDispatcher(results)
+    dispatcher.register("record-meeting", lambda cmd: time.sleep(0.5), timeout=0.05)
+
+    started = time.monotonic()
+    dispatcher.dispatch({"command": "record-meeting", "parameters": {}})
+    assert time.monotonic() - started < 0.05
+
+    result = _next_result(results)
+    assert result.status == "timeout"
+    # The late completion must not produce a second result
+    time.sleep(0.6)
+    assert results.empty()
+    dispatcher.shutdown()
+
+
+def test_timeout_starts_when_the_handler_starts():
+    """A command queued behind busy workers is not timed out before it runs"""
+    results = queue.Queue()
+    dispatcher = CommandDispatcher(results, max_workers=1)
+    dispatcher.register("build-app", lambda cmd: time.sleep(0.3))
+    dispatcher.register("record-meeting", lambda cmd: "recording", timeout=0.1)
+
+    dispatcher.dispatch({"command": "build-app", "parameters": {}})
+    dispatcher.dispatch({"command": "record-meeting", "parameters": {}})
+
+    first, second = _next_result(results), _next_result(results)
+    assert (first.command, first.status) == ("build-app", "ok")
+    assert (second.command, second.status) == ("record-meeting", "ok")
+    dispatcher.shutdown()
+
+
+def test_errors_and_unhandled_commands_are_reported():
+    """Handler exceptions and missing handlers become results, not crashes"""
+    results = queue.Queue()
+    dispatcher = CommandDispatcher(results)
+
+    def broken(cmd):
+        raise RuntimeError("boom")
+
+    dispatcher.register("analyze-meeting", broken)
+
+    dispatcher.dispatch({"command": "analyze-meeting", "parameters": {}})
+    assert _next_result(results).status == "error"
+
+    assert dispatcher.dispatch({"command": "create-component", "parameters": {}}) is None
+    assert _next_result(results).status == "unhandled"
+    dispatcher.shutdown()
+
+
+def test_build_app_is_reported_as_unsupported():
+    """No handler pretends app building started"""
+    results = queue.Queue()
+    dispatcher = CommandDispatcher(results)
+    register_default_handlers(dispatcher)
+
+    assert dispatcher.dispatch({"command": "build-app", "parameters": {"name": "demo"}}) is None
+    assert _next_result(results).status == "unhandled"
+    dispatcher.shutdown()
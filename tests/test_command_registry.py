@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled voice command registry
+"""
+
+from command_registry import CommandRegistry, build_default_registry
+
+
+def test_best_candidate_wins_over_first_hit():
+    """'create component' should not be swallowed by build-app"""
+    registry = build_default_registry()
+
+    assert registry.parse("create component type: button")["command"] == "create-component"
+    assert registry.parse("create a new app")["command"] == "build-app"
+
+
+def test_parameters_and_original_text():
+    """Parameter grammars are extracted in the same pass"""
+    registry = build_default_registry()
+
+    result = registry.parse("Build app type: react name: my-app")
+    assert result["command"] == "build-app"
+    assert result["parameters"] == {"type": "react", "name": "my-app"}
+    assert result["original_text"] == "build app type: react name: my-app"
+
+
+def test_keywords_match_whole_words_only():
+    """'renewal' must not trigger the 'new' keyword"""
+    registry = build_default_registry()
+
+    assert registry.parse("send the renewal notice")["command"] == "unknown"
+    assert registry.parse("start recording the zoom call")["command"] == "record-meeting"
+
+
+def test_match_scores_all_candidates():
+    """match() returns every candidate with at least one keyword"""
+    registry = build_default_registry()
+
+    matches = registry.match("build a form component")
+    names = [m.command for m in matches]
+    assert names[0] == "create-component"
+    assert "build-app" in names
+    assert matches[0].score > matches[-1].score
+
+
+def test_scales_to_many_commands():
+    """Hundreds of registered commands still compile into one automaton"""
+    registry = CommandRegistry()
+    for i in range(500):
+        registry.register(f"command-{i}", keywords=[f"action{i}"], context_keywords=[f"target{i}"])
+    registry.register_parameter("name", ["name:"])
+
+    result = registry.parse("please action321 the target321 name: demo")
+    assert result["command"] == "command-321"
+    assert result["parameters"] == {"name": "demo"}
+
+
+def test_fuzzy_match_recovers_asr_near_misses():
+    """Near-miss transcriptions resolve through the n-gram index"""
+    registry = build_default_registry()
+
+    result = registry.parse("bill the app")
+    assert result["command"] == "build-app"
+    assert result["match"] == "fuzzy"
+    assert result["score"] >= registry.fuzzy_threshold
+
+    assert registry.parse("create compo nent")["command"] == "create-component"
+    assert registry.parse("start recordin the meting")["command"] == "record-meeting"
+
+
+def test_fuzzy_match_leaves_dictation_alone():
+    """Ordinary sentences and long dictation never become commands"""
+    registry = build_default_registry()
+
+    assert registry.parse("thanks see you tomorrow")["command"] == "unknown"
+    long_text = "bill the app " + "and then we talk about the quarterly numbers " * 2
+    assert registry.fuzzy_match(long_text) is None
+
+
+def test_short_everyday_phrases_are_not_commands():
+    """A context word alone, or a word like a keyword, is not a fuzzy command"""
+    registry = build_default_registry()
+
+    for text in ["the meeting", "see you at the meeting", "stopping", "the application",
+                 "component", "recording", "notes and meeting"]:
+        assert registry.parse(text)["command"] == "unknown", text
+
+
+def test_fuzzy_match_honours_require_context():
+    """A near-miss of a require_context command still needs its context word"""
+    registry = CommandRegistry()
+    registry.register("stop-meeting", keywords=["stop"], context_keywords=["meeting"],
+                      phrases=["stop it now"], require_context=True)
+
+    assert registry.fuzzy_match("stop it now") is None
+    assert registry.fuzzy_match("stop the meting").command == "stop-meeting"
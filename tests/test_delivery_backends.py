@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for pluggable delivery backends, run headlessly
+"""
+
+import json
+import os
+
+from delivery_backends import RecordingBackend, X11Backend, default_backend
+from text_input_automation import TextInputAutomation
+
+FAKES_DIR = os.path.join(os.path.dirname(__file__), "fakes")
+
+
+def test_clipboard_delivery_lands_in_target_document():
+    backend = RecordingBackend(frontmost="Terminal", focus_delay=0.03)
+    automation = TextInputAutomation(backend=backend)
+
+    assert automation.auto_input_text("hello world", "cursor", "clipboard")
+
+    assert backend.documents == {"Cursor": "hello world"}
+    assert backend.actions() == ["focus", "set_clipboard", "paste"]
+    report = automation.last_report
+    assert report.success and report.elapsed_ms >= 30  # waited for focus, not a fixed sleep
+    assert automation.readiness.budget("Cursor", "focus", 1.0) == 1.0  # one sample is not enough yet
+
+
+def test_direct_typing_and_live_edits():
+    backend = RecordingBackend(frontmost="Notes")
+    automation = TextInputAutomation(backend=backend)
+
+    assert automation.auto_input_text("over", "active", "direct")
+    typer = automation.live_typer()
+    typer.update(" there")
+    typer.update(" their")
+
+    assert backend.documents["Notes"] == "over their"
+
+
+def test_failed_paste_is_reported():
+    backend = RecordingBackend(frontmost="Notes")
+    backend.failing.add("paste")
+    automation = TextInputAutomation(backend=backend)
+
+    assert not automation.auto_input_text("hello", "active", "clipboard")
+    assert not automation.last_report.success
+    assert "Notes" not in backend.documents
+
+
+def test_x11_maps_command_to_ctrl(tmp_path, monkeypatch):
+    log_path = tmp_path / "xdotool.log"
+    monkeypatch.setenv("PATH", FAKES_DIR + os.pathsep + os.environ.get("PATH", ""))
+    monkeypatch.setenv("FAKE_XDOTOOL_LOG", str(log_path))
+    backend = X11Backend()
+
+    assert backend.paste("command+shift+v")
+    assert backend.delete_backward(3)
+
+    calls = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert calls == [["key", "ctrl+shift+v"], ["key", "--repeat", "3", "BackSpace"]]
+
+
+def test_backend_override(monkeypatch):
+    monkeypatch.setenv("METAVOICE_DELIVERY_BACKEND", "recording")
+    assert default_backend().name == "recording"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the off-main-thread delivery executor
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from delivery_executor import DeliveryExecutor, ResponsivenessProbe
+from delivery_profiles import DeliveryReport
+
+
+class SlowAutomation:
+    """Stands in for TextInputAutomation: records calls and blocks like a real paste"""
+
+    def __init__(self):
+        self.calls = []
+        self.last_report = None
+
+    def auto_input_text(self, text, target_app, method, focused=False):
+        self.calls.append((text, target_app, method, focused, threading.current_thread().name))
+        time.sleep(0.05)
+        self.last_report = DeliveryReport(target_app, "clipboard", len(text), 50.0, True)
+        return True
+
+
+def drain(updates, until, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    seen = []
+    while time.monotonic() < deadline:
+        try:
+            seen.append(updates.get(timeout=0.05))
+        except queue.Empty:
+            continue
+        if seen[-1][0] == until:
+            break
+    return seen
+
+
+def test_delivery_runs_on_worker_and_reports_back():
+    updates = queue.Queue()
+    automation = SlowAutomation()
+    executor = DeliveryExecutor(automation, updates)
+    prefocus = Future()
+    prefocus.set_result(True)
+
+    started = time.monotonic()
+    executor.submit("hello", "cursor", "auto", prefocus=prefocus)
+    assert time.monotonic() - started < 0.04  # submit does not wait for the paste
+
+    seen = drain(updates, "delivery_result")
+    kinds = [kind for kind, _ in seen]
+    assert kinds[0] == "delivery_progress" and kinds[-1] == "delivery_result"
+    assert seen[-1][1].success and seen[-1][1].chars == 5
+    text, target, method, focused, thread_name = automation.calls[0]
+    assert focused and thread_name.startswith("metavoice-delivery")
+    executor.shutdown()
+
+
+def test_failing_automation_still_reports():
+    class BrokenAutomation(SlowAutomation):
+        def auto_input_text(self, *args, **kwargs):
+            raise RuntimeError("no accessibility permission")
+
+    updates = queue.Queue()
+    executor = DeliveryExecutor(BrokenAutomation(), updates)
+
+    executor.submit("hello", "cursor", "auto")
+
+    report = drain(updates, "delivery_result")[-1][1]
+    assert not report.success
+    executor.shutdown()
+
+
+def test_probe_measures_stalls():
+    """A blocked loop shows up as a late tick"""
+    pending = []
+    probe = ResponsivenessProbe(lambda ms, func, *args: pending.append((func, args)), interval_ms=10)
+
+    probe.start()
+    time.sleep(0.01)
+    func, args = pending.pop()
+    func(*args)  # on time
+    time.sleep(0.12)  # the "UI thread" is blocked
+    func, args = pending.pop()
+    func(*args)
+
+    assert probe.stop() >= 100
+    assert probe.ticks == 2
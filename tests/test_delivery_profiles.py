@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for per-application delivery profiles
+"""
+
+import time
+
+from delivery_profiles import DeliveryProfiles, split_keystroke
+
+
+def test_profiles_persist_and_rekey_by_bundle_id(tmp_path):
+    path = str(tmp_path / "profiles.json")
+    profiles = DeliveryProfiles(path)
+    profile = profiles.get("Cursor")
+    profile.paste_keystroke = "cmd+shift+v"
+    profiles.record(profile, "clipboard", True, 80.0)
+    profiles.close()
+
+    reloaded = DeliveryProfiles(path)
+    by_bundle = reloaded.get("Cursor", "com.todesktop.cursor")
+    assert by_bundle.key == "com.todesktop.cursor"
+    assert split_keystroke(by_bundle.paste_keystroke) == ("v", ["command", "shift"])
+    # Name-only lookups now find the bundle-keyed profile
+    assert reloaded.get("cursor") is by_bundle
+
+
+def test_fastest_reliable_method_wins(tmp_path):
+    profiles = DeliveryProfiles(str(tmp_path / "profiles.json"))
+    profile = profiles.get("Terminal")
+
+    for _ in range(3):
+        profiles.record(profile, "clipboard", True, 300.0)
+        profiles.record(profile, "direct", True, 60.0)
+    assert profile.input_method == "direct"
+
+    # A fast but unreliable method is not chosen
+    profile = profiles.get("Notes")
+    for success in (True, False, False):
+        profiles.record(profile, "direct", success, 10.0)
+    for _ in range(3):
+        profiles.record(profile, "clipboard", True, 200.0)
+    assert profile.input_method == "clipboard"
+
+
+def test_pinned_profiles_are_not_retuned(tmp_path):
+    profiles = DeliveryProfiles(str(tmp_path / "profiles.json"))
+    profile = profiles.get("Safari")
+    profile.pinned = True
+
+    for _ in range(5):
+        profiles.record(profile, "direct", True, 1.0)
+
+    assert profile.input_method == "clipboard"
+    assert profiles.choose_method(profile, "hi") == "clipboard"
+
+
+def test_method_follows_text_length(tmp_path):
+    """Direct typing wins short inserts; clipboard's flat overhead wins long ones"""
+    profiles = DeliveryProfiles(str(tmp_path / "profiles.json"))
+    profile = profiles.get("Cursor")
+    for chars in (10, 200, 1000):
+        profiles.record(profile, "clipboard", True, 150.0, chars)
+    for chars, ms in ((5, 50.0), (20, 140.0), (40, 260.0)):
+        profiles.record(profile, "direct", True, ms, chars)
+
+    overhead, per_char = profile.stats["direct"].cost_model((0.0, 0.0))
+    assert abs(overhead - 20.0) < 1 and abs(per_char - 6.0) < 0.1
+    assert profiles.choose_method(profile, "ok") == "direct"
+    assert profiles.choose_method(profile, "x" * 500) == "clipboard"
+
+
+def test_short_texts_explore_unmeasured_methods(tmp_path):
+    profiles = DeliveryProfiles(str(tmp_path / "profiles.json"), explore_every=4)
+    profile = profiles.get("Cursor")
+    for _ in range(3):
+        profiles.record(profile, "direct", True, 30.0, 5)
+    assert profile.input_method == "direct"
+
+    # Fourth delivery: clipboard has never been measured here, so it gets a turn
+    assert profiles.choose_method(profile, "short") == "clipboard"
+    assert profiles.choose_method(profile, "x" * 500) == "clipboard"
+
+
+def test_deliveries_are_saved_once_per_burst(tmp_path):
+    """Recording deliveries does not rewrite the file; the debounce timer writes once"""
+    path = tmp_path / "profiles.json"
+    profiles = DeliveryProfiles(str(path), save_delay=0.05)
+    profile = profiles.get("Notes")
+
+    for _ in range(20):
+        profiles.record(profile, "clipboard", True, 90.0, 12)
+    assert not path.exists()
+
+    time.sleep(0.2)
+    assert profiles.saves == 1
+    assert DeliveryProfiles(str(path)).get("Notes").stats["clipboard"].attempts == 20
+
+    profiles.close()  # Nothing pending: no extra write
+    assert profiles.saves == 1
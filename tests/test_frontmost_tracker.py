@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the frontmost application tracker
+"""
+
+import time
+
+from delivery_backends import RecordingBackend
+from frontmost_tracker import FrontmostTracker, shared_tracker, target_for_app
+from text_input_automation import TextInputAutomation
+
+
+def test_target_lookup():
+    assert target_for_app("Cursor") == "cursor"
+    assert target_for_app("Google Chrome Beta") == "chrome"
+    assert target_for_app("Finder") == "active"
+
+
+def test_feed_drives_auto_detection_without_system_queries():
+    """Synthetic app-switch events are all auto-detection needs"""
+    tracker = FrontmostTracker(ignore_pids=[4242])
+    switches = []
+    tracker.add_listener(lambda app: switches.append(app.name))
+    automation = TextInputAutomation(tracker=tracker)
+
+    tracker.feed("Safari", "com.apple.Safari", pid=100)
+    tracker.feed("Cursor", "com.todesktop.cursor", pid=200)
+    # Our own recorder window coming to the front does not replace the target
+    tracker.feed("Python", "org.python.python", pid=4242)
+
+    assert automation.auto_detect_target() == "cursor"
+    assert switches == ["Safari", "Cursor"]
+
+
+def test_reads_are_cached_within_ttl():
+    calls = []
+
+    def source():
+        calls.append(1)
+        return {"name": "Notes", "bundle_id": "com.apple.Notes", "pid": 300}
+
+    tracker = FrontmostTracker(source, ttl=60.0)
+
+    for _ in range(10):
+        assert tracker.current().target == "notes"
+    assert len(calls) == 1
+
+
+def test_polls_only_while_held():
+    calls = []
+
+    def source():
+        calls.append(1)
+        return {"name": "Notes", "bundle_id": "com.apple.Notes", "pid": 300}
+
+    tracker = FrontmostTracker(source, poll_interval=0.01, ttl=60.0)
+    time.sleep(0.05)
+    assert calls == []
+
+    with tracker.held():
+        with tracker.held():
+            time.sleep(0.05)
+        time.sleep(0.05)
+    assert len(calls) >= 2
+    time.sleep(0.05)  # Let a poll that was in flight finish
+
+    polled = len(calls)
+    time.sleep(0.05)
+    assert len(calls) == polled
+
+
+def test_automations_share_one_tracker():
+    first = TextInputAutomation(backend=RecordingBackend("Safari"))
+    second = TextInputAutomation(backend=RecordingBackend("Cursor"))
+    assert first.frontmost_tracker is second.frontmost_tracker is shared_tracker()
+
+    # The first backend queried stays the source until its automation closes
+    assert second.auto_detect_target() == "safari"
+    first.close()
+    shared_tracker(second.backend.frontmost)
+    assert second.frontmost_tracker.refresh().name == "Cursor"
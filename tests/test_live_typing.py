@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for minimal-diff live typing
+"""
+
+from live_typing import LiveTyper, minimal_edit
+from text_input_automation import TextInputAutomation
+
+
+class ScreenAutomation:
+    """Applies backspaces and typing to an in-memory 'text field'"""
+
+    def __init__(self, screen=""):
+        self.screen = screen
+        self.fail_deletes = False
+
+    def delete_backward(self, count):
+        if self.fail_deletes:
+            # Only part of the backspaces went through before the failure
+            self.screen = self.screen[:-1]
+            return False
+        self.screen = self.screen[:-count]
+        return True
+
+    def type_text_chunked(self, text):
+        self.screen += text
+        return True
+
+
+def test_minimal_edit():
+    assert minimal_edit("over there", "over their") == (2, "ir")
+    assert minimal_edit("hello", "hello world") == (0, " world")
+    assert minimal_edit("", "hi") == (0, "hi")
+    # A combining accent is deleted with its base character, never split from it
+    assert minimal_edit("café", "cafe") == (1, "e")
+
+
+def test_keystrokes_scale_with_the_change():
+    automation = ScreenAutomation()
+    typer = LiveTyper(automation)
+
+    for hypothesis in ("put it over", "put it over there", "put it over their", "put it over there now"):
+        assert typer.update(hypothesis)
+    assert typer.finish("put it over there now.")
+
+    assert automation.screen == "put it over there now."
+    # Retyping every hypothesis from scratch would cost ~90 keystrokes
+    assert typer.keystrokes == 11 + 6 + (2 + 2) + (2 + 6) + 1
+
+
+def test_failed_delete_stops_live_typing_for_the_utterance():
+    automation = ScreenAutomation("Notes: ")
+    typer = LiveTyper(automation)
+
+    assert typer.update("over there")
+    automation.fail_deletes = True
+    assert not typer.update("over their")
+    automation.fail_deletes = False
+    # Later revisions must not guess at the screen and delete text typed before the utterance
+    assert not typer.update("over")
+    assert not typer.finish("")
+    assert automation.screen == "Notes: over ther"
+
+    # The next utterance types normally again
+    assert typer.update(" next")
+    assert automation.screen == "Notes: over ther next"
+
+
+def test_backspaces_and_suffix_go_through_osascript(osascript_log):
+    typer = TextInputAutomation().live_typer()
+
+    typer.update("there")
+    typer.update("their")
+
+    calls = osascript_log()
+    assert len(calls) == 3  # "there", 2 backspaces, "ir"
+    assert calls[1][-1] == "2" and calls[2][-1] == "ir"
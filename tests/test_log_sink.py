@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded, frame-batched log sink
+"""
+
+import threading
+
+from log_sink import LogSink, render_lines
+
+
+class FakeText:
+    """Minimal stand-in for a Tk text widget's line-oriented API"""
+
+    def __init__(self):
+        self.content = ""
+
+    def insert(self, index, text):
+        assert index == "end"
+        self.content += text
+
+    def delete(self, start, end):
+        if end == "end":
+            self.content = ""
+            return
+        first_kept = int(end.split(".")[0])
+        self.content = "".join(self.content.splitlines(keepends=True)[first_kept - 1:])
+
+    def index(self, index):
+        assert index == "end-1c"
+        return f"{self.content.count(chr(10)) + 1}.0"
+
+    def see(self, index):
+        pass
+
+
+def make_sink(capacity=5):
+    requests = []
+    sink = LogSink(lambda: requests.append(1), capacity=capacity)
+    text = FakeText()
+    sink.attach(lambda lines, replace: render_lines(text, lines, replace, capacity))
+    return sink, text, requests
+
+
+def test_writes_between_frames_coalesce_into_one_flush():
+    sink, text, requests = make_sink()
+    for i in range(3):
+        sink.write(f"line {i}")
+
+    assert len(requests) == 1
+    assert text.content == ""
+    assert sink.flush() == 3
+    assert sink.flushes == 1
+    assert text.content.count("\n") == 3 and "line 2" in text.content
+
+    sink.write("next")
+    assert len(requests) == 2
+
+
+def test_buffer_and_widget_stay_bounded():
+    sink, text, _ = make_sink(capacity=5)
+    for i in range(8):
+        sink.write(f"line {i}")
+        if i % 3 == 0:
+            sink.flush()
+    sink.flush()
+
+    assert len(sink.lines) == 5
+    shown = text.content.splitlines()
+    assert len(shown) == 5
+    assert shown[0].endswith("line 3") and shown[-1].endswith("line 7")
+
+
+def test_overflow_between_flushes_replaces_the_view():
+    sink, text, _ = make_sink(capacity=3)
+    sink.write("old")
+    sink.flush()
+    for i in range(4):
+        sink.write(f"burst {i}")
+    sink.flush()
+
+    shown = text.content.splitlines()
+    assert [line.split("] ")[1] for line in shown] == ["burst 1", "burst 2", "burst 3"]
+
+
+def test_view_attached_later_sees_buffered_lines():
+    sink = LogSink(lambda: None, capacity=4)
+    sink.write("before the dashboard opened")
+    text = FakeText()
+    sink.attach(lambda lines, replace: render_lines(text, lines, replace, 4))
+    assert "before the dashboard opened" in text.content
+
+
+def test_concurrent_writes_request_one_flush():
+    requests = []
+    sink = LogSink(lambda: requests.append(1), capacity=1000)
+    workers = [threading.Thread(target=lambda: [sink.write("x") for _ in range(100)]) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(requests) == 1
+    assert sink.flush() == 400
+
+
+def test_clear_empties_buffer_and_views():
+    sink, text, _ = make_sink()
+    sink.write("gone")
+    sink.flush()
+    sink.clear()
+    assert text.content == "" and len(sink.lines) == 0
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for rolling-segment meeting recording
+"""
+
+import os
+import threading
+import time
+import wave
+
+from meeting_recorder import MeetingRecorder
+
+
+class FakeStream:
+    """Produces silent 16-bit chunks at (much faster than) real time"""
+
+    def __init__(self):
+        self.reads = 0
+
+    def read(self, chunk):
+        self.reads += 1
+        time.sleep(0.0005)
+        return b"\x00\x00" * chunk
+
+
+class FakeWhisper:
+    def __init__(self):
+        self.transcribed = []
+        self.threads = set()
+
+    def transcribe_audio_file(self, path, speed_mode="balanced"):
+        self.transcribed.append(os.path.basename(path))
+        self.threads.add(threading.current_thread().name)
+        return {"text": "hello team", "segments": [{"start": 1.5, "end": 3.0, "text": "hello team"}]}
+
+
+def test_segments_roll_and_transcript_is_timestamped(tmp_path):
+    """Audio is split into segment files transcribed in the background"""
+    whisper = FakeWhisper()
+    stream = FakeStream()
+    recorder = MeetingRecorder(whisper, output_dir=str(tmp_path), segment_seconds=1,
+                               sample_rate=16000, chunk=1600,
+                               stream_factory=lambda: (stream, 2, lambda: None))
+
+    recorder.start()
+    # 10 chunks per one-second segment; wait for at least three segments
+    while stream.reads < 30:
+        time.sleep(0.01)
+    assert len(whisper.transcribed) >= 1  # transcription runs while recording continues
+    transcript_path = recorder.stop()
+
+    segment_files = sorted(f for f in os.listdir(recorder.meeting_dir) if f.endswith(".wav"))
+    assert len(segment_files) == len(recorder.segments) >= 3
+    with wave.open(os.path.join(recorder.meeting_dir, segment_files[0])) as wf:
+        assert wf.getnframes() == 16000
+
+    assert sorted(whisper.transcribed) == segment_files
+    assert threading.current_thread().name not in whisper.threads
+
+    with open(transcript_path) as f:
+        transcript = f.read()
+    assert "[00:00:01] hello team" in transcript
+    assert "[00:00:02] hello team" in transcript
+
+
+class FailingStream(FakeStream):
+    """Fails like a disconnected microphone after a number of reads"""
+
+    def __init__(self, fail_after):
+        super().__init__()
+        self.fail_after = fail_after
+
+    def read(self, chunk):
+        if self.reads >= self.fail_after:
+            raise OSError("Input overflowed")
+        return super().read(chunk)
+
+
+def test_stop_meeting_finalizes_after_capture_dies(tmp_path):
+    """Segments recorded before a microphone error are still transcribed on stop"""
+    from command_handlers import make_meeting_handlers
+
+    whisper = FakeWhisper()
+    stream = FailingStream(fail_after=15)
+    recorder = MeetingRecorder(whisper, output_dir=str(tmp_path), segment_seconds=1,
+                               sample_rate=16000, chunk=1600,
+                               stream_factory=lambda: (stream, 2, lambda: None))
+    _, handle_stop_meeting = make_meeting_handlers(recorder)
+
+    recorder.start()
+    while recorder.is_recording:
+        time.sleep(0.01)
+    assert recorder.has_session
+
+    message = handle_stop_meeting({"command": "stop-meeting"})
+    assert "transcript ready" in message and "Input overflowed" in message
+    assert not recorder.has_session
+    assert len(whisper.transcribed) == 2  # The full segment and the partial one
+    assert handle_stop_meeting({"command": "stop-meeting"}) == "📹 No meeting is being recorded"
+
+
+class SlowWhisper(FakeWhisper):
+    def transcribe_audio_file(self, path, speed_mode="balanced"):
+        time.sleep(0.3)
+        return super().transcribe_audio_file(path, speed_mode)
+
+
+def test_worker_outliving_stop_does_not_touch_the_next_session(tmp_path):
+    """A stop() that times out leaves the old worker on its own queue and segments"""
+    whisper = SlowWhisper()
+    streams = []
+
+    def open_stream():
+        streams.append(FakeStream())
+        return streams[-1], 2, lambda: None
+
+    recorder = MeetingRecorder(whisper, output_dir=str(tmp_path), segment_seconds=1,
+                               sample_rate=16000, chunk=1600, stream_factory=open_stream)
+
+    recorder.start()
+    while not streams or streams[0].reads < 20:
+        time.sleep(0.01)
+    with open(recorder.stop(timeout=0.05)) as f:
+        assert "(not transcribed before stop)" in f.read()
+    first_dir, first_segments = recorder.meeting_dir, recorder.segments
+
+    recorder.start()
+    assert recorder.meeting_dir != first_dir
+    while len(streams) < 2 or streams[1].reads < 10:
+        time.sleep(0.01)
+    with open(recorder.stop(timeout=10.0)) as f:
+        transcript = f.read()
+
+    assert "(not transcribed before stop)" not in transcript
+    assert recorder.segments is not first_segments
+    assert all(segment.path.startswith(recorder.meeting_dir) for segment in recorder.segments)
+    # The old worker finishes its own segments in the background
+    deadline = time.monotonic() + 5.0
+    while not all(segment.lines for segment in first_segments) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert all(segment.lines for segment in first_segments)
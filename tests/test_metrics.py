@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the metrics registry and its Prometheus endpoint
+"""
+
+import socket
+import urllib.error
+import urllib.request
+
+import pytest
+
+from metrics import Histogram, MetricsRegistry, MetricsServer, format_percentiles
+
+
+def test_histogram_percentiles_use_nearest_rank():
+    histogram = Histogram("latency_seconds", "test")
+    assert histogram.quantile(0.5) is None
+    assert format_percentiles(histogram) == "no data yet"
+    for value in range(1, 101):
+        histogram.observe(value / 100)
+    assert histogram.percentiles() == {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+    assert format_percentiles(histogram) == "p50 0.50s · p95 0.95s · p99 0.99s"
+
+
+def test_percentiles_cover_a_recent_window():
+    histogram = Histogram("latency_seconds", "test", window=10)
+    for _ in range(100):
+        histogram.observe(5.0)
+    for _ in range(10):
+        histogram.observe(0.1)
+    assert histogram.quantile(0.99) == 0.1
+    assert histogram.count == 110  # Prometheus totals still count everything
+
+
+def test_prometheus_rendering():
+    registry = MetricsRegistry()
+    takes = registry.counter("takes_total", "Takes")
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.5, 1.0))
+    assert registry.counter("takes_total", "Takes") is takes
+    takes.inc()
+    takes.inc(2)
+    latency.observe(0.2)
+    latency.observe(0.5)
+    latency.observe(3.0)
+
+    lines = registry.render_prometheus().splitlines()
+    assert "# TYPE takes_total counter" in lines
+    assert "takes_total 3" in lines
+    assert 'latency_seconds_bucket{le="0.5"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_sum 3.7" in lines
+    assert "latency_seconds_count 3" in lines
+
+
+def test_registering_a_name_twice_with_another_type_fails():
+    registry = MetricsRegistry()
+    registry.counter("takes_total", "Takes")
+    with pytest.raises(ValueError):
+        registry.histogram("takes_total", "Takes")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_endpoint_serves_metrics_on_localhost():
+    registry = MetricsRegistry()
+    registry.counter("takes_total", "Takes").inc()
+    server = MetricsServer(registry, port=free_port())
+    assert server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            assert response.status == 200
+            assert "takes_total 1" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other", timeout=5)
+    finally:
+        server.stop()
+
+
+def test_port_zero_disables_the_endpoint():
+    assert not MetricsServer(MetricsRegistry(), port=0).start()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard's rolling performance charts
+"""
+
+from metrics import Gauge
+from perf_chart import CHART_PAD, RollingChart, chart_coords
+
+
+class FakeCanvas:
+    """Records canvas item calls"""
+
+    def __init__(self):
+        self.items = {}
+        self.created = 0
+        self.coords_calls = 0
+
+    def _create(self, kind, coords, options):
+        self.created += 1
+        self.items[self.created] = {"kind": kind, "coords": list(coords), **options}
+        return self.created
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_text(self, x, y, **options):
+        return self._create("text", (x, y), options)
+
+    def coords(self, item, *coords):
+        self.coords_calls += 1
+        self.items[item]["coords"] = list(coords)
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+
+
+def test_coords_put_newest_value_on_the_right():
+    coords = chart_coords([0.0, 1.0], width=100, height=50, y_max=1.0, capacity=3)
+    # Two slots from the right edge, bottom for 0 and top for y_max
+    assert coords == [50.0, 50 - CHART_PAD, 100 - CHART_PAD, CHART_PAD]
+
+
+def test_single_and_empty_series_still_make_a_line():
+    assert len(chart_coords([], 100, 50, 1.0)) == 4
+    assert len(chart_coords([0.5], 100, 50, 1.0)) == 4
+
+
+def test_values_above_the_scale_are_clipped():
+    coords = chart_coords([5.0], 100, 50, y_max=1.0)
+    assert coords[1] == CHART_PAD
+
+
+def test_update_moves_existing_items_only_when_data_changes():
+    canvas = FakeCanvas()
+    chart = RollingChart(canvas, "Stop → Text", 200, 80, unit="s")
+    created = canvas.created
+
+    assert chart.update([0.8, 1.2])
+    assert not chart.update([0.8, 1.2])
+    assert chart.update([0.8, 1.2, 0.9])
+
+    assert canvas.created == created  # No items added after construction
+    assert canvas.coords_calls == 2
+    assert canvas.items[chart.readout]["text"] == "last 0.90s · max 1.20s"
+    assert len(canvas.items[chart.line]["coords"]) == 6
+
+
+def test_chart_follows_a_gauge_history():
+    gauge = Gauge("queue_depth", "test")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    assert gauge.value == 1
+    assert gauge.recent(60) == [1, 2, 1]
+
+    canvas = FakeCanvas()
+    chart = RollingChart(canvas, "Delivery Queue Depth", 200, 80, min_scale=2.0)
+    chart.update(gauge.recent(60))
+    assert canvas.items[chart.readout]["text"] == "last 1.00 · max 2.00"
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for condition-based waits and readiness history
+"""
+
+import time
+
+from readiness import ReadinessHistory, wait_until
+
+
+def test_wait_until_returns_as_soon_as_ready():
+    """A condition that holds after a few polls returns well before the deadline"""
+    ready_at = time.monotonic() + 0.03
+
+    waited = wait_until(lambda: time.monotonic() >= ready_at, timeout=1.0)
+
+    assert waited is not None and waited < 0.2
+
+
+def test_wait_until_times_out():
+    started = time.monotonic()
+
+    assert wait_until(lambda: False, timeout=0.05) is None
+    assert time.monotonic() - started < 0.2
+
+
+def test_budget_tracks_observed_times(tmp_path):
+    """Fast apps get short budgets, timeouts grow them, and samples persist"""
+    path = str(tmp_path / "readiness.json")
+    history = ReadinessHistory(path)
+
+    assert history.budget("Cursor", "focus", 1.0) == 1.0  # not enough samples yet
+    for _ in range(10):
+        history.record("Cursor", "focus", 0.02)
+    fast_budget = history.budget("cursor", "focus", 1.0)
+    assert 0.1 <= fast_budget < 0.2
+
+    for _ in range(3):
+        history.record("Cursor", "focus", None)
+    history.close()
+    assert ReadinessHistory(path).budget("Cursor", "focus", 1.0) > fast_budget
+
+
+def test_samples_are_saved_once_per_burst(tmp_path):
+    """Recording does not rewrite the file; the debounce timer writes once"""
+    path = tmp_path / "readiness.json"
+    history = ReadinessHistory(str(path), save_delay=0.05)
+
+    for _ in range(20):
+        history.record("Cursor", "clipboard", 0.01)
+    assert not path.exists()
+
+    time.sleep(0.2)
+    assert history.saves == 1
+    assert ReadinessHistory(str(path)).budget("Cursor", "clipboard", 1.0) == 0.1
+
+    history.close()  # Nothing pending: no extra write
+    assert history.saves == 1
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for Chrome trace export of session spans
+"""
+
+import json
+import threading
+import time
+
+from app_logging import current_take
+from session_trace import SessionTrace
+from take_timing import TakeTimeline
+
+
+def test_disabled_trace_records_nothing():
+    trace = SessionTrace()
+    with trace.span("work"):
+        pass
+    trace.instant("stop")
+    trace.counter("ui_queue", depth=1)
+    assert trace.to_chrome_trace()["traceEvents"][1:] == []
+
+
+def test_spans_land_on_their_threads():
+    trace = SessionTrace(enabled=True)
+    with trace.span("ui_drain", "ui", handled=2):
+        pass
+
+    def worker():
+        trace.complete("deliver", time.monotonic() - 0.01, cat="delivery")
+
+    thread = threading.Thread(target=worker, name="metavoice-delivery_0")
+    thread.start()
+    thread.join()
+
+    events = trace.to_chrome_trace()["traceEvents"]
+    names = {e["args"]["name"]: e["tid"] for e in events if e["name"] == "thread_name"}
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert spans["deliver"]["tid"] == names["metavoice-delivery_0"]
+    assert spans["ui_drain"]["tid"] == names[threading.current_thread().name]
+    assert spans["ui_drain"]["args"] == {"handled": 2}
+    assert spans["deliver"]["dur"] >= 10000  # Microseconds
+
+
+def test_events_are_tagged_with_the_take():
+    trace = SessionTrace(enabled=True)
+    token = current_take.set("101530-4")
+    try:
+        trace.instant("stop")
+    finally:
+        current_take.reset(token)
+    event = trace.to_chrome_trace()["traceEvents"][-1]
+    assert event["ph"] == "i" and event["args"]["take"] == "101530-4"
+
+
+def test_buffer_is_bounded():
+    trace = SessionTrace(enabled=True, max_events=3)
+    for i in range(5):
+        trace.counter("ui_queue", depth=i)
+    assert trace.dropped == 2
+    depths = [e["args"]["depth"] for e in trace.to_chrome_trace()["traceEvents"] if e["ph"] == "C"]
+    assert depths == [2, 3, 4]
+
+
+def test_take_stages_become_spans(tmp_path, monkeypatch):
+    trace = SessionTrace(enabled=True)
+    monkeypatch.setattr("take_timing.tracer", trace)
+    timeline = TakeTimeline("t-1")
+    start = time.monotonic()
+    timeline.add_stage("whisper_process", start, start + 0.5)
+    timeline.event("delivered")
+
+    path = str(tmp_path / "trace.json")
+    assert trace.export(path) == 2
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    span = next(e for e in events if e["name"] == "whisper_process")
+    assert span["cat"] == "take" and span["args"]["take"] == "t-1"
+    assert span["dur"] == 500000
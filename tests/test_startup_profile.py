@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the startup profiler
+"""
+
+import builtins
+import sys
+import time
+
+from startup_profile import StartupProfiler
+
+
+def test_steps_and_marks_are_contiguous():
+    profiler = StartupProfiler()
+    with profiler.step("setup"):
+        time.sleep(0.01)
+    time.sleep(0.01)
+    profiler.mark("window")
+
+    setup, window = profiler.steps
+    assert setup.name == "setup" and setup.elapsed_ms >= 10
+    # A mark covers the time since the previous step ended
+    assert window.started_ms >= setup.started_ms + setup.elapsed_ms - 0.01
+    assert window.elapsed_ms >= 10
+    assert "window" in profiler.report()
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StartupProfiler(enabled=False)
+    with profiler.step("setup"):
+        pass
+    profiler.mark("window")
+    profiler.track_imports()
+
+    assert profiler.steps == []
+    assert profiler._original_import is None
+    assert profiler.report() == ""
+
+
+def test_imports_are_timed_by_self_time(tmp_path, monkeypatch):
+    (tmp_path / "slow_leaf.py").write_text("import time\ntime.sleep(0.03)\n")
+    (tmp_path / "slow_parent.py").write_text("import slow_leaf\nimport time\ntime.sleep(0.01)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("slow_leaf", "slow_parent"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    original = builtins.__import__
+    profiler = StartupProfiler()
+    profiler.track_imports()
+    try:
+        import slow_parent  # noqa: F401
+    finally:
+        profiler.stop_tracking()
+
+    assert builtins.__import__ is original
+    assert profiler.imports["slow_leaf"] >= 30
+    # The parent's own time excludes the leaf it imported
+    assert 10 <= profiler.imports["slow_parent"] < 30
+    assert "slow_leaf" in profiler.report()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for per-take stage timelines
+"""
+
+import json
+import threading
+
+import pytest
+
+import take_timing
+from app_logging import current_take, in_current_take
+from take_timing import TakeTimeline, TakeTimings, parse_whisper_timings
+
+
+@pytest.fixture(autouse=True)
+def no_take():
+    current_take.set(None)
+    yield
+    current_take.set(None)
+
+
+def test_breakdown_attributes_stop_to_text_window():
+    timeline = TakeTimeline("t", started=0.0)
+    timeline.add_stage("capture", 0.0, 5.0)
+    timeline.event("stop", 5.0)
+    timeline.add_stage("whisper_process", 5.0, 5.8)
+    timeline.add_stage("prefocus", 5.1, 5.3)  # Runs alongside decoding
+    timeline.add_stage("paste", 5.85, 5.9)
+    timeline.event("delivered", 5.9)
+
+    assert timeline.stop_to_text_ms() == pytest.approx(900)
+    breakdown = timeline.breakdown()
+    assert list(breakdown) == ["whisper_process", "prefocus", "paste"]
+    assert breakdown["whisper_process"] == pytest.approx(800)
+    assert breakdown["paste"] == pytest.approx(50)
+    assert "stop→text 900ms" in timeline.format_line()
+
+
+def test_stop_falls_back_to_end_of_capture():
+    timeline = TakeTimeline("t", started=0.0)
+    timeline.add_stage("capture", 0.0, 20.0)
+    timeline.event("delivered", 21.0)
+    assert timeline.stop_to_text_ms() == pytest.approx(1000)
+
+
+def test_undelivered_take_has_no_total():
+    timeline = TakeTimeline("t")
+    timeline.event("stop")
+    assert timeline.stop_to_text_ms() is None
+    assert timeline.breakdown() == {}
+    assert "not delivered" in timeline.format_line()
+
+
+def test_parse_whisper_timings():
+    stderr = ("whisper_print_timings:     load time =    84.12 ms\n"
+              "whisper_print_timings:   encode time =   512.00 ms\n"
+              "whisper_print_timings:    total time =   901.50 ms\n")
+    assert parse_whisper_timings(stderr) == {"load": 84.12, "encode": 512.0, "total": 901.5}
+    assert parse_whisper_timings(None) == {}
+
+
+def test_helpers_are_noops_outside_a_take():
+    with take_timing.stage("focus"):
+        pass
+    take_timing.event("stop")
+    take_timing.report("whisper_load", 1.0)
+    assert take_timing.current_timeline() is None
+
+
+def test_stages_follow_the_take_into_threads():
+    take_id = take_timing.begin_take()
+
+    def work():
+        with take_timing.stage("paste"):
+            pass
+        take_timing.event("delivered")
+
+    thread = threading.Thread(target=in_current_take(work))
+    thread.start()
+    thread.join()
+
+    timeline = take_timing.timings.get(take_id)
+    assert [stage.name for stage in timeline.stages] == ["paste"]
+    assert timeline.stages[0].thread == thread.name
+    assert "delivered" in timeline.events
+
+
+def test_store_is_bounded_and_exports_jsonl(tmp_path):
+    store = TakeTimings(max_takes=2)
+    for take_id in ("a", "b", "c"):
+        store.begin(take_id).event("stop")
+    assert store.get("a") is None
+    assert [t.take_id for t in store.recent()] == ["b", "c"]
+
+    path = str(tmp_path / "takes.jsonl")
+    assert store.export_jsonl(path) == 2
+    with open(path) as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["take_id"] for row in rows] == ["b", "c"]
+    assert "stop" in rows[0]["events"]
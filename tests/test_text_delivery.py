@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for text delivery using a fake osascript on PATH
+"""
+
+from text_input_automation import TextInputAutomation
+
+
+def test_clipboard_delivery_is_one_process_spawn(osascript_log):
+    """Focus, clipboard and paste happen in a single osascript run"""
+    automation = TextInputAutomation()
+    text = 'He said "ship it" \\ then\nleft'
+
+    assert automation.auto_input_text(text, "cursor", "clipboard")
+
+    calls = osascript_log()
+    assert len(calls) == 1
+    script_flag, script, sent_text, app_name, focus_budget, clipboard_budget, key, modifiers = calls[0]
+    assert script_flag == "-e" and "on run argv" in script
+    assert sent_text == text  # passed through argv, no escaping
+    assert app_name == "Cursor"
+    assert float(focus_budget) > 0 and float(clipboard_budget) > 0
+    assert (key, modifiers) == ("v", "command")
+
+
+def test_script_waits_feed_readiness_history(osascript_log, monkeypatch):
+    """Waits reported by the delivery script are recorded and tune later budgets"""
+    monkeypatch.setenv("FAKE_OSASCRIPT_STDOUT", "Cursor|40|-1")
+    automation = TextInputAutomation()
+
+    for _ in range(5):
+        assert automation.deliver_text("hello", "cursor")
+
+    assert automation.readiness.budget("Cursor", "focus", 1.0) < 0.2
+    # Every clipboard wait timed out, so that budget grows instead
+    assert automation.readiness.budget("Cursor", "clipboard", 0.5) > 0.5
+
+
+def test_active_target_skips_focus(osascript_log):
+    """'active' pastes into whatever is frontmost"""
+    automation = TextInputAutomation()
+
+    assert automation.deliver_text("hello", "active")
+    assert osascript_log()[0][3] == ""
+
+
+def test_failed_script_falls_back_to_step_by_step(osascript_log, monkeypatch):
+    """A failing single-script run falls back to the legacy path"""
+    monkeypatch.setenv("FAKE_OSASCRIPT_EXIT", "1")
+    automation = TextInputAutomation()
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+    automation.auto_input_text("hello", "notes", "clipboard")
+
+    assert len(osascript_log()) > 1
+
+
+def test_prefocus_skips_activation_when_target_is_frontmost(osascript_log, monkeypatch):
+    """A target that is still frontmost costs one check and no activate"""
+    monkeypatch.setenv("FAKE_OSASCRIPT_STDOUT", "true")
+    automation = TextInputAutomation()
+
+    assert automation.prefocus_async("cursor").result(timeout=5)
+
+    calls = osascript_log()
+    assert len(calls) == 1 and "frontmost" in calls[0][1]
+    assert "activate" not in calls[0][1]
+    # No focus happened, so the focus-latency history gets no zero-wait sample
+    assert automation.readiness.budget("Cursor", "focus", 1.0) == 1.0
+    for _ in range(5):
+        assert automation.prefocus("cursor")
+    assert automation.readiness.budget("Cursor", "focus", 1.0) == 1.0
+
+
+def test_focused_delivery_only_pastes(osascript_log):
+    """After a prefocus the delivery script is not asked to activate anything"""
+    automation = TextInputAutomation()
+
+    assert automation.auto_input_text("hello", "cursor", "clipboard", focused=True)
+
+    assert osascript_log()[0][3] == ""
+
+
+def test_direct_typing_is_chunked_and_reported(osascript_log):
+    """Long text is typed in argv-passed chunks and the insertion's throughput is reported"""
+    automation = TextInputAutomation()
+    text = "word " * 20
+
+    assert automation.auto_input_text(text, "active", "direct", focused=True)
+
+    chunks = [call[2] for call in osascript_log()]
+    assert "".join(chunks) == text and len(chunks) == 4
+    report = automation.last_report
+    assert report.method == "direct" and report.chars == len(text) and report.success
+    assert report.chars_per_second > 0
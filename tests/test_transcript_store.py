@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite transcript history store
+"""
+
+from transcript_store import TranscriptStore
+
+
+def test_add_and_page_newest_first(tmp_path):
+    """Pages are returned newest first with keyset pagination"""
+    store = TranscriptStore(str(tmp_path / "history.db"))
+    for i in range(120):
+        store.add(f"note number {i}", target_app="cursor", model="ggml-base.en.bin", latency_ms=250.0)
+
+    first = store.page(limit=50)
+    assert [r.text for r in first[:2]] == ["note number 119", "note number 118"]
+
+    second = store.page(before_id=first[-1].id, limit=50)
+    third = store.page(before_id=second[-1].id, limit=50)
+    assert len(first) == len(second) == 50 and len(third) == 20
+    assert store.count() == 120
+    assert first[0].target_app == "cursor" and first[0].latency_ms == 250.0
+
+
+def test_full_text_search_with_prefixes(tmp_path):
+    """Every query word must match, and partial words match as prefixes"""
+    store = TranscriptStore(str(tmp_path / "history.db"))
+    store.add("refactor the payment service")
+    store.add("email the design team about the payment flow")
+    store.add("lunch at noon")
+
+    assert [r.text for r in store.page("payment")] == [
+        "email the design team about the payment flow",
+        "refactor the payment service",
+    ]
+    assert [r.text for r in store.page("pay serv")] == ["refactor the payment service"]
+    assert store.page("dinner") == []
+
+
+def test_clear_removes_records_and_index(tmp_path):
+    """Clearing history also empties the search index"""
+    store = TranscriptStore(str(tmp_path / "history.db"))
+    store.add("remember the milk")
+    store.clear()
+
+    assert store.count() == 0
+    assert store.page("milk") == []
+    store.add("remember the eggs")
+    assert [r.text for r in store.page("remember")] == ["remember the eggs"]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for event-driven UI wakeups
+"""
+
+import threading
+import tkinter as tk
+
+from ui_notifier import WAKE_EVENT, UINotifier
+
+
+class FakeRoot:
+    """Stands in for the Tk root: queues generated events until the loop 'runs'"""
+
+    def __init__(self, running=True):
+        self.running = running
+        self.bindings = {}
+        self.idle = []
+        self.pending_events = []
+
+    def bind(self, event, callback):
+        self.bindings[event] = callback
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def event_generate(self, event, when=None):
+        if not self.running:
+            raise RuntimeError("main thread is not in main loop")
+        self.pending_events.append(event)
+
+    def run_pending(self):
+        for callback in self.idle:
+            callback()
+        self.idle = []
+        events, self.pending_events = self.pending_events, []
+        for event in events:
+            self.bindings[event]()
+
+
+def make_notifier(root):
+    handled = []
+
+    def drain():
+        count = 0
+        while not notifier.queue.empty():
+            handled.append(notifier.queue.get_nowait())
+            count += 1
+        return count
+
+    notifier = UINotifier(root, drain)
+    return notifier, handled
+
+
+def test_burst_of_puts_coalesces_into_one_wakeup():
+    root = FakeRoot()
+    notifier, handled = make_notifier(root)
+    root.idle = []  # Main loop already running
+
+    workers = [threading.Thread(target=notifier.queue.put, args=(("transcription", str(i)),)) for i in range(5)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert root.pending_events == [WAKE_EVENT]
+    root.run_pending()
+    assert len(handled) == 5
+    assert notifier.stats() == {"notifications": 5, "wakeups": 1, "empty_wakeups": 0}
+
+
+def test_put_after_wakeup_schedules_another():
+    root = FakeRoot()
+    notifier, handled = make_notifier(root)
+    root.idle = []
+
+    notifier.queue.put(("error", "a"))
+    root.run_pending()
+    notifier.queue.put(("error", "b"))
+    root.run_pending()
+
+    assert [item[1] for item in handled] == ["a", "b"]
+    assert notifier.wakeups == 2
+
+
+def test_no_puts_means_no_wakeups():
+    root = FakeRoot()
+    notifier, _ = make_notifier(root)
+    root.idle = []
+
+    root.run_pending()
+    assert notifier.wakeups == 0
+
+
+def test_puts_before_main_loop_drain_on_first_idle_pass():
+    root = FakeRoot(running=False)
+    notifier, handled = make_notifier(root)
+
+    notifier.queue.put(("transcription", "early"))
+    assert root.pending_events == []
+
+    root.running = True
+    root.run_pending()
+    assert handled == [("transcription", "early")]
+    # A later put still wakes the loop: the failed notify did not leave a stale pending flag
+    notifier.queue.put(("transcription", "late"))
+    assert root.pending_events == [WAKE_EVENT]
+
+
+def test_tcl_error_is_treated_like_a_stopped_loop():
+    class DestroyedRoot(FakeRoot):
+        def event_generate(self, event, when=None):
+            raise tk.TclError("application has been destroyed")
+
+    notifier, _ = make_notifier(DestroyedRoot())
+    notifier.queue.put(("transcription", "late"))
+    notifier.queue.put(("transcription", "later"))
+    assert notifier.notifications == 2
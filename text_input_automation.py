@@ -2,23 +2,188 @@
 """
 Text Input Automation for macOS
 Automatically inputs transcribed text into Cursor or any input box
+(platform operations go through a delivery backend, see delivery_backends.py)
 """
 
 import subprocess
 import time
 import json
+import logging
 import os
+import sys
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any
+from automation_helper import AutomationHelperClient
+from delivery_backends import DeliveryBackend, DeliveryInterrupted, default_backend, run_applescript
+from readiness import ReadinessHistory, wait_until
+from frontmost_tracker import FrontmostTracker, shared_tracker, target_for_app
+from live_typing import LiveTyper
+from delivery_profiles import DeliveryProfile, DeliveryProfiles, DeliveryReport, INPUT_METHODS, split_keystroke
+from app_logging import current_take, get_logger, in_current_take
+import take_timing
+
+log = get_logger("automation")
+
+# Application names for the target keys offered in settings
+TARGET_APPLICATIONS = {
+    "cursor": "Cursor",
+    "qoder": "Qoder",
+    "vscode": "Visual Studio Code",
+    "pycharm": "PyCharm",
+    "safari": "Safari",
+    "chrome": "Google Chrome",
+    "terminal": "Terminal",
+    "notes": "Notes"
+}
+
+# pyautogui names for modifier keys (see split_keystroke)
+PYAUTOGUI_MODIFIERS = {"control": "ctrl"}
+
+# Fallback wait budgets (seconds) until an app has readiness history
+DEFAULT_FOCUS_BUDGET = 1.0
+DEFAULT_CLIPBOARD_BUDGET = 0.5
 
 class TextInputAutomation:
-    def __init__(self):
-        """Initialize text input automation"""
+    def __init__(self, helper: Optional[AutomationHelperClient] = None,
+                 readiness: Optional[ReadinessHistory] = None,
+                 tracker: Optional[FrontmostTracker] = None,
+                 profiles: Optional[DeliveryProfiles] = None,
+                 backend: Optional[DeliveryBackend] = None):
+        """
+        Initialize text input automation
+        
+        Args:
+            helper: Long-lived automation helper; on macOS one is started lazily by default
+            readiness: Per-app readiness history used to size focus/clipboard waits
+            tracker: Frontmost-app tracker (defaults to the process-wide one, queried through the backend)
+            profiles: Per-app delivery profiles learned from past insertions
+            backend: Platform operations (defaults to macOS, or X11 on Linux desktops)
+        """
         self.clipboard_methods = ["applescript", "pbcopy", "pyautogui"]
         self.input_methods = ["applescript", "pyautogui", "keyboard"]
         
         # Initialize macOS compatibility
         self._setup_macos_compatibility()
         
+        # Scripts go through one persistent helper instead of an osascript launch each
+        if backend is None and helper is None and sys.platform == "darwin" and self.macos_available:
+            helper = AutomationHelperClient()
+        self.helper = helper
+        self.backend = backend or default_backend(helper)
+        self.readiness = readiness or ReadinessHistory()
+        # Focusing the target runs here while whisper is still decoding
+        self._focus_executor = None
+        
+        # Frontmost app kept in memory and shared by the process; polled in the background
+        # only during a take (see tracking_frontmost) and when the helper makes that cheap
+        self._shares_tracker = tracker is None
+        if tracker is None:
+            tracker = shared_tracker(self.backend.frontmost)
+        self.frontmost_tracker = tracker
+        self._poll_frontmost = self.helper is not None
+        self.profiles = profiles or DeliveryProfiles()
+        self.last_report: Optional[DeliveryReport] = None
+        
+    def _run_osascript(self, script: str, *args: str) -> subprocess.CompletedProcess:
+        """
+        Run an AppleScript via the helper, falling back to an osascript launch
+        (macOS-only helpers below; delivery itself goes through self.backend)
+        
+        Args:
+            script: AppleScript source
+            args: Values passed to the script's `on run argv` handler
+            
+        Returns:
+            CompletedProcess with returncode, stdout and stderr
+        """
+        return run_applescript(self.helper, script, *args)
+    
+    def close(self):
+        """Stop the prefocus worker, the frontmost tracker and the backend (and its helper), saving learned data"""
+        if self._shares_tracker:
+            # Other automations may still read the shared tracker; only stop querying our backend
+            self.frontmost_tracker.detach(self.backend.frontmost)
+        else:
+            self.frontmost_tracker.stop()
+        if self._focus_executor is not None:
+            self._focus_executor.shutdown(wait=False)
+            self._focus_executor = None
+        self.readiness.close()
+        self.profiles.close()
+        self.backend.close()
+        if self.helper is not None:
+            self.helper.close()
+        
+    @contextmanager
+    def tracking_frontmost(self):
+        """Poll the frontmost app in the background for a block (a recording or a delivery)"""
+        if not self._poll_frontmost:
+            yield
+            return
+        with self.frontmost_tracker.held():
+            yield
+        
+    def is_frontmost(self, app_name: str) -> bool:
+        """
+        Quietly check whether an application is frontmost (used for readiness polling)
+        
+        Args:
+            app_name: Application name
+            
+        Returns:
+            True if the application is frontmost
+        """
+        return self.backend.is_frontmost(app_name)
+    
+    def read_clipboard(self) -> Optional[str]:
+        """
+        Read the clipboard text
+        
+        Returns:
+            Clipboard text, or None if it could not be read
+        """
+        return self.backend.get_clipboard()
+    
+    def wait_for_focus(self, app_name: str) -> bool:
+        """
+        Wait until an application is frontmost, within its learned budget
+        
+        Args:
+            app_name: Application name
+            
+        Returns:
+            True if the application became frontmost before the deadline
+        """
+        budget = self.readiness.budget(app_name, "focus", DEFAULT_FOCUS_BUDGET)
+        waited = wait_until(lambda: self.is_frontmost(app_name), budget)
+        self.readiness.record(app_name, "focus", waited)
+        if waited is None:
+            log.warning("⚠️ %s not frontmost after %.2fs", app_name, budget)
+            return False
+        log.debug("✅ %s frontmost after %.0fms", app_name, waited * 1000)
+        return True
+    
+    def wait_for_clipboard(self, text: str, app_name: str = "") -> bool:
+        """
+        Wait until the clipboard holds the given text
+        
+        Args:
+            text: Expected clipboard text
+            app_name: Application the paste is for (readiness is tracked per app)
+            
+        Returns:
+            True if the clipboard matched before the deadline
+        """
+        key = app_name or "active"
+        budget = self.readiness.budget(key, "clipboard", DEFAULT_CLIPBOARD_BUDGET)
+        waited = wait_until(lambda: self.read_clipboard() == text, budget)
+        self.readiness.record(key, "clipboard", waited)
+        if waited is None:
+            log.warning("⚠️ Clipboard not updated after %.2fs", budget)
+            return False
+        return True
+    
     def _setup_macos_compatibility(self):
         """Setup macOS compatibility for packaged app"""
         try:
@@ -30,13 +195,13 @@ class TextInputAutomation:
             
             # Check if we're on the main thread
             if AppKit.NSThread.isMainThread():
-                print("✅ TextInputAutomation initialized on main thread")
+                log.debug("✅ TextInputAutomation initialized on main thread")
             else:
-                print("⚠️ TextInputAutomation not on main thread - some operations may fail")
+                log.warning("⚠️ TextInputAutomation not on main thread - some operations may fail")
                 
             self.macos_available = True
         except Exception as e:
-            print(f"⚠️ macOS compatibility setup failed: {e}")
+            log.warning("⚠️ macOS compatibility setup failed: %s", e)
             self.macos_available = False
         
     def copy_to_clipboard(self, text: str, method: str = "applescript") -> bool:
@@ -58,10 +223,10 @@ class TextInputAutomation:
             elif method == "pyautogui":
                 return self._copy_to_clipboard_pyautogui(text)
             else:
-                print(f"Unknown clipboard method: {method}")
+                log.error("❌ Unknown clipboard method: %s", method)
                 return False
         except Exception as e:
-            print(f"Error copying to clipboard with {method}: {e}")
+            log.error("❌ Error copying to clipboard with %s: %s", method, e)
             return False
     
     def _copy_to_clipboard_applescript(self, text: str) -> bool:
@@ -74,18 +239,17 @@ class TextInputAutomation:
             set the clipboard to "{escaped_text}"
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self._run_osascript(script)
             
             if result.returncode == 0:
-                print(f"✅ Copied to clipboard via AppleScript: '{text[:50]}...'")
+                log.debug("✅ Copied to clipboard via AppleScript: %r...", text[:50])
                 return True
             else:
-                print(f"❌ AppleScript clipboard error: {result.stderr}")
+                log.error("❌ AppleScript clipboard error: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            print(f"❌ AppleScript clipboard error: {e}")
+            log.error("❌ AppleScript clipboard error: %s", e)
             return False
     
     def _copy_to_clipboard_pbcopy(self, text: str) -> bool:
@@ -95,14 +259,14 @@ class TextInputAutomation:
                                   capture_output=True)
             
             if result.returncode == 0:
-                print(f"✅ Copied to clipboard via pbcopy: '{text[:50]}...'")
+                log.debug("✅ Copied to clipboard via pbcopy: %r...", text[:50])
                 return True
             else:
-                print(f"❌ pbcopy error: {result.stderr}")
+                log.error("❌ pbcopy error: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            print(f"❌ pbcopy error: {e}")
+            log.error("❌ pbcopy error: %s", e)
             return False
     
     def _copy_to_clipboard_pyautogui(self, text: str) -> bool:
@@ -110,13 +274,13 @@ class TextInputAutomation:
         try:
             import pyautogui
             pyautogui.write(text)
-            print(f"✅ Copied to clipboard via PyAutoGUI: '{text[:50]}...'")
+            log.debug("✅ Copied to clipboard via PyAutoGUI: %r...", text[:50])
             return True
         except ImportError:
-            print("❌ PyAutoGUI not installed")
+            log.error("❌ PyAutoGUI not installed")
             return False
         except Exception as e:
-            print(f"❌ PyAutoGUI clipboard error: {e}")
+            log.error("❌ PyAutoGUI clipboard error: %s", e)
             return False
     
     def paste_from_clipboard(self, method: str = "applescript") -> bool:
@@ -137,10 +301,10 @@ class TextInputAutomation:
             elif method == "keyboard":
                 return self._paste_from_clipboard_keyboard()
             else:
-                print(f"Unknown paste method: {method}")
+                log.error("❌ Unknown paste method: %s", method)
                 return False
         except Exception as e:
-            print(f"Error pasting from clipboard with {method}: {e}")
+            log.error("❌ Error pasting from clipboard with %s: %s", method, e)
             return False
     
     def _paste_from_clipboard_applescript(self) -> bool:
@@ -152,18 +316,17 @@ class TextInputAutomation:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self._run_osascript(script)
             
             if result.returncode == 0:
-                print("✅ Pasted from clipboard via AppleScript")
+                log.debug("✅ Pasted from clipboard via AppleScript")
                 return True
             else:
-                print(f"❌ AppleScript paste error: {result.stderr}")
+                log.error("❌ AppleScript paste error: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            print(f"❌ AppleScript paste error: {e}")
+            log.error("❌ AppleScript paste error: %s", e)
             return False
     
     def _paste_from_clipboard_pyautogui(self) -> bool:
@@ -171,13 +334,13 @@ class TextInputAutomation:
         try:
             import pyautogui
             pyautogui.hotkey('cmd', 'v')
-            print("✅ Pasted from clipboard via PyAutoGUI")
+            log.debug("✅ Pasted from clipboard via PyAutoGUI")
             return True
         except ImportError:
-            print("❌ PyAutoGUI not installed")
+            log.error("❌ PyAutoGUI not installed")
             return False
         except Exception as e:
-            print(f"❌ PyAutoGUI paste error: {e}")
+            log.error("❌ PyAutoGUI paste error: %s", e)
             return False
     
     def _paste_from_clipboard_keyboard(self) -> bool:
@@ -185,13 +348,13 @@ class TextInputAutomation:
         try:
             import keyboard
             keyboard.press_and_release('cmd+v')
-            print("✅ Pasted from clipboard via keyboard")
+            log.debug("✅ Pasted from clipboard via keyboard")
             return True
         except ImportError:
-            print("❌ keyboard module not installed")
+            log.error("❌ keyboard module not installed")
             return False
         except Exception as e:
-            print(f"❌ keyboard paste error: {e}")
+            log.error("❌ keyboard paste error: %s", e)
             return False
     
     def input_text_direct(self, text: str, method: str = "applescript") -> bool:
@@ -213,50 +376,28 @@ class TextInputAutomation:
             elif method == "keyboard":
                 return self._input_text_keyboard(text)
             else:
-                print(f"Unknown input method: {method}")
+                log.error("❌ Unknown input method: %s", method)
                 return False
         except Exception as e:
-            print(f"Error inputting text with {method}: {e}")
+            log.error("❌ Error inputting text with %s: %s", method, e)
             return False
     
     def _input_text_applescript(self, text: str) -> bool:
-        """Input text using AppleScript"""
-        try:
-            # Escape quotes and special characters
-            escaped_text = text.replace('"', '\\"').replace("'", "\\'")
-            
-            script = f'''
-            tell application "System Events"
-                keystroke "{escaped_text}"
-            end tell
-            '''
-            
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"✅ Input text via AppleScript: '{text[:50]}...'")
-                return True
-            else:
-                print(f"❌ AppleScript input error: {result.stderr}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ AppleScript input error: {e}")
-            return False
+        """Input text using AppleScript (chunked and rate limited)"""
+        return self.type_text_chunked(text)
     
     def _input_text_pyautogui(self, text: str) -> bool:
         """Input text using PyAutoGUI"""
         try:
             import pyautogui
             pyautogui.write(text)
-            print(f"✅ Input text via PyAutoGUI: '{text[:50]}...'")
+            log.debug("✅ Input text via PyAutoGUI: %r...", text[:50])
             return True
         except ImportError:
-            print("❌ PyAutoGUI not installed")
+            log.error("❌ PyAutoGUI not installed")
             return False
         except Exception as e:
-            print(f"❌ PyAutoGUI input error: {e}")
+            log.error("❌ PyAutoGUI input error: %s", e)
             return False
     
     def _input_text_keyboard(self, text: str) -> bool:
@@ -264,117 +405,115 @@ class TextInputAutomation:
         try:
             import keyboard
             keyboard.write(text)
-            print(f"✅ Input text via keyboard: '{text[:50]}...'")
+            log.debug("✅ Input text via keyboard: %r...", text[:50])
             return True
         except ImportError:
-            print("❌ keyboard module not installed")
+            log.error("❌ keyboard module not installed")
             return False
         except Exception as e:
-            print(f"❌ keyboard input error: {e}")
+            log.error("❌ keyboard input error: %s", e)
             return False
     
-    def focus_cursor(self) -> bool:
+    def type_text_chunked(self, text: str, chunk_size: int = 32, chars_per_second: float = 200.0) -> bool:
         """
-        Focus on Cursor application
+        Type text in chunks, pacing them so the target keeps up
         
+        Args:
+            text: Text to type
+            chunk_size: Characters sent per keystroke call
+            chars_per_second: Typing rate limit
+            
         Returns:
-            True if successful, False otherwise
+            True if every chunk was typed, False otherwise
         """
-        try:
-            script = '''
-            tell application "Cursor"
-                activate
-            end tell
-            '''
+        started = time.monotonic()
+        for offset in range(0, len(text), chunk_size):
+            chunk = text[offset:offset + chunk_size]
+            try:
+                typed_ok = self.backend.type_text(chunk)
+            except Exception as e:
+                log.error("❌ Chunked typing error: %s", e)
+                return False
+            if not typed_ok:
+                log.error("❌ Chunked typing failed after %s chars", offset)
+                return False
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            # Stay at or under the rate limit
+            typed = offset + len(chunk)
+            ahead = typed / chars_per_second - (time.monotonic() - started)
+            if ahead > 0 and typed < len(text):
+                time.sleep(ahead)
+        
+        log.debug("✅ Typed %s chars in %s chunks", len(text), -(-len(text) // chunk_size))
+        return True
+    
+    def delete_backward(self, count: int) -> bool:
+        """
+        Press backspace a number of times in the frontmost app
+        
+        Args:
+            count: Characters to delete
             
-            if result.returncode == 0:
-                print("✅ Focused on Cursor")
-                return True
-            else:
-                print(f"❌ Error focusing Cursor: {result.stderr}")
-                return False
-                
+        Returns:
+            True if successful, False otherwise
+        """
+        if count <= 0:
+            return True
+        try:
+            return self.backend.delete_backward(count)
         except Exception as e:
-            print(f"❌ Error focusing Cursor: {e}")
+            log.error("❌ Backspace error: %s", e)
             return False
     
-    def focus_qoder(self) -> bool:
+    def live_typer(self) -> LiveTyper:
+        """
+        Start a live-typing session for streaming partial transcripts
+        
+        Returns:
+            LiveTyper that types each new hypothesis as a minimal edit into the frontmost app
+        """
+        return LiveTyper(self)
+    
+    def focus_application(self, app_name: str) -> bool:
         """
-        Focus on Qoder IDE application
+        Bring an application to the front by name
         
+        Args:
+            app_name: Application name
+            
         Returns:
             True if successful, False otherwise
         """
         try:
-            script = '''
-            tell application "Qoder"
-                activate
-            end tell
-            '''
-            
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print("✅ Focused on Qoder")
+            if self.backend.focus(app_name):
+                log.debug("✅ Focused on %s", app_name)
                 return True
-            else:
-                print(f"❌ Error focusing Qoder: {result.stderr}")
-                return False
+            return False
                 
         except Exception as e:
-            print(f"❌ Error focusing Qoder: {e}")
+            log.error("❌ Error focusing %s: %s", app_name, e)
             return False
     
+    def focus_cursor(self) -> bool:
+        """Focus on Cursor application"""
+        return self.focus_application(TARGET_APPLICATIONS["cursor"])
+    
+    def focus_qoder(self) -> bool:
+        """Focus on Qoder IDE application"""
+        return self.focus_application(TARGET_APPLICATIONS["qoder"])
+    
     def get_frontmost_app(self) -> str:
         """
         Get the name of the frontmost (active) application
         
         Returns:
-            Name of frontmost application, or 'unknown' if unable to determine
+            Lowercased name of frontmost application, or 'unknown' if unable to determine
         """
-        try:
-            script = '''
-            tell application "System Events"
-                name of first application process whose frontmost is true
-            end tell
-            '''
-            
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                app_name = result.stdout.strip()
-                app_name_lower = app_name.lower()
-                print(f"📱 Raw frontmost app name: '{app_name}'")
-                print(f"📱 Normalized app name: '{app_name_lower}'")
-                
-                # Additional debug info - get process details
-                try:
-                    detail_script = '''
-                    tell application "System Events"
-                        set frontApp to first application process whose frontmost is true
-                        return {name of frontApp, bundle identifier of frontApp}
-                    end tell
-                    '''
-                    detail_result = subprocess.run(['osascript', '-e', detail_script], 
-                                                 capture_output=True, text=True)
-                    if detail_result.returncode == 0:
-                        print(f"📱 App details: {detail_result.stdout.strip()}")
-                except:
-                    pass  # Details are optional
-                    
-                return app_name_lower
-            else:
-                print(f"❌ Error getting frontmost app: {result.stderr}")
-                return "unknown"
-                
-        except Exception as e:
-            print(f"❌ Error getting frontmost app: {e}")
+        app = self.frontmost_tracker.current()
+        if app is None:
             return "unknown"
+        log.debug("📱 Frontmost app: %s (%s)", app.name, app.bundle_id)
+        return app.name.lower()
     
     def auto_detect_target(self) -> str:
         """
@@ -383,39 +522,14 @@ class TextInputAutomation:
         Returns:
             Suggested target app name
         """
-        print("🔍 === AUTO-DETECTION DEBUG INFO ===")
         frontmost = self.get_frontmost_app()
-        print(f"📱 Raw frontmost app detected: '{frontmost}'")
-        
-        # Map common application names to our target names
-        app_mapping = {
-            "cursor": "cursor",
-            "qoder": "qoder", 
-            "qoder ide": "qoder",
-            "electron": "qoder",  # Qoder runs on Electron
-            "visual studio code": "vscode",
-            "code": "vscode",
-            "pycharm": "pycharm",
-            "safari": "safari",
-            "google chrome": "chrome",
-            "chrome": "chrome",
-            "terminal": "terminal",
-            "iterm2": "terminal",
-            "notes": "notes",
-            "textedit": "notes"
-        }
-        
-        print(f"🗺️ Available app mappings: {list(app_mapping.keys())}")
-        
-        for app_key, target_name in app_mapping.items():
-            if app_key in frontmost:
-                print(f"✅ MATCH FOUND: '{app_key}' in '{frontmost}' → target: '{target_name}'")
-                print(f"🎯 Auto-detected target: {target_name}")
-                return target_name
-        
-        print(f"⚠️ NO MATCH: Unknown app '{frontmost}', using 'active' as fallback")
-        print(f"💡 To add support, add '{frontmost}' to app_mapping dictionary")
-        return "active"
+        target_name = target_for_app(frontmost)
+        if target_name == "active":
+            log.info("⚠️ NO MATCH: Unknown app '%s', using 'active' as fallback", frontmost)
+            log.debug("💡 To add support, add '%s' to APP_TARGETS in frontmost_tracker.py", frontmost)
+        else:
+            log.debug("🎯 Auto-detected target: '%s' → %s", frontmost, target_name)
+        return target_name
     
     def focus_active_app(self) -> bool:
         """
@@ -432,18 +546,17 @@ class TextInputAutomation:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self._run_osascript(script)
             
             if result.returncode == 0:
-                print("✅ Focused on active app")
+                log.debug("✅ Focused on active app")
                 return True
             else:
-                print(f"❌ Error focusing active app: {result.stderr}")
+                log.error("❌ Error focusing active app: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error focusing active app: {e}")
+            log.error("❌ Error focusing active app: %s", e)
             return False
         """
         Focus on the currently active application
@@ -458,158 +571,293 @@ class TextInputAutomation:
             end tell
             '''
             
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
+            result = self._run_osascript(script)
             
             if result.returncode == 0:
-                print("✅ Focused on active application")
+                log.debug("✅ Focused on active application")
                 return True
             else:
-                print(f"❌ Error focusing active app: {result.stderr}")
+                log.error("❌ Error focusing active app: %s", result.stderr)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error focusing active app: {e}")
+            log.error("❌ Error focusing active app: %s", e)
+            return False
+    
+    def resolve_application_name(self, target_app: str) -> str:
+        """
+        Map a target setting to the application name to activate
+        
+        Returns:
+            Application name, or "" for the currently active app
+        """
+        key = target_app.lower()
+        if key == "active":
+            return ""
+        return TARGET_APPLICATIONS.get(key, target_app)
+    
+    def prefocus(self, target_app: str) -> bool:
+        """
+        Bring the target to the front ahead of delivery
+        
+        Skips activation entirely when the target is still frontmost.
+        
+        Args:
+            target_app: Target key or application name
+            
+        Returns:
+            True if the target is frontmost (or "active"), False otherwise
+        """
+        if target_app.lower() == "auto-detect":
+            # The target is only known at delivery time
+            return False
+        app_name = self.resolve_application_name(target_app)
+        if not app_name:
+            return True
+        
+        if self.is_frontmost(app_name):
+            # Nothing was activated or awaited, so there is no focus latency to record
+            log.debug("✅ %s still frontmost, skipping focus", app_name)
+            return True
+        
+        if not self.focus_application(app_name):
             return False
+        return self.wait_for_focus(app_name)
+    
+    def prefocus_async(self, target_app: str) -> Future:
+        """
+        Start focusing the target in the background (e.g. while transcription decodes)
+        
+        Args:
+            target_app: Target key or application name
+            
+        Returns:
+            Future resolving to the prefocus() result
+        """
+        if self._focus_executor is None:
+            self._focus_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefocus")
+        return self._focus_executor.submit(in_current_take(take_timing.timed("prefocus", self.prefocus)), target_app)
+    
+    def deliver_text(self, text: str, target_app: str = "active", focused: bool = False,
+                     profile: Optional[DeliveryProfile] = None) -> bool:
+        """
+        Focus the target, set the clipboard and paste (one script run on macOS)
+        
+        Wait budgets come from the profile or the app's readiness history; the
+        waits the script observed are recorded back into the history.
+        
+        Args:
+            text: Text to insert
+            target_app: Target key or application name ("active" pastes into the frontmost app)
+            focused: The target was already brought to the front; skip activation
+            profile: Delivery profile supplying the wait budget and paste keystroke
+            
+        Returns:
+            True if every step succeeded, False otherwise
+        """
+        key = self.resolve_application_name(target_app) or "active"
+        app_name = "" if focused else self.resolve_application_name(target_app)
+        focus_budget = self.readiness.budget(key, "focus", DEFAULT_FOCUS_BUDGET)
+        if profile is not None and profile.wait_budget is not None:
+            focus_budget = profile.wait_budget
+        clipboard_budget = self.readiness.budget(key, "clipboard", DEFAULT_CLIPBOARD_BUDGET)
+        try:
+            with take_timing.stage("delivery_script"):
+                outcome = self.backend.deliver(text, app_name, focus_budget, clipboard_budget,
+                                               profile.paste_keystroke if profile else "command+v")
+        except DeliveryInterrupted:
+            raise  # The paste may have happened: no step-by-step retry
+        except Exception as e:
+            log.error("❌ Single-script delivery error: %s", e)
+            return False
+        if outcome is None:
+            return False
+        
+        frontmost, focus_ms, clipboard_ms = outcome
+        if app_name and focus_ms is not False:
+            self.readiness.record(key, "focus", focus_ms)
+            if focus_ms is not None:
+                take_timing.report("script_focus_wait", focus_ms * 1000)
+        if clipboard_ms is not False:
+            self.readiness.record(key, "clipboard", clipboard_ms)
+            if clipboard_ms is not None:
+                take_timing.report("script_clipboard_wait", clipboard_ms * 1000)
+        log.debug("✅ Delivered text via %s (frontmost: '%s')", self.backend.name, frontmost)
+        return True
+    
+    def profile_for(self, target_app: str) -> Optional[DeliveryProfile]:
+        """
+        Delivery profile for a target
+        
+        Args:
+            target_app: Target key or application name ("active" uses the tracked frontmost app)
+            
+        Returns:
+            The app's profile, or None if the app is unknown
+        """
+        app_name = self.resolve_application_name(target_app)
+        known = self.frontmost_tracker.peek()
+        if not app_name:
+            if known is None:
+                return None
+            app_name = known.name
+        bundle_id = known.bundle_id if known is not None and known.name.lower() == app_name.lower() else ""
+        return self.profiles.get(app_name, bundle_id)
     
     def auto_input_text(self, text: str, target_app: str = "cursor", 
-                       method: str = "clipboard") -> bool:
+                       method: str = "auto", focused: bool = False) -> bool:
         """
         Automatically input text into the target application
         
         Args:
             text: Text to input
             target_app: Target application ("auto-detect", "cursor", "qoder", "active", or app name)
-            method: Input method ("clipboard", "direct")
+            method: Input method ("auto" uses the app's delivery profile, "clipboard", "direct")
+            focused: The target is already frontmost (see prefocus); only the input remains
             
         Returns:
             True if successful, False otherwise
         """
-        print(f"🎯 === AUTO-INPUT DEBUG INFO ===")
-        print(f"📝 Text to input: '{text[:50]}...'")
-        print(f"🎯 Initial target app setting: '{target_app}'")
-        print(f"⌨️ Input method: '{method}'")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🎯 Auto-input: %r... → target '%s', method '%s'", text[:50], target_app, method)
         
-        try:
-            # Handle auto-detection
-            if target_app.lower() == "auto-detect":
-                print("🔍 Running auto-detection...")
-                original_target = target_app
-                target_app = self.auto_detect_target()
-                print(f"🤖 Auto-detection result: '{original_target}' → '{target_app}'")
-            else:
-                print(f"🎯 Using manually specified target: '{target_app}'")
-            
-            # Focus on target application
-            print(f"🎯 Attempting to focus on target app: '{target_app}'")
-            
-            if target_app.lower() == "cursor":
-                print("📱 Focusing on Cursor...")
-                if not self.focus_cursor():
-                    print("⚠️ Could not focus Cursor, trying active app")
-                    self.focus_active_app()
-            elif target_app.lower() == "qoder":
-                print("📱 Focusing on Qoder...")
-                if not self.focus_qoder():
-                    print("⚠️ Could not focus Qoder, trying active app")
-                    self.focus_active_app()
-            elif target_app.lower() == "active":
-                print("📱 Focusing on currently active app...")
-                self.focus_active_app()
-            else:
-                # Focus specific application
-                print(f"📱 Focusing on specific app: '{target_app}'")
-                script = f'''
-                tell application "{target_app}"
-                    activate
-                end tell
-                '''
-                result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✅ Successfully focused on {target_app}")
-                else:
-                    print(f"❌ Failed to focus on {target_app}: {result.stderr}")
-            
-            # Wait a moment for app to focus
-            print("⏳ Waiting for app to focus...")
-            time.sleep(0.3)  # Increased wait time for Electron apps
-            
-            # Verify which app is now focused
-            current_focus = self.get_frontmost_app()
-            print(f"📱 App focus verification: '{current_focus}'")
-            
-            # Input the text using specified method
-            print(f"⌨️ Using input method: '{method}'")
-            if method.lower() == "clipboard":
-                print("📋 Using clipboard method...")
-                # Copy to clipboard first
-                if not self.copy_to_clipboard(text):
-                    print("❌ Failed to copy to clipboard")
-                    return False
-                
-                # Wait for clipboard to update
-                print("⏳ Waiting for clipboard to update...")
-                time.sleep(0.2)
-                
-                # Paste with improved method
-                print("📋 Attempting to paste...")
-                return self.paste_with_retry()
+        with self.tracking_frontmost():
+            try:
+                # Handle auto-detection
+                if target_app.lower() == "auto-detect":
+                    target_app = self.auto_detect_target()
+                    log.debug("🤖 Auto-detection result: 'auto-detect' → '%s'", target_app)
+            
+                profile = self.profile_for(target_app)
+                if method.lower() == "auto":
+                    method = self.profiles.choose_method(profile, text) if profile else "clipboard"
+                    log.debug("📈 Profile input method: '%s'", method)
+            
+                started = time.monotonic()
+                try:
+                    success = self._input_text(text, target_app, method.lower(), focused, profile)
+                except DeliveryInterrupted as e:
+                    log.error("❌ %s; not retrying so the text is not inserted twice", e)
+                    success = False
+                elapsed_ms = (time.monotonic() - started) * 1000
+                if profile is not None and method.lower() in INPUT_METHODS:
+                    self.profiles.record(profile, method.lower(), success, elapsed_ms, len(text))
+            
+                report = DeliveryReport(profile.app_name if profile else "", method.lower(),
+                                        len(text), elapsed_ms, success, current_take.get())
+                self.last_report = report
+                if success:
+                    take_timing.event("delivered")
+                log.info("📊 %s", report,
+                         extra={"fields": {"event": "delivery", "app": report.app, "method": report.method,
+                                           "chars": report.chars, "delivery_ms": report.elapsed_ms,
+                                           "success": report.success}})
+                return success
                 
-            elif method.lower() == "direct":
-                print("⌨️ Using direct keyboard input...")
-                # Direct keyboard input
-                return self._input_text_keyboard(text)
+            except Exception as e:
+                log.error("❌ Error in auto_input_text: %s", e, exc_info=True)
+                return False
+    
+    def _input_text(self, text: str, target_app: str, method: str, focused: bool,
+                    profile: Optional[DeliveryProfile]) -> bool:
+        """Focus the target as its profile says and input the text with one method"""
+        focus_strategy = profile.focus_strategy if profile else "activate"
+        paste_keystroke = profile.paste_keystroke if profile else "command+v"
+        if focus_strategy == "none":
+            focused = True
+        
+        # Fast path: focus, clipboard and paste in one process spawn
+        if method == "clipboard":
+            if self.deliver_text(text, target_app, focused=focused, profile=profile):
+                return True
+            log.warning("⚠️ Single-script delivery failed, falling back to step-by-step input")
+        
+        app_name = self.resolve_application_name(target_app)
+        if focused:
+            log.debug("✅ Target '%s' already focused, skipping focus step", target_app)
+        elif not app_name:
+            log.debug("📱 Inputting into the currently active app")
+        else:
+            log.debug("📱 Focusing on '%s'...", app_name)
+            with take_timing.stage("focus"):
+                activated = self.focus_application(app_name)
+            if not activated:
+                log.warning("⚠️ Could not focus %s, inputting into the active app", app_name)
             else:
-                print(f"❌ Unknown input method: {method}")
+                # Wait until the app is actually frontmost instead of a fixed sleep
+                log.debug("⏳ Waiting for app to focus...")
+                with take_timing.stage("focus_wait"):
+                    self.wait_for_focus(app_name)
+        
+        # Input the text using specified method
+        log.debug("⌨️ Using input method: '%s'", method)
+        if method == "clipboard":
+            log.debug("📋 Using clipboard method...")
+            # Copy to clipboard first
+            with take_timing.stage("clipboard"):
+                copied = self.backend.set_clipboard(text)
+            if not copied:
+                log.error("❌ Failed to copy to clipboard")
                 return False
-                
-        except Exception as e:
-            print(f"❌ Error in auto_input_text: {e}")
+            
+            # Wait for clipboard to update
+            log.debug("⏳ Waiting for clipboard to update...")
+            with take_timing.stage("clipboard_wait"):
+                self.wait_for_clipboard(text, app_name)
+            
+            # Paste with improved method
+            log.debug("📋 Attempting to paste...")
+            with take_timing.stage("paste"):
+                return self.paste_with_retry(paste_keystroke=paste_keystroke)
+            
+        elif method == "direct":
+            log.debug("⌨️ Using direct keyboard input...")
+            # Chunked, rate-limited typing so long text does not drop characters
+            with take_timing.stage("typing"):
+                return self.type_text_chunked(text)
+        else:
+            log.error("❌ Unknown input method: %s", method)
             return False
             
-    def paste_with_retry(self, retries=3) -> bool:
+    def paste_with_retry(self, retries=3, backoff=0.05, paste_keystroke="command+v") -> bool:
         """
         Paste from clipboard with retry logic for better reliability
         
         Args:
             retries: Number of retry attempts
+            backoff: Pause before the first retry; doubled for each further retry
+            paste_keystroke: Paste shortcut, e.g. "command+v" or "command+shift+v"
             
         Returns:
             True if successful, False otherwise
         """
         for attempt in range(retries):
             try:
-                # Method 1: AppleScript paste (most reliable)
-                script = '''
-                tell application "System Events"
-                    keystroke "v" using command down
-                end tell
-                '''
-                
-                result = subprocess.run(['osascript', '-e', script], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print(f"✅ Pasted from clipboard (attempt {attempt + 1})")
+                # Method 1: backend paste shortcut (most reliable)
+                if self.backend.paste(paste_keystroke):
+                    log.debug("✅ Pasted from clipboard (attempt %s)", attempt + 1)
                     return True
                 else:
-                    print(f"⚠️ Paste attempt {attempt + 1} failed: {result.stderr}")
+                    log.warning("⚠️ Paste attempt %s failed", attempt + 1)
                     
+            except DeliveryInterrupted:
+                raise
             except Exception as e:
-                print(f"⚠️ Paste attempt {attempt + 1} error: {e}")
+                log.warning("⚠️ Paste attempt %s error: %s", attempt + 1, e)
             
-            # Wait before retry
+            # Back off before retry
             if attempt < retries - 1:
-                time.sleep(0.5)
+                time.sleep(backoff * (2 ** attempt))
         
         # If all AppleScript attempts fail, try direct keyboard input
         try:
             import pyautogui
-            pyautogui.hotkey('cmd', 'v')
-            print("✅ Pasted using pyautogui fallback")
+            key, modifiers = split_keystroke(paste_keystroke)
+            pyautogui.hotkey(*[PYAUTOGUI_MODIFIERS.get(m, m) for m in modifiers], key)
+            log.debug("✅ Pasted using pyautogui fallback")
             return True
         except Exception as e:
-            print(f"❌ All paste methods failed: {e}")
+            log.error("❌ All paste methods failed: %s", e)
             return False
     
     def test_automation(self) -> bool:
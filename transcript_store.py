@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Transcript Store for metaVoice
+Persists every transcription to a local SQLite database with a full-text
+index so the History panel can page and search months of dictation lazily
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app_paths import get_data_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcriptions (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    text TEXT NOT NULL,
+    target_app TEXT,
+    model TEXT,
+    latency_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_created_at ON transcriptions(created_at);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS transcriptions_fts USING fts5(
+    text, content='transcriptions', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS transcriptions_ai AFTER INSERT ON transcriptions BEGIN
+    INSERT INTO transcriptions_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS transcriptions_ad AFTER DELETE ON transcriptions BEGIN
+    INSERT INTO transcriptions_fts(transcriptions_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class TranscriptRecord:
+    """One stored transcription"""
+    id: int
+    created_at: float
+    text: str
+    target_app: Optional[str]
+    model: Optional[str]
+    latency_ms: Optional[float]
+
+    def format_line(self) -> str:
+        """Render the record for the History panel"""
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created_at))
+        details = [d for d in (self.target_app, f"{self.latency_ms:.0f} ms" if self.latency_ms else None) if d]
+        suffix = f"  ({', '.join(details)})" if details else ""
+        return f"[{stamp}] {self.text}{suffix}"
+
+
+class TranscriptStore:
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the transcript database
+
+        Args:
+            db_path: SQLite file path (defaults to history.db in the app data dir)
+        """
+        self.db_path = db_path or os.path.join(get_data_dir(), "history.db")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            try:
+                self._conn.executescript(FTS_SCHEMA)
+                self.full_text = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5: fall back to LIKE scans
+                self.full_text = False
+
+    def add(self, text: str, target_app: Optional[str] = None, model: Optional[str] = None,
+            latency_ms: Optional[float] = None, created_at: Optional[float] = None) -> int:
+        """
+        Store a transcription
+
+        Returns:
+            Row id of the new record
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO transcriptions (created_at, text, target_app, model, latency_ms) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (created_at or time.time(), text, target_app, model, latency_ms)
+            )
+            return cursor.lastrowid
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Turn user input into an FTS5 prefix query ("foo ba" -> "foo"* "ba"*)"""
+        return " ".join(f'"{word}"*' for word in _WORD_PATTERN.findall(query))
+
+    def page(self, query: str = "", before_id: Optional[int] = None, limit: int = 50) -> List[TranscriptRecord]:
+        """
+        Fetch one page of records, newest first
+
+        Args:
+            query: Optional search text; every word must match (prefix match)
+            before_id: Return records older than this id (keyset pagination)
+            limit: Page size
+
+        Returns:
+            List of records
+        """
+        conditions = []
+        params: list = []
+
+        if query.strip():
+            if self.full_text:
+                fts_query = self._fts_query(query)
+                if fts_query:
+                    conditions.append("id IN (SELECT rowid FROM transcriptions_fts WHERE transcriptions_fts MATCH ?)")
+                    params.append(fts_query)
+            else:
+                for word in _WORD_PATTERN.findall(query):
+                    conditions.append("text LIKE ?")
+                    params.append(f"%{word}%")
+
+        if before_id is not None:
+            conditions.append("id < ?")
+            params.append(before_id)
+
+        sql = "SELECT id, created_at, text, target_app, model, latency_ms FROM transcriptions"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [TranscriptRecord(**dict(row)) for row in rows]
+
+    def count(self) -> int:
+        """Number of stored transcriptions"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0]
+
+    def clear(self):
+        """Delete every stored transcription"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transcriptions")
+            if self.full_text:
+                self._conn.execute("INSERT INTO transcriptions_fts(transcriptions_fts) VALUES ('delete-all')")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
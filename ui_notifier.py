@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+UI Wakeups for metaVoice
+Worker threads wake the Tk loop through a virtual event only when they post
+work, replacing fixed-interval queue polling
+"""
+
+import queue
+import threading
+import time
+import tkinter as tk
+from typing import Callable, Dict
+
+from session_trace import tracer
+
+WAKE_EVENT = "<<MetaVoiceWake>>"
+
+
+class NotifyingQueue(queue.Queue):
+    """Queue whose put() wakes the UI thread"""
+
+    def __init__(self, notify: Callable[[], None]):
+        super().__init__()
+        self.notify = notify
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self.notify()
+
+
+class UINotifier:
+    def __init__(self, root, drain: Callable[[], int], event: str = WAKE_EVENT):
+        """
+        Initialize UI wakeups
+
+        Args:
+            root: Tk root (or any widget) that receives the wake event
+            drain: Runs on the UI thread; processes queued work and returns how many items it handled
+            event: Virtual event name used for wakeups
+        """
+        self.root = root
+        self.drain = drain
+        self.event = event
+        self.queue = NotifyingQueue(self.notify)
+        self.notifications = 0
+        self.wakeups = 0
+        self.empty_wakeups = 0
+        self._pending = False
+        self._lock = threading.Lock()
+        root.bind(event, self._wake)
+        # Anything posted before the main loop started is picked up on its first idle pass
+        root.after_idle(self._wake)
+
+    def notify(self):
+        """Wake the UI thread (safe from any thread); bursts coalesce into one wakeup"""
+        with self._lock:
+            self.notifications += 1
+            if self._pending:
+                return
+            self._pending = True
+        try:
+            self.root.event_generate(self.event, when="tail")
+        except (RuntimeError, tk.TclError):
+            # Main loop not running (yet, or any more): the after_idle drain covers startup
+            with self._lock:
+                self._pending = False
+
+    def _wake(self, _event=None):
+        with self._lock:
+            self._pending = False
+        self.wakeups += 1
+        tracer.counter("ui_queue", depth=self.queue.qsize())
+        started = time.monotonic()
+        handled = self.drain()
+        tracer.complete("ui_drain", started, cat="ui", args={"handled": handled})
+        if not handled:
+            self.empty_wakeups += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Wakeup counters: notifications posted, wakeups run, and wakeups that found nothing"""
+        return {
+            "notifications": self.notifications,
+            "wakeups": self.wakeups,
+            "empty_wakeups": self.empty_wakeups
+        }
@@ -6,22 +6,34 @@ Provides easy-to-use functions for voice recognition in your desktop automation
 
 import subprocess
 import json
+import logging
 import tempfile
 import os
 import sys
+import time
 import wave
-import pyaudio
 from typing import Optional, Dict, Any
+from command_registry import CommandRegistry, build_default_registry
+from app_logging import get_logger
+import metrics
+import take_timing
+
+log = get_logger("whisper")
 
 class WhisperWrapper:
-    def __init__(self, whisper_path: str = None, model_path: str = None):
+    def __init__(self, whisper_path: str = None, model_path: str = None,
+                 command_registry: Optional[CommandRegistry] = None):
         """
         Initialize Whisper wrapper
         
         Args:
             whisper_path: Path to whisper-cli executable
             model_path: Path to the Whisper model
+            command_registry: Registry used by parse_command (defaults to built-in commands)
         """
+        # Compiled once; parse_command only scans the text
+        self.command_registry = command_registry or build_default_registry()
+        
         # Handle bundled app paths
         if whisper_path is None:
             if getattr(sys, 'frozen', False):
@@ -83,7 +95,8 @@ class WhisperWrapper:
             speed_mode: Speed mode ("fast", "balanced", "accurate")
             
         Returns:
-            Dictionary containing transcription results
+            Dictionary containing transcription results ("text", plus "segments"
+            with start/end seconds when whisper reports them)
         """
         if not os.path.exists(audio_file):
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
@@ -119,36 +132,64 @@ class WhisperWrapper:
             ]
             
             # Run transcription
+            log.debug("🧠 whisper command: %s", cmd)
+            started = time.monotonic()
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            finished = time.monotonic()
+            take_timing.add_stage("whisper_process", started, finished)
             
-            # Read output
-            if output_format == "json":
-                with open(output_file, 'r') as f:
-                    data = json.load(f)
-                    # Extract text from the JSON structure
-                    if isinstance(data, dict) and "transcription" in data:
-                        # New format with transcription array
-                        text_parts = []
-                        for segment in data["transcription"]:
-                            if "text" in segment:
-                                text_parts.append(segment["text"].strip())
-                        return {"text": " ".join(text_parts)}
-                    elif isinstance(data, dict) and "text" in data:
-                        # Direct text format
-                        return data
-                    else:
-                        # Fallback
-                        return {"text": str(data)}
-            else:
-                with open(output_file, 'r') as f:
-                    return {"text": f.read().strip()}
+            # whisper.cpp reports its own load/encode/decode split; the rest of the
+            # wall time is process spawn and teardown
+            whisper_ms = (finished - started) * 1000
+            phases = take_timing.parse_whisper_timings(result.stderr)
+            for phase, ms in phases.items():
+                take_timing.report(f"whisper_{phase}", ms)
+            if "total" in phases:
+                take_timing.report("whisper_spawn_overhead", whisper_ms - phases["total"])
+            log.info("🧠 Decoded in %.0fms (%s mode)", whisper_ms, speed_mode,
+                     extra={"fields": {"event": "decode", "whisper_ms": whisper_ms, "speed_mode": speed_mode,
+                                       **{f"whisper_{phase}_ms": ms for phase, ms in phases.items()}}})
+            
+            with take_timing.stage("json_parse"):
+                return self._read_output(output_file, output_format)
                     
         finally:
             # Clean up temporary file
             if os.path.exists(output_file):
                 os.unlink(output_file)
     
-    def transcribe_microphone(self, duration: int = 5, sample_rate: int = 16000, speed_mode: str = "balanced", stop_flag=None) -> str:
+    def _read_output(self, output_file: str, output_format: str) -> Dict[str, Any]:
+        """Parse whisper's output file into {"text", "segments"}"""
+        if output_format == "json":
+            with open(output_file, 'r') as f:
+                data = json.load(f)
+                # Extract text from the JSON structure
+                if isinstance(data, dict) and "transcription" in data:
+                    # New format with transcription array
+                    text_parts = []
+                    segments = []
+                    for segment in data["transcription"]:
+                        if "text" in segment:
+                            text_parts.append(segment["text"].strip())
+                            offsets = segment.get("offsets", {})
+                            segments.append({
+                                "start": offsets.get("from", 0) / 1000.0,
+                                "end": offsets.get("to", 0) / 1000.0,
+                                "text": segment["text"].strip()
+                            })
+                    return {"text": " ".join(text_parts), "segments": segments}
+                elif isinstance(data, dict) and "text" in data:
+                    # Direct text format
+                    return data
+                else:
+                    # Fallback
+                    return {"text": str(data)}
+        else:
+            with open(output_file, 'r') as f:
+                return {"text": f.read().strip()}
+    
+    def transcribe_microphone(self, duration: int = 5, sample_rate: int = 16000, speed_mode: str = "balanced", stop_flag=None,
+                              on_recording_finished=None) -> str:
         """
         Record from microphone and transcribe
         
@@ -157,6 +198,7 @@ class WhisperWrapper:
             sample_rate: Audio sample rate
             speed_mode: Speed mode ("fast", "balanced", "accurate")
             stop_flag: Function that returns True if recording should stop
+            on_recording_finished: Called once capture ends, before decoding starts
             
         Returns:
             Transcribed text
@@ -165,55 +207,83 @@ class WhisperWrapper:
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
             audio_file = tmp_file.name
         
+        cpu_started = metrics.process_cpu_seconds()
         try:
             # Record audio with stop flag
-            self._record_audio(audio_file, duration, sample_rate, stop_flag)
+            audio_seconds = self._record_audio(audio_file, duration, sample_rate, stop_flag)
+            
+            # Let callers overlap work (e.g. focusing the target) with decoding
+            if on_recording_finished:
+                try:
+                    on_recording_finished()
+                except Exception as e:
+                    log.warning("on_recording_finished callback failed: %s", e)
             
             # Check if file was created and has content
             if not os.path.exists(audio_file) or os.path.getsize(audio_file) == 0:
-                print("Warning: No audio was recorded")
+                log.warning("No audio was recorded")
                 return ""
             
             # Transcribe with speed mode
+            decode_started = time.monotonic()
             result = self.transcribe_audio_file(audio_file, speed_mode=speed_mode)
+            decode_seconds = time.monotonic() - decode_started
             
             if isinstance(result, dict) and "text" in result:
-                return result["text"]
+                text = result["text"]
             elif isinstance(result, list) and len(result) > 0:
-                return result[0].get("text", "")
+                text = result[0].get("text", "")
             else:
-                return str(result)
+                text = str(result)
+            
+            metrics.TAKES.inc()
+            if text and text.strip() != "[BLANK_AUDIO]":
+                metrics.WORDS.inc(len(text.split()))
+            if audio_seconds:
+                metrics.AUDIO_SECONDS.observe(audio_seconds)
+                metrics.DECODE_RTF.observe(decode_seconds / audio_seconds)
+            metrics.TAKE_CPU.observe(metrics.process_cpu_seconds() - cpu_started)
+            return text
                 
         except Exception as e:
-            print(f"Error in transcribe_microphone: {e}")
+            log.error("Error in transcribe_microphone: %s", e, exc_info=True)
             return ""
         finally:
             # Clean up temporary file
             if os.path.exists(audio_file):
                 os.unlink(audio_file)
     
-    def _record_audio(self, filename: str, duration: int, sample_rate: int, stop_flag=None):
-        """Record audio from microphone"""
+    def find_input_device(self, p) -> int:
+        """Pick the microphone device index for a PyAudio instance"""
+        for i in range(p.get_device_count()):
+            device_info = p.get_device_info_by_index(i)
+            if 'microphone' in device_info['name'].lower() or 'input' in device_info['name'].lower():
+                return i
+        
+        # Use default input device
+        return p.get_default_input_device_info()['index']
+    
+    def _record_audio(self, filename: str, duration: int, sample_rate: int, stop_flag=None) -> float:
+        """
+        Record audio from microphone
+        
+        Returns:
+            Seconds of audio written (0.0 if recording failed)
+        """
+        import pyaudio  # Deferred: loading PortAudio is not needed until the first recording
+        
         chunk = 1024
         format = pyaudio.paInt16
         channels = 1
         
+        opened = time.monotonic()
         p = pyaudio.PyAudio()
         
         try:
-            # Find the microphone device
-            mic_device = None
-            for i in range(p.get_device_count()):
-                device_info = p.get_device_info_by_index(i)
-                if 'microphone' in device_info['name'].lower() or 'input' in device_info['name'].lower():
-                    mic_device = i
-                    break
-            
-            if mic_device is None:
-                # Use default input device
-                mic_device = p.get_default_input_device_info()['index']
+            mic_device = self.find_input_device(p)
             
-            print(f"Using microphone device: {p.get_device_info_by_index(mic_device)['name']}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("🎙️ Using microphone device: %s", p.get_device_info_by_index(mic_device)['name'])
             
             stream = p.open(format=format,
                            channels=channels,
@@ -222,19 +292,25 @@ class WhisperWrapper:
                            input_device_index=mic_device,
                            frames_per_buffer=chunk)
             
-            print(f"Recording for {duration} seconds...")
+            log.debug("🎙️ Recording for up to %d seconds...", duration)
+            started = time.monotonic()
+            take_timing.add_stage("mic_open", opened, started)
             frames = []
             
             for i in range(0, int(sample_rate / chunk * duration)):
                 # Check if we should stop recording early
                 if stop_flag and stop_flag():
-                    print("Recording stopped early by user.")
+                    log.debug("🎙️ Recording stopped early by user")
                     break
                     
                 data = stream.read(chunk)
                 frames.append(data)
             
-            print("Recording finished.")
+            captured = time.monotonic()
+            take_timing.add_stage("capture", started, captured)
+            capture_ms = (captured - started) * 1000
+            log.info("🎙️ Captured %.1fs of audio", capture_ms / 1000,
+                     extra={"fields": {"event": "capture", "capture_ms": capture_ms, "chunks": len(frames)}})
             
             stream.stop_stream()
             stream.close()
@@ -245,9 +321,12 @@ class WhisperWrapper:
                 wf.setsampwidth(p.get_sample_size(format))
                 wf.setframerate(sample_rate)
                 wf.writeframes(b''.join(frames))
+            take_timing.add_stage("wav_write", captured)
+            return len(frames) * chunk / sample_rate
                 
         except Exception as e:
-            print(f"Error recording audio: {e}")
+            log.error("Error recording audio: %s", e)
+            return 0.0
         finally:
             p.terminate()
     
@@ -261,62 +340,7 @@ class WhisperWrapper:
         Returns:
             Dictionary with parsed command structure
         """
-        # Simple command parsing - can be enhanced with more sophisticated NLP
-        text = text.lower().strip()
-        
-        # Define command patterns
-        command_patterns = {
-            "build-app": {
-                "keywords": ["build", "create", "make", "new"],
-                "app_keywords": ["app", "application", "project"]
-            },
-            "record-meeting": {
-                "keywords": ["record", "start recording", "begin recording"],
-                "meeting_keywords": ["meeting", "call", "zoom", "teams"]
-            },
-            "analyze-meeting": {
-                "keywords": ["analyze", "transcribe", "summarize"],
-                "meeting_keywords": ["meeting", "recording", "call"]
-            },
-            "create-component": {
-                "keywords": ["create", "make", "build"],
-                "component_keywords": ["component", "button", "input", "form"]
-            }
-        }
-        
-        # Try to match commands
-        for command_type, patterns in command_patterns.items():
-            if any(keyword in text for keyword in patterns["keywords"]):
-                # Extract parameters (simple approach)
-                params = {}
-                
-                # Extract type if present
-                if "type:" in text:
-                    type_start = text.find("type:") + 5
-                    type_end = text.find(" ", type_start)
-                    if type_end == -1:
-                        type_end = len(text)
-                    params["type"] = text[type_start:type_end].strip()
-                
-                # Extract name if present
-                if "name:" in text:
-                    name_start = text.find("name:") + 5
-                    name_end = text.find(" ", name_start)
-                    if name_end == -1:
-                        name_end = len(text)
-                    params["name"] = text[name_start:name_end].strip()
-                
-                return {
-                    "command": command_type,
-                    "parameters": params,
-                    "original_text": text
-                }
-        
-        return {
-            "command": "unknown",
-            "parameters": {},
-            "original_text": text
-        }
+        return self.command_registry.parse(text)
 
 # Example usage
 if __name__ == "__main__":